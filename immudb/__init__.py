@@ -11,3 +11,4 @@
 # limitations under the License.
 
 from immudb.client import ImmudbClient
+from immudb.pool import ImmudbClientPool
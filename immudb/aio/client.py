@@ -0,0 +1,1463 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections import deque
+from io import BytesIO
+from typing import AsyncGenerator, Dict, List, Tuple, Union
+
+import ecdsa
+import grpc
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+from immudb import chunking, constants, datatypes, scanpartition
+import immudb.datatypesv2 as datatypesv2
+import immudb.dataconverter as dataconverter
+from immudb.aio.grpcutils import InterceptedStub
+from immudb.aio import sqlquery
+from immudb.aio import transaction
+from immudb.datatypes import DeleteKeysRequest
+from immudb.embedded import store
+from immudb.embedded.store import KVMetadata
+from immudb.exceptions import ErrCorruptedData
+from immudb.grpc import schema_pb2
+from immudb.handler import (batchSet, execAll, verifiedGet, verifiedSet, verifiedreference,
+                            verifiedzadd, verifiedSQLGet, sqlexec, verifiedBatchGet, verifiedStreamGet,
+                            verifiedTxStream)
+from immudb.handler.verifiedtxbyid import verify as verifyTransaction
+from immudb.rootService import RootService, State, _AdvanceOnlyRootService
+from immudb.verifiedcache import VerifiedTxCache
+from immudb.columnar import ColumnarResult
+from immudb.streamsutils import (AtTXHeader, KeyHeader, ScoreHeader, SetHeader, StreamReader,
+                                 AsyncBufferedStreamReader, VerifiedGetStreamReader,
+                                 ZScanStreamReader, makeSetStream, makeVerifiableSetStream,
+                                 makeExecAllStream)
+from immudb.typeconv import MetadataToProto, sqlvalue_to_py
+
+
+class _CurrentStateService:
+    """Synchronous stand-in for the service handed to RootService.init,
+    answering CurrentState with a state already fetched by the client"""
+
+    def __init__(self, state):
+        self._state = state
+
+    def CurrentState(self, request):
+        return self._state
+
+
+async def _next(chunks):
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+class AsyncImmudbClient:
+
+    def __init__(self, immudUrl=None, rs: RootService = None, publicKeyFile: str = None, timeout=None, max_grpc_message_length=None, verifiedCacheSize: int = 1024, verifiedCache: VerifiedTxCache = None, maxRequestSize: int = None, rawResponses: bool = False):
+        """immudb asyncio Client, built on grpc.aio.
+
+        Every method of :class:`ImmudbClient` that talks to the server
+        is a coroutine here. The client should be created from inside the
+        event loop that uses it.
+
+        Args:
+            immudbUrl (str, optional): url in format ``host:port``
+                (e.g. ``localhost:3322``) of your immudb instance.
+                Defaults to ``localhost:3322`` when no value is set.
+            rs (RootService, optional): object that implements RootService,
+                allowing requests to be verified. Optional.
+                By default in-memory RootService instance will be created
+            publicKeyFile (str, optional): path of the public key to use
+                for authenticating requests. Optional.
+            timeout (int, optional): global timeout for GRPC requests. Requests
+                will hang until the server responds if no timeout is set.
+            max_grpc_message_length (int, optional): maximum size of message the
+                server should send. The default (4Mb) is used is no value is set.
+            verifiedCacheSize (int, optional): number of verified transactions
+                remembered to skip proofs between already trusted transactions.
+                Defaults to 1024, 0 disables the cache.
+            verifiedCache (VerifiedTxCache, optional): cache of verified
+                transactions to use instead of a new one, e.g. a
+                :class:`TrustedTxIndex` persisting it between runs. It is
+                not cleared when logging in or switching database.
+            maxRequestSize (int, optional): serialized size above which
+                setAll, getAll and execAll are split into several requests,
+                e.g. ``constants.MAX_REQUEST_SIZE``. Split writes are not
+                atomic. Defaults to None, sending a single request.
+            rawResponses (bool, optional): if True, methods returning
+                datatypesv2 dataclasses return the protobuf messages instead,
+                skipping their conversion. Defaults to False.
+        """
+        if immudUrl is None:
+            immudUrl = "localhost:3322"
+        self.timeout = timeout
+        options = []
+        if max_grpc_message_length:
+            options = [('grpc.max_receive_message_length',
+                        max_grpc_message_length)]
+        self.channel = grpc.aio.insecure_channel(immudUrl, options=options)
+        self._resetStub()
+        if rs is None:
+            rs = RootService()
+        self._rs = _AdvanceOnlyRootService(rs)
+        self._url = immudUrl
+        self._vk = None
+        self._currentdb = None
+        # only the cache owned by the client is reset on a new trusted state
+        self._ownVerifiedCache = verifiedCache is None
+        if verifiedCache is None:
+            verifiedCache = VerifiedTxCache(verifiedCacheSize)
+        self._verifiedCache = verifiedCache
+        # SQL table metadata by (database, table), see verifiableSQLGetMany
+        self._sqlTables = dict()
+        self._maxRequestSize = maxRequestSize
+        self._rawResponses = rawResponses
+        if publicKeyFile:
+            self.loadKey(publicKeyFile)
+
+    def _convertResponse(self, resp):
+        if self._rawResponses:
+            return resp
+        return dataconverter.convertResponse(resp)
+
+    def loadKey(self, kfile: str):
+        """Loads public key from path
+
+        Args:
+            kfile (str): key file path
+        """
+        with open(kfile) as f:
+            self._vk = ecdsa.VerifyingKey.from_pem(f.read())
+
+    def loadKeyFromString(self, key: str):
+        """Loads public key from parameter
+
+        Args:
+            key (str): key
+        """
+        self._vk = ecdsa.VerifyingKey.from_pem(key)
+
+    async def shutdown(self):
+        """Shutdowns client
+        """
+        await self.channel.close()
+        self.channel = None
+        self._rs = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.shutdown()
+
+    def _resetStub(self):
+        self._stub = InterceptedStub(self.channel, [], self.timeout)
+
+    def _set_token_header(self, response):
+        try:
+            token = response.token
+        except AttributeError:
+            token = response.reply.token
+        return InterceptedStub(self.channel, [('authorization', "Bearer " + token)], self.timeout)
+
+    async def _initState(self, dbname):
+        state = await self._stub.CurrentState(google_dot_protobuf_dot_empty__pb2.Empty())
+        self._rs.init(dbname, _CurrentStateService(state))
+        if self._ownVerifiedCache:
+            self._verifiedCache.clear()
+
+    @property
+    def stub(self):
+        return self._stub
+
+    def _convertToBytes(self, what):
+        if (type(what) != bytes):
+            return bytes(what, encoding='utf-8')
+        return what
+
+    async def login(self, username, password, database=b"defaultdb"):
+        """Logins into immudb
+
+        Args:
+            username (str): username
+            password (str): password for user
+            database (bytes, optional): database to switch to. Defaults to b"defaultdb".
+
+        Returns:
+            LoginResponse: contains token and warning if any
+        """
+        convertedUsername = self._convertToBytes(username)
+        convertedPassword = self._convertToBytes(password)
+        convertedDatabase = self._convertToBytes(database)
+        req = schema_pb2.LoginRequest(
+            user=convertedUsername, password=convertedPassword)
+        login_response = await self._stub.Login(req)
+
+        self._stub = self._set_token_header(login_response)
+        request = schema_pb2.Database(databaseName=convertedDatabase)
+        resp = await self._stub.UseDatabase(request)
+        self._stub = self._set_token_header(resp)
+
+        await self._initState("{}/{}".format(self._url, database))
+        self._currentdb = convertedDatabase
+        return login_response
+
+    async def logout(self):
+        """Logouts all sessions
+        """
+        await self._stub.Logout(google_dot_protobuf_dot_empty__pb2.Empty())
+        self._resetStub()
+        self._currentdb = None
+
+    async def keepAlive(self):
+        """Sends keep alive packet
+        """
+        await self._stub.KeepAlive(google_dot_protobuf_dot_empty__pb2.Empty())
+
+    def openManagedSession(self, username, password, database=b"defaultdb", keepAliveInterval=60):
+        """Opens a session managed by immudb, sending keepalive packets
+        from a background task.
+
+        Examples:
+            async with client.openManagedSession(username, password) as session:
+                await session.newTx()
+
+        Args:
+            username (str): username
+            password (str): password for user
+            database (bytes, optional): database to establish session with.
+                Defaults to ``b"defaultdb"``.
+            keepAliveInterval (int, optional): specifies how often keepalive
+                packets should be sent, in seconds. Defaults to ``60s``.
+
+        Returns:
+            ManagedSession: managed Session object
+        """
+        class ManagedSession:
+            def __init__(this, keepAliveInterval):
+                this.keepAliveInterval = keepAliveInterval
+                this.keepAliveTask = None
+
+            async def manage(this):
+                while True:
+                    await asyncio.sleep(this.keepAliveInterval)
+                    await self.keepAlive()
+
+            async def __aenter__(this):
+                interface = await self.openSession(username, password, database)
+                this.keepAliveTask = asyncio.ensure_future(this.manage())
+                return interface
+
+            async def __aexit__(this, type, value, traceback):
+                this.keepAliveTask.cancel()
+                await self.closeSession()
+
+        return ManagedSession(keepAliveInterval)
+
+    async def openSession(self, username, password, database=b"defaultdb"):
+        """Opens unmanaged Session object.
+
+        Args:
+            username (str): username
+            password (str): password
+            database (bytes, optional): database to establish session with.
+                Defaults to ``b"defaultdb"``.
+
+        Returns:
+            Tx: Tx object (aio/transaction.py)
+        """
+        req = schema_pb2.OpenSessionRequest(
+            username=self._convertToBytes(username),
+            password=self._convertToBytes(password),
+            databaseName=self._convertToBytes(database)
+        )
+        session_response = await self._stub.OpenSession(req)
+        self._stub = InterceptedStub(
+            self.channel, [('sessionid', session_response.sessionID)], self.timeout)
+        return transaction.Tx(self._stub, database, session_response, self.channel, self.timeout)
+
+    async def closeSession(self):
+        """Closes unmanaged session
+        """
+        await self._stub.CloseSession(google_dot_protobuf_dot_empty__pb2.Empty())
+        self._resetStub()
+
+    async def useDatabase(self, dbName: bytes):
+        """Switches database
+
+        Args:
+            dbName (bytes): database name
+        """
+        request = schema_pb2.Database(databaseName=dbName)
+        resp = await self._stub.UseDatabase(request)
+        self._stub = self._set_token_header(resp)
+        await self._initState(dbName)
+        self._currentdb = dbName
+        return resp
+
+    async def createDatabase(self, dbName: bytes):
+        """Creates database
+
+        Args:
+            dbName (bytes): name of database
+        """
+        request = schema_pb2.Database(databaseName=dbName)
+        return await self._stub.CreateDatabase(request)
+
+    async def databaseList(self):
+        """Returns database list
+
+        Returns:
+            list[str]: database names
+        """
+        dbs = await self._stub.DatabaseList(google_dot_protobuf_dot_empty__pb2.Empty())
+        return [x.databaseName for x in dbs.databases]
+
+    async def createUser(self, user, password, permission, database):
+        """Creates user specified in parameters
+
+        Args:
+            user (str): username
+            password (str): password
+            permission (int): permissions (constants.PERMISSION_X)
+            database (str): database name
+        """
+        request = schema_pb2.CreateUserRequest(
+            user=bytes(user, encoding='utf-8'),
+            password=bytes(password, encoding='utf-8'),
+            permission=permission,
+            database=database
+        )
+        return await self._stub.CreateUser(request)
+
+    async def listUsers(self):
+        """Returns all database users.
+
+        Returns:
+            UserList: users visible to the logged in user
+        """
+        return await self._stub.ListUsers(google_dot_protobuf_dot_empty__pb2.Empty())
+
+    async def changePassword(self, user, newPassword, oldPassword):
+        """Changes password for user
+
+        Args:
+            user (str): username
+            newPassword (str): new password
+            oldPassword (str): old password
+        """
+        request = schema_pb2.ChangePasswordRequest(
+            user=bytes(user, encoding='utf-8'),
+            newPassword=bytes(newPassword, encoding='utf-8'),
+            oldPassword=bytes(oldPassword, encoding='utf-8')
+        )
+        return await self._stub.ChangePassword(request)
+
+    async def changePermission(self, action, user, database, permission):
+        """Changes permission for user
+
+        Args:
+            action (int): GRANT or REVOKE - see constants/PERMISSION_GRANT
+            user (str): username
+            database (str): database name
+            permission (int): permission to revoke/ grant - see constants/PERMISSION_GRANT
+        """
+        request = schema_pb2.ChangePermissionRequest(
+            action=action, username=user, database=database, permission=permission)
+        return await self._stub.ChangePermission(request)
+
+    async def healthCheck(self):
+        """Retrieves health status of immudb
+
+        Returns:
+            bool: status
+        """
+        resp = await self._stub.Health(google_dot_protobuf_dot_empty__pb2.Empty())
+        return resp.status
+
+    async def health(self):
+        """Retrieves health response of immudb
+
+        Returns:
+            HealthResponse: contains status and version
+        """
+        return await self._stub.Health(google_dot_protobuf_dot_empty__pb2.Empty())
+
+    async def serverInfo(self) -> datatypesv2.ServerInfoResponse:
+        """Returns server info containing version
+
+        Returns:
+            datatypesv2.ServerInfoResponse: Contains version of running server
+        """
+        req = datatypesv2.ServerInfoRequest()
+        resp = await self._stub.ServerInfo(req._getGRPC())
+        return self._convertResponse(resp)
+
+    async def databaseHealth(self) -> datatypesv2.DatabaseHealthResponse:
+        """Returns information about database health (pending requests, last request completion timestamp)
+
+        Returns:
+            datatypesv2.DatabaseHealthResponse: Contains informations about database
+        """
+        resp = await self._stub.DatabaseHealth(google_dot_protobuf_dot_empty__pb2.Empty())
+        return self._convertResponse(resp)
+
+    async def currentState(self) -> State:
+        """Return current state (proof) of current database.
+
+        Returns:
+            State: State of current database, proving integrity of its data.
+        """
+        immudbstate = await self._stub.CurrentState(google_dot_protobuf_dot_empty__pb2.Empty())
+        state = State.FromGrpc(immudbstate)
+        self._rs.set(state)
+        return state
+
+    async def set(self, key: bytes, value: bytes, metadata: KVMetadata = None) -> datatypes.SetResponse:
+        """Sets key into value in database
+
+        Args:
+            key (bytes): key
+            value (bytes): value
+            metadata (KVMetadata, optional): entry metadata. Defaults to None.
+
+        Returns:
+            SetResponse: response of request
+        """
+        request = schema_pb2.SetRequest(
+            KVs=[schema_pb2.KeyValue(key=key, value=value,
+                                     metadata=MetadataToProto(metadata))]
+        )
+        msg = await self._stub.Set(request)
+        return datatypes.SetResponse(
+            id=msg.id,
+            verified=False,
+        )
+
+    async def verifiedSet(self, key: bytes, value: bytes) -> datatypes.SetResponse:
+        """Sets key into value in database, and additionally checks it with state saved before
+
+        Args:
+            key (bytes): key
+            value (bytes): value
+
+        Returns:
+            SetResponse: response of request
+        """
+        state = self._rs.get()
+        request = schema_pb2.VerifiableSetRequest(
+            setRequest=schema_pb2.SetRequest(
+                KVs=[schema_pb2.KeyValue(key=key, value=value)]),
+            proveSinceTx=state.txId,
+        )
+        verifiableTx = await self._stub.VerifiableSet(request)
+        return verifiedSet.verify(verifiableTx, state, key, value, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def setAll(self, kv: Dict[bytes, bytes]) -> datatypes.SetResponse:
+        """Sets all values for corresponding keys from dictionary
+
+        If the client has a ``maxRequestSize``, bigger dictionaries are split
+        and written concurrently in several transactions, so they are not
+        written atomically anymore.
+
+        Args:
+            kv (Dict[bytes, bytes]): dictionary of keys and values
+
+        Returns:
+            datatypes.SetResponse: Set response contains transaction id
+                (the highest one if the dictionary was split)
+        """
+        requests = batchSet.buildRequests(kv, self._maxRequestSize)
+        msgs = await asyncio.gather(*[self._stub.Set(request) for request in requests])
+        return batchSet.response(max(msgs, key=lambda msg: msg.id))
+
+    async def get(self, key: bytes, atRevision: int = None) -> datatypes.GetResponse:
+        """Get value for key.
+
+        Args:
+            key (bytes): Key of value to retrieve.
+            atRevision (int, optional): Specify the revision from which the value
+                should be retrieved.
+
+        Returns:
+            GetResponse: Contains `tx`, `value`, `key` and `revision` information.
+        """
+        request = schema_pb2.KeyRequest(key=key, atRevision=atRevision)
+        try:
+            msg = await self._stub.Get(request)
+        except grpc.RpcError as e:
+            if e.details().endswith('key not found'):
+                return None
+            raise e
+        return datatypes.GetResponse(
+            tx=msg.tx,
+            key=msg.key,
+            value=msg.value,
+            revision=msg.revision
+        )
+
+    async def getAll(self, keys: List[bytes]) -> Dict[bytes, bytes]:
+        """Returns values for specified keys
+
+        Args:
+            keys (List[bytes]): Keys list
+
+        Returns:
+            Dict[bytes, bytes]: Dictionary of key : value pairs
+        """
+        entries = await self._getAllEntries(keys)
+        return {entry.key: entry.value for entry in entries}
+
+    async def _getAllEntries(self, keys: List[bytes]) -> list:
+        chunks = chunking.split(list(keys), len, self._maxRequestSize)
+        results = await asyncio.gather(*[self._stub.GetAll(schema_pb2.KeyListRequest(keys=chunk)) for chunk in chunks], return_exceptions=True)
+        entries = []
+        for chunk, result in zip(chunks, results):
+            if not isinstance(result, BaseException):
+                entries.extend(result.entries)
+            elif chunking.isResourceExhausted(result) and len(chunk) > 1:
+                # response too big for the channel: retry in halves
+                half = len(chunk) // 2
+                entries.extend(await self._getAllEntries(chunk[:half]))
+                entries.extend(await self._getAllEntries(chunk[half:]))
+            else:
+                raise result
+        return entries
+
+    async def verifiedGetAll(self, keys: List[bytes]) -> Dict[bytes, datatypes.SafeGetResponse]:
+        """Returns values for specified keys, verified against saved state.
+
+        Transactions holding the keys are fetched concurrently; only the
+        highest one is proven against the saved state.
+
+        Args:
+            keys (List[bytes]): Keys list
+
+        Returns:
+            Dict[bytes, datatypes.SafeGetResponse]: Dictionary of key : verified response
+        """
+        if len(keys) == 0:
+            return {}
+        state = self._rs.get()
+        entries = await self._getAllEntries(keys)
+        byTx = verifiedBatchGet.groupByTx(entries)
+        highest = max(byTx)
+        txIds = list(byTx)
+        fetched = await asyncio.gather(*[self._stub.VerifiableTxById(schema_pb2.VerifiableTxRequest(
+            tx=tx, proveSinceTx=state.txId if tx == highest else highest)) for tx in txIds])
+        vtxs = dict(zip(txIds, fetched))
+        return verifiedBatchGet.verify(byTx, vtxs, state, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def _verifiedGet(self, key: bytes, atTx: int = None, sinceTx: int = None, atRevision: int = None) -> datatypes.SafeGetResponse:
+        state = self._rs.get()
+        req = schema_pb2.VerifiableGetRequest(
+            keyRequest=schema_pb2.KeyRequest(
+                key=key, atTx=atTx, sinceTx=sinceTx, atRevision=atRevision),
+            proveSinceTx=state.txId
+        )
+        ventry = await self._stub.VerifiableGet(req)
+        return verifiedGet.verify(ventry, state, key, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def verifiedGet(self, key: bytes, atRevision: int = None) -> datatypes.SafeGetResponse:
+        """Get value for key and verify it against saved state.
+
+        Args:
+            key (bytes): Key of value to retrieve.
+            atRevision (int, optional): Specify the revision from which the value
+                should be retrieved.
+
+        Returns:
+            SafeGetResponse: Contains information about the transaction
+                and the verified state.
+        """
+        return await self._verifiedGet(key, atRevision=atRevision)
+
+    async def verifiedGetSince(self, key: bytes, sinceTx: int) -> datatypes.SafeGetResponse:
+        """Get value for key since a given transaction (and wait if that transaction is not yet indexed).
+
+        Args:
+            key (bytes): Key of value to retrieve.
+            sinceTx (int): Identifier of the earliest transaction from which the
+                key's value should be retrieved.
+
+        Returns:
+            datatypes.SafeGetResponse: object that contains informations about transaction and verified state
+        """
+        return await self._verifiedGet(key, sinceTx=sinceTx)
+
+    async def verifiedGetAt(self, key: bytes, atTx: int) -> datatypes.SafeGetResponse:
+        """Get value for key at a given transaction point.
+
+        Args:
+            key (bytes): Key of value to retrieve.
+            atTx (int): Identifier of the transaction at which point the key's
+                value should be retrieved.
+
+        Returns:
+            datatypes.SafeGetResponse: object that contains informations about transaction and verified state
+        """
+        return await self._verifiedGet(key, atTx=atTx)
+
+    async def history(self, key: bytes, offset: int, limit: int, sortorder: bool) -> List[datatypes.historyResponseItem]:
+        """Returns history of values for a given key.
+
+        Args:
+            key (bytes): Key of value to retrieve.
+            offset (int): Offset of history
+            limit (int): Limit of history entries
+            sortorder (bool): If ``True``, the history will be returned in descending order.
+
+        Returns:
+            List[datatypes.historyResponseItem]: List of history response items
+        """
+        request = schema_pb2.HistoryRequest(
+            key=key,
+            offset=offset,
+            limit=limit,
+            desc=sortorder,
+            sinceTx=self._rs.get().txId
+        )
+        histo = await self._stub.History(request)
+        return [datatypes.historyResponseItem(key=i.key, value=i.value, tx=i.tx)
+                for i in histo.entries]
+
+    async def zAdd(self, zset: bytes, score: float, key: bytes, atTx: int = 0) -> datatypes.SetResponse:
+        """Adds score (secondary index) for a specified key and collection.
+
+        Args:
+            zset (bytes): collection name
+            score (float): score
+            key (bytes): key name
+            atTx (int, optional): Transaction id to bound score to. Defaults to 0.
+
+        Returns:
+            datatypes.SetResponse: Set response contains transaction id
+        """
+        request = schema_pb2.ZAddRequest(
+            set=zset,
+            score=score,
+            key=key,
+            atTx=atTx,
+            boundRef=atTx > 0,
+        )
+        msg = await self._stub.ZAdd(request)
+        if msg.nentries != 1:
+            raise ErrCorruptedData
+        return datatypes.SetResponse(
+            id=msg.id,
+            verified=False,
+        )
+
+    async def verifiedZAdd(self, zset: bytes, score: float, key: bytes, atTx: int = 0) -> datatypes.SetResponse:
+        """Adds score (secondary index) for a specified key and collection.
+        Additionaly checks immudb state
+
+        Args:
+            zset (bytes): collection name
+            score (float): score
+            key (bytes): key name
+            atTx (int, optional): transaction id to bound score to. Defaults to 0.
+
+        Returns:
+            datatypes.SetResponse: Set response contains transaction id
+        """
+        state = self._rs.get()
+        request = schema_pb2.VerifiableZAddRequest(
+            zAddRequest=schema_pb2.ZAddRequest(
+                set=zset,
+                score=score,
+                key=key,
+                atTx=atTx,
+            ),
+            proveSinceTx=state.txId
+        )
+        vtx = await self._stub.VerifiableZAdd(request)
+        return verifiedzadd.verify(vtx, state, zset, score, key, atTx, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def setReference(self, referredkey: bytes, newkey: bytes):
+        """References key specified by referredkey as newkey
+
+        Args:
+            referredkey (bytes): Reffered key
+            newkey (bytes): New key
+
+        Returns:
+            TxHeader: Transaction header
+        """
+        request = schema_pb2.ReferenceRequest(
+            referencedKey=referredkey,
+            key=newkey,
+            atTx=0,
+            boundRef=False
+        )
+        return await self._stub.SetReference(request)
+
+    async def verifiedSetReference(self, referredkey: bytes, newkey: bytes) -> datatypes.SetResponse:
+        """References key specified by referredkey as newkey and verifies state of immudb
+
+        Args:
+            referredkey (bytes): Reffered key
+            newkey (bytes): New key
+
+        Returns:
+            datatypes.SetResponse: Set response contains transaction id
+        """
+        state = self._rs.get()
+        request = schema_pb2.VerifiableReferenceRequest(
+            referenceRequest=schema_pb2.ReferenceRequest(
+                referencedKey=referredkey,
+                key=newkey,
+                atTx=0,
+                boundRef=False
+            ),
+            proveSinceTx=state.txId
+        )
+        vtx = await self._stub.VerifiableSetReference(request)
+        return verifiedreference.verify(vtx, state, referredkey, newkey, 0, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def scan(self, key: bytes, prefix: bytes, desc: bool, limit: int, sinceTx: int = None) -> Dict[bytes, bytes]:
+        """Scans for provided parameters. Limit for scan is fixed - 1000. You need to introduce pagination.
+
+        Args:
+            key (bytes): Seek key to find
+            prefix (bytes): Prefix of key
+            desc (bool): Descending or ascending order
+            limit (int): Limit of entries to get
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+
+        Returns:
+            Dict[bytes, bytes]: Dictionary of key and values
+        """
+        if sinceTx == None:
+            sinceTx = self._rs.get().txId
+        request = schema_pb2.ScanRequest(
+            seekKey=key,
+            prefix=prefix,
+            desc=desc,
+            limit=limit,
+            sinceTx=sinceTx,
+            noWait=False
+        )
+        msg = await self._stub.Scan(request)
+        return {i.key: i.value for i in msg.entries}
+
+    async def zScan(self, zset: bytes, seekKey: bytes = None, seekScore: float = None,
+                    seekAtTx: int = None, inclusive: bool = None, limit: int = None, desc: bool = None, minscore: float = None,
+                    maxscore: float = None, sinceTx=None, nowait=False) -> schema_pb2.ZEntries:
+        """Scan for provided parameters for secondary index. Limit for scan is fixed - 1000. You need to introduce pagination.
+
+        Args:
+            zset (bytes): Set name
+            seekKey (bytes): Seek key to find
+            seekScore (float): Seek score - min or max score for entry (depending on desc value)
+            seekAtTx (int): Tx id for the first entry
+            inclusive (bool): Element resulting from seek key would be part of resulting set
+            limit (int): Maximum number of returned items
+            desc (bool): Descending or ascending order
+            minscore (float): Min score
+            maxscore (float): Max score
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            nowait (bool, optional): when true - scan doesn't wait for transaction at seekAtTx to be procesessed. Defaults to False.
+
+        Returns:
+            schema_pb2.ZEntries: Entries of this scan
+        """
+        request = schema_pb2.ZScanRequest(
+            set=zset,
+            seekKey=seekKey,
+            seekScore=seekScore,
+            seekAtTx=seekAtTx,
+            inclusiveSeek=inclusive,
+            limit=limit,
+            desc=desc,
+            minScore=schema_pb2.Score(score=minscore),
+            maxScore=schema_pb2.Score(score=maxscore),
+            sinceTx=sinceTx,
+            noWait=nowait,
+        )
+        return await self._stub.ZScan(request)
+
+    async def txById(self, tx: int) -> List[bytes]:
+        """Returns keys list modified in transaction by transaction id
+
+        Args:
+            tx (int): transaction id
+
+        Returns:
+            List[bytes]: Keys list modified in queried transaction
+        """
+        try:
+            msg = await self._stub.TxById(schema_pb2.TxRequest(tx=tx))
+        except grpc.RpcError as e:
+            if e.details() == 'tx not found':
+                return None
+            raise e
+        return [t.key[1:] for t in msg.entries]
+
+    async def verifiedTxById(self, tx: int) -> List[bytes]:
+        """Returns and verifies keys list modified in transaction by transaction id
+
+        Args:
+            tx (int): transaction id
+
+        Returns:
+            List[bytes]: Keys list modified in queried transaction
+        """
+        state = self._rs.get()
+        request = schema_pb2.VerifiableTxRequest(
+            tx=tx,
+            proveSinceTx=state.txId
+        )
+        try:
+            vtx = await self._stub.VerifiableTxById(request)
+        except grpc.RpcError as e:
+            if e.details() == 'tx not found':
+                return None
+            raise e
+        return verifyTransaction(vtx, state, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def verifiedTxStream(self, fromTx: int = 1, batchSize: int = 100, follow: bool = False, pollInterval: float = 1.0) -> AsyncGenerator[store.Tx, None]:
+        """Yields verified transactions starting from fromTx.
+
+        Transactions are fetched with txScan in batches of batchSize, and
+        only the last transaction of every batch is proven against the
+        saved state. While a batch is yielded, the next one is fetched.
+
+        Args:
+            fromTx (int, optional): first transaction id. Defaults to 1.
+            batchSize (int, optional): transactions fetched (and proven) at
+                once. Defaults to 100.
+            follow (bool, optional): if `True`, waits for new transactions
+                instead of stopping at the last committed one.
+            pollInterval (float, optional): seconds between polls when
+                following. Defaults to 1.
+
+        Yields:
+            AsyncGenerator[store.Tx, None]: verified transactions
+        """
+        nextScan = asyncio.ensure_future(self._stub.TxScan(
+            verifiedTxStream.scanRequest(fromTx, batchSize)))
+        try:
+            while True:
+                stxs = (await nextScan).txs
+                nextScan = None
+                if len(stxs) == 0:
+                    if not follow:
+                        return
+                    await asyncio.sleep(pollInterval)
+                    nextScan = asyncio.ensure_future(self._stub.TxScan(
+                        verifiedTxStream.scanRequest(fromTx, batchSize)))
+                    continue
+                nextScan = asyncio.ensure_future(self._stub.TxScan(
+                    verifiedTxStream.scanRequest(stxs[-1].header.id + 1, batchSize)))
+                state = self._rs.get()
+                vtx = await self._stub.VerifiableTxById(verifiedTxStream.proofRequest(stxs, state))
+                txs = verifiedTxStream.verifyBatch(
+                    stxs, fromTx, vtx, state, self._vk, self._rs, cache=self._verifiedCache)
+                for tx in txs:
+                    yield tx
+                fromTx = txs[-1].header.iD + 1
+        finally:
+            if nextScan is not None:
+                nextScan.cancel()
+
+    async def txScan(self, initialTx: int, limit: int = 999, desc: bool = False, entriesSpec: datatypesv2.EntriesSpec = None, sinceTx: int = 0, noWait: bool = False) -> datatypesv2.TxList:
+        """Scans for transactions with specified parameters
+
+        Args:
+            initialTx (int): initial transaction id
+            limit (int, optional): Limit resulsts. Defaults to 999.
+            desc (bool, optional): If `True`, use descending scan order.
+            entriesSpec (datatypesv2.EntriesSpec, optional): Specified what should be contained in scan. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+
+        Returns:
+            datatypesv2.TxList: Transaction list
+        """
+        req = datatypesv2.TxScanRequest(
+            initialTx, limit, desc, entriesSpec, sinceTx, noWait)
+        resp = await self._stub.TxScan(req._getGRPC())
+        return self._convertResponse(resp)
+
+    async def delete(self, req: DeleteKeysRequest):
+        """Deletes key
+
+        Args:
+            req (DeleteKeysRequest): Request contains key to delete
+
+        Returns:
+            TxHeader: Transaction header
+        """
+        request = schema_pb2.DeleteKeysRequest(
+            keys=req.keys,
+            sinceTx=req.sinceTx,
+            noWait=req.noWait
+        )
+        return await self._stub.Delete(request)
+
+    async def execAll(self, ops: List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]], noWait=False):
+        """Exectues all operations from list (KeyValue, ZAddRequest, ReferenceRequest)
+
+        If the client has a ``maxRequestSize``, bigger lists are split and
+        executed in order in several transactions, so they are not executed
+        atomically anymore.
+
+        Args:
+            ops (List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]]): List of operations
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to False.
+
+        Returns:
+            TxHeader: Transaction header (of the last transaction if the list was split)
+        """
+        for request in execAll.buildRequests(ops, noWait, self._maxRequestSize):
+            msg = await self._stub.ExecAll(request)
+        return msg
+
+    async def streamGet(self, key: bytes, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> Tuple[bytes, AsyncBufferedStreamReader]:
+        """Streaming method to get buffered value.
+        You can read from this value by awaiting read() method
+
+        Args:
+            key (bytes): Key to get
+            atTx (int, optional): Get key at transaction id. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+            atRevision (int, optional): Returns value of key at specified revision. Defaults to None.
+
+        Returns:
+            Tuple[bytes, AsyncBufferedStreamReader]: First value is key, second is reader.
+        """
+        req = datatypesv2.KeyRequest(
+            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision)
+        resp = self._stub.streamGet(req._getGRPC())
+        chunks = StreamReader(resp).asyncChunks()
+        keyHeader = await _next(chunks)
+        if keyHeader != None:
+            valueHeader = await _next(chunks)
+            return keyHeader.key, AsyncBufferedStreamReader(chunks, valueHeader, resp)
+
+    async def streamGetFull(self, key: bytes, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> datatypesv2.KeyValue:
+        """Streaming method to get full value
+
+        Args:
+            key (bytes): Key to get
+            atTx (int, optional): Get key at transaction id. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+            atRevision (int, optional): Returns value of key at specified revision. Defaults to None.
+
+        Returns:
+            datatypesv2.KeyValue: Key value from immudb
+        """
+        req = datatypesv2.KeyRequest(
+            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision)
+        resp = self._stub.streamGet(req._getGRPC())
+        chunks = StreamReader(resp).asyncChunks()
+        chunk = await _next(chunks)
+        if chunk != None:
+            value = bytearray()
+            async for it in chunks:
+                value += it.chunk
+            return datatypesv2.KeyValue(chunk.key, bytes(value))
+
+    async def streamVerifiedGet(self, key: bytes = None, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> datatypes.SafeGetResponse:
+        """Gets a value of a key with streaming method, and verifies transaction.
+
+        Args:
+            key (bytes): Key to get
+            atTx (int, optional): Get key at transaction id. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+            atRevision (int, optional): Returns value of key at specified revision. Defaults to None.
+
+        Raises:
+            ErrCorruptedData: When data is corrupted or unverifiable
+
+        Returns:
+            datatypes.SafeGetResponse: Response contains informations about verification
+        """
+        state = self._rs.get()
+        req = datatypesv2.VerifiableGetRequest(keyRequest=datatypesv2.KeyRequest(
+            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision), proveSinceTx=state.txId)
+        resp = self._stub.streamVerifiableGet(req._getGRPC())
+        chunks = VerifiedGetStreamReader(resp).asyncChunks()
+        keyHeader = await _next(chunks)
+        if keyHeader != None:
+            verifiableTx = await _next(chunks)
+            inclusionProof = await _next(chunks)
+            verifier = verifiedStreamGet.ValueVerifier(
+                keyHeader.entry, verifiableTx, inclusionProof, state, self._vk, self._rs, cache=self._verifiedCache)
+            value = bytearray()
+            async for chunk in chunks:
+                verifier.update(chunk.chunk)
+                value += chunk.chunk
+            verifier.finish()
+            return datatypes.SafeGetResponse(
+                id=verifiableTx.tx.header.id,
+                key=keyHeader.key,
+                value=bytes(value),
+                timestamp=verifiableTx.tx.header.ts,
+                verified=True,
+                refkey=keyHeader.refKey,
+                revision=atRevision
+            )
+
+    async def streamHistory(self, key: bytes, offset: int = None, sinceTx: int = None, limit: int = None, desc: bool = None) -> AsyncGenerator[datatypesv2.KeyValue, None]:
+        """Streams history of key
+
+        Args:
+            key (bytes): Key to find
+            offset (int, optional): Offset to apply
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            limit (int, optional): Limit of history entries. Defaults to None.
+            desc (bool, optional): Descending or ascending order. Defaults to None.
+
+        Yields:
+            AsyncGenerator[datatypesv2.KeyValue, None]: Generator of KeyValues
+        """
+        request = datatypesv2.HistoryRequest(
+            key=key, offset=offset, limit=limit, desc=desc, sinceTx=sinceTx)
+        resp = self._stub.streamHistory(request._getGRPC())
+        async for kv in self._collectKeyValues(resp):
+            yield kv
+
+    async def streamScan(self, seekKey: bytes = None, endKey: bytes = None, prefix: bytes = None, desc: bool = None, limit: int = None, sinceTx: int = None, noWait: bool = None, inclusiveSeek: bool = None, inclusiveEnd: bool = None, offset: int = None) -> AsyncGenerator[datatypesv2.KeyValue, None]:
+        """Scan method in streaming maneer
+
+        Args:
+            seekKey (bytes, optional): Key to seek. Defaults to None.
+            endKey (bytes, optional): Key to end scan with. Defaults to None.
+            prefix (bytes, optional): Key prefix. Defaults to None.
+            desc (bool, optional): Sorting order - true to descending. Defaults to None.
+            limit (int, optional): Limit of scan items. Defaults to None.
+            sinceTx (int, optional): immudb will wait that the transaction specified by sinceTx is processed. Defaults to None.
+            noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to None.
+            inclusiveSeek (bool, optional): Includes seek key value. Defaults to None.
+            inclusiveEnd (bool, optional): Includes end key value also. Defaults to None.
+            offset (int, optional): Offsets current scan. Defaults to None.
+
+        Yields:
+            AsyncGenerator[datatypesv2.KeyValue, None]: Returns generator of KeyValue
+        """
+        req = datatypesv2.ScanRequest(seekKey=seekKey, endKey=endKey, prefix=prefix, desc=desc, limit=limit,
+                                      sinceTx=sinceTx, noWait=noWait, inclusiveSeek=inclusiveSeek, inclusiveEnd=inclusiveEnd, offset=offset)
+        resp = self._stub.streamScan(req._getGRPC())
+        async for kv in self._collectKeyValues(resp):
+            yield kv
+
+    async def parallelScan(self, prefix: bytes = b'', partitions: int = 4, ordered: bool = True, sinceTx: int = None, noWait: bool = None, pageSize: int = 1000, bufferSize: int = 1024) -> AsyncGenerator[datatypesv2.KeyValue, None]:
+        """Scans all the keys with prefix, reading partitions of the key
+        range concurrently.
+
+        The range between the first and the last key with prefix is split in
+        partitions of about the same width, each one scanned (pages of
+        pageSize keys) with streamScan in its own task.
+
+        Args:
+            prefix (bytes, optional): Key prefix. Defaults to all keys.
+            partitions (int, optional): number of concurrent scans. Defaults to 4.
+            ordered (bool, optional): if `True`, keys are yielded in
+                ascending order; otherwise as soon as any partition reads
+                them. Defaults to True.
+            sinceTx (int, optional): transaction every request waits for
+                the index to include. This is not a snapshot: partitions
+                can see writes and deletions committed after it while the
+                scan runs. Defaults to the current transaction of the
+                server.
+            noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to None.
+            pageSize (int, optional): keys read per request. Defaults to 1000.
+            bufferSize (int, optional): keys read ahead per partition. Defaults to 1024.
+
+        Yields:
+            AsyncGenerator[datatypesv2.KeyValue, None]: Returns generator of KeyValue
+        """
+        if sinceTx == None:
+            # every request waits for the index to reach the same tx
+            state = await self._stub.CurrentState(
+                google_dot_protobuf_dot_empty__pb2.Empty())
+            sinceTx = state.txId
+        first = [kv async for kv in self.streamScan(
+            prefix=prefix, limit=1, sinceTx=sinceTx, noWait=noWait)]
+        if len(first) == 0:
+            return
+        last = [kv async for kv in self.streamScan(
+            prefix=prefix, desc=True, limit=1, sinceTx=sinceTx, noWait=noWait)]
+        ranges = scanpartition.keyRanges(scanpartition.splitKeyRange(
+            first[0].key, last[0].key, partitions))
+        if ordered:
+            queues = [asyncio.Queue(bufferSize) for r in ranges]
+        else:
+            queues = [asyncio.Queue(bufferSize)] * len(ranges)
+        done = object()
+
+        async def worker(seekKey, endKey, q):
+            try:
+                async for kv in self._scanPartition(prefix, seekKey, endKey, sinceTx, noWait, pageSize):
+                    await q.put(kv)
+            except Exception as e:
+                await q.put(e)
+                return
+            await q.put(done)
+
+        tasks = [asyncio.ensure_future(worker(seekKey, endKey, q))
+                 for (seekKey, endKey), q in zip(ranges, queues)]
+        try:
+            remaining = len(tasks)
+            index = 0
+            while remaining > 0:
+                item = await queues[index].get()
+                if item is done:
+                    remaining -= 1
+                    if ordered:
+                        index += 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _scanPartition(self, prefix: bytes, seekKey: bytes, endKey: bytes, sinceTx: int, noWait: bool, pageSize: int) -> AsyncGenerator[datatypesv2.KeyValue, None]:
+        inclusiveSeek = True
+        while True:
+            count = 0
+            async for kv in self.streamScan(seekKey=seekKey, endKey=endKey, prefix=prefix, limit=pageSize, sinceTx=sinceTx, noWait=noWait,
+                                            inclusiveSeek=inclusiveSeek, inclusiveEnd=False if endKey != None else None):
+                count += 1
+                seekKey = kv.key
+                yield kv
+            if count < pageSize:
+                return
+            inclusiveSeek = False
+
+    async def _collectKeyValues(self, resp):
+        key = None
+        value = None
+        async for chunk in StreamReader(resp).asyncChunks():
+            if isinstance(chunk, KeyHeader):
+                if key != None:
+                    yield datatypesv2.KeyValue(key=key, value=bytes(value), metadata=None)
+                key = chunk.key
+                value = bytearray()
+            else:
+                value += chunk.chunk
+
+        if key != None and value != None:
+            yield datatypesv2.KeyValue(key=key, value=bytes(value), metadata=None)
+
+    async def streamZScan(self, set: bytes = None, seekKey: bytes = None,
+                          seekScore: float = None, seekAtTx: int = None, inclusiveSeek: bool = None, limit: int = None,
+                          desc: bool = None, minScore: float = None, maxScore: float = None, sinceTx: int = None, noWait: bool = False, offset: int = None) -> AsyncGenerator[datatypesv2.ZScanEntry, None]:
+        """Scan for provided parameters for secondary index. Limit for scan is fixed - 1000. You need to introduce pagination.
+
+        Args:
+            set (bytes, optional): Set name. Defaults to None.
+            seekKey (bytes, optional): Seek key to find. Defaults to None.
+            seekScore (float, optional): Seek score to find. Defaults to None.
+            seekAtTx (int, optional): TX id for the first entry. Defaults to None.
+            inclusiveSeek (bool, optional): Element specified in seek should be included. Defaults to None.
+            limit (int, optional): Maximum number of returned items. Defaults to None.
+            desc (bool, optional): Descending or ascending order. Defaults to None.
+            minScore (float, optional): Minimum score to find. Defaults to None.
+            maxScore (float, optional): Maximum score to find. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): when true - scan doesn't wait for transaction at seekAtTx to be procesessed. Defaults to False.
+            offset (int, optional): Offsets current scan. Defaults to None.
+
+        Yields:
+            AsyncGenerator[datatypesv2.ZScanEntry, None]: Returns generator of ZScanEntry
+        """
+        minScoreObject = None
+        maxScoreObject = None
+        if minScore != None:
+            minScoreObject = datatypesv2.Score(minScore)
+        if maxScore != None:
+            maxScoreObject = datatypesv2.Score(maxScore)
+        req = datatypesv2.ZScanRequest(set=set, seekKey=seekKey, seekScore=seekScore, seekAtTx=seekAtTx, inclusiveSeek=inclusiveSeek,
+                                       limit=limit, desc=desc, minScore=minScoreObject, maxScore=maxScoreObject, sinceTx=sinceTx, noWait=noWait, offset=offset)
+        resp = self._stub.streamZScan(req._getGRPC())
+
+        set = None
+        key = None
+        score = None
+        atTx = None
+        value = None
+        async for chunk in ZScanStreamReader(resp).asyncChunks():
+            if isinstance(chunk, SetHeader):
+                if set != None:
+                    yield datatypesv2.ZScanEntry(set=set, key=key, value=bytes(value), score=score, atTx=atTx)
+                set = chunk.set
+                value = bytearray()
+                atTx = None
+                score = None
+                key = None
+
+            elif isinstance(chunk, KeyHeader):
+                key = chunk.key
+
+            elif isinstance(chunk, ScoreHeader):
+                score = chunk.score
+
+            elif isinstance(chunk, AtTXHeader):
+                atTx = chunk.seenAtTx
+
+            else:
+                value += chunk.chunk
+
+        if key != None and value != None:
+            yield datatypesv2.ZScanEntry(set=set, key=key, value=bytes(value), score=score, atTx=atTx)
+
+    async def streamSet(self, key: bytes, buffer, bufferLength: int, chunkSize: int = 65536) -> datatypesv2.TxHeader:
+        """Sets key into value with streaming method.
+
+        Args:
+            key (bytes): Key
+            buffer (io.BytesIO): Any buffer that implements read(length: int) method
+            bufferLength (int): Buffer length (protocol needs to know it at first)
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypesv2.TxHeader: Transaction header of just set transaction
+        """
+        resp = await self._stub.streamSet(makeSetStream(buffer, key, bufferLength, chunkSize))
+        return self._convertResponse(resp)
+
+    async def streamSetFullValue(self, key: bytes, value: bytes, chunkSize: int = 65536) -> datatypesv2.TxHeader:
+        """Sets key into value with streaming maneer. Differs from streamSet because user can set full value
+
+        Args:
+            key (bytes): Key to set
+            value (bytes): Value to set
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypesv2.TxHeader: Transaction header
+        """
+        return await self.streamSet(key, BytesIO(value), len(value), chunkSize)
+
+    async def streamVerifiedSet(self, key: bytes, buffer, bufferLength: int, chunkSize: int = 65536) -> datatypes.SetResponse:
+        """Sets key into value with streaming method and verifies with current state
+
+        Args:
+            key (bytes): Key
+            buffer (io.BytesIO): Any buffer that implements read(length: int) method
+            bufferLength (int): Buffer length (protocol needs to know it at first)
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypes.SetResponse: Response contains id of transaction and verification status.
+            Raises exception if corrupted data.
+        """
+        state = self._rs.get()
+        resp = await self._stub.streamVerifiableSet(makeVerifiableSetStream(
+            buffer, key, bufferLength, state.txId, chunkSize))
+        verified = verifyTransaction(
+            resp, state, self._vk, self._rs, cache=self._verifiedCache)
+        return datatypes.SetResponse(
+            id=resp.tx.header.id,
+            verified=verified[0] == key,
+        )
+
+    async def streamVerifiedSetFullValue(self, key: bytes, value: bytes, chunkSize: int = 65536) -> datatypes.SetResponse:
+        """Sets key into value with streaming method and verifies with current state.
+
+        Args:
+            key (bytes): Key to set
+            value (bytes): Value to set
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypes.SetResponse: Response contains id of transaction and verification status.
+            Raises exception if corrupted data.
+        """
+        return await self.streamVerifiedSet(key, BytesIO(value), len(value), chunkSize)
+
+    async def streamExecAll(self, ops: List[Union[datatypes.KeyValue, datatypes.StreamingKeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]], noWait=False) -> datatypesv2.TxHeader:
+        """Executes everything provided in ops List
+
+        Args:
+            ops (List[Union[datatypes.KeyValue, datatypes.StreamingKeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]]): List of actions to execute
+            noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to False.
+
+        Returns:
+            TxHeader: TxHeader of just executed transaction
+        """
+        resp = await self._stub.streamExecAll(makeExecAllStream(ops, noWait))
+        return self._convertResponse(resp)
+
+    def exportTx(self, tx: int):
+        """Opens stream to export transaction from immudb (you can combine it with replicateTx)
+
+        Args:
+            tx (int): transaction id
+
+        Returns:
+            AsyncIterable[Chunk]: Iterable of chunk
+        """
+        return self._stub.exportTx(datatypesv2.ExportTxRequest(tx)._getGRPC())
+
+    async def replicateTx(self, chunkStream) -> datatypesv2.TxHeader:
+        """Replicates transaction provided by stream
+
+        Args:
+            chunkStream (Iterable[Chunk]): fixed list of chunk, or stream from exportTx method
+
+        Returns:
+            datatypesv2.TxHeader: tx header of just synchronized transaction
+        """
+        return self._convertResponse(await self._stub.replicateTx(chunkStream))
+
+    async def sqlExec(self, stmt, params={}, noWait=False):
+        """Executes an SQL statement
+
+        Args:
+            stmt: a statement in immudb SQL dialect.
+            params: a dictionary of parameters to replace in the statement
+            noWait: whether to wait for indexing. Set to True for fast inserts.
+
+        Returns:
+            An object with two lists: ctxs and dtxs, including transaction
+            metadata for both the catalog and the data store.
+        """
+        return await sqlexec._call_with_executor(stmt, params, noWait, self._stub.SQLExec)
+
+    async def sqlQuery(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False):
+        """Queries the database using SQL
+
+        Args:
+            query: a query in immudb SQL dialect.
+            params: a dictionary of parameters to replace in the query
+            acceptStream: if True, an asynchronous row iterator is returned
+                instead of the list of rows.
+
+        Returns:
+            A list of rows, or an AsyncRowIterator if acceptStream is True.
+        """
+        return await sqlquery.call_with_executor(query, params, columnNameMode, self._currentdb, self._stub.SQLQuery, acceptStream)
+
+    async def sqlQueryColumnar(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_FIELD) -> ColumnarResult:
+        """Queries the database using SQL, decoding the result by column
+
+        Args:
+            query: a query in immudb SQL dialect.
+            params: a dictionary of parameters to replace in the query
+            columnNameMode: mode of the column names. Defaults to
+                COLUMN_NAME_MODE_FIELD.
+
+        Returns:
+            ColumnarResult: columns, convertible with toNumpy, toArrow and
+                toPandas
+        """
+        return await sqlquery.columnar_with_executor(query, params, columnNameMode, self._currentdb, self._stub.SQLQuery)
+
+    async def sqlQueryArrow(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_FIELD):
+        """Queries the database using SQL, returning an Arrow table.
+        Requires pyarrow.
+
+        Returns:
+            pyarrow.Table: query result
+        """
+        return (await self.sqlQueryColumnar(query, params, columnNameMode)).toArrow()
+
+    async def listTables(self):
+        """List all tables in the current database
+
+        Returns:
+            A list of table names. For example:
+
+            ['table1', 'table2']
+        """
+        resp = await self._stub.ListTables(google_dot_protobuf_dot_empty__pb2.Empty())
+        return [sqlvalue_to_py(row.values[0]) for row in resp.rows]
+
+    async def describeTable(self, table) -> List[datatypes.ColumnDescription]:
+        """Describes table provided by argument
+
+        Args:
+            table (str): Table to describe
+
+        Returns:
+            List[datatypes.ColumnDescription]: Column descriptions
+        """
+        res = await self._stub.DescribeTable(schema_pb2.Table(tableName=table.encode()))
+        return [datatypes.ColumnDescription(*[sqlvalue_to_py(v) for v in row.values[:6]])
+                for row in res.rows]
+
+    async def verifiableSQLGet(self, table: str, primaryKeys: List[datatypesv2.PrimaryKey], atTx=None, sinceTx=None) -> datatypesv2.VerifiableSQLEntry:
+        """Verifies SQL row against current state
+
+        Args:
+            table (str): Table Name
+            primaryKeys (List[datatypesv2.PrimaryKey]): List of PrimaryKeys to check
+            atTx (int): Identifier of the transaction at which point the key's
+                value should be retrieved.
+            sinceTx (int): Identifier of the earliest transaction from which the
+                key's value should be retrieved.
+
+        Returns:
+            datatypesv2.VerifiableSQLEntry: Contains all informations about just verified SQL Entry
+        """
+        state = self._rs.get()
+        req = schema_pb2.VerifiableSQLGetRequest(
+            sqlGetRequest=schema_pb2.SQLGetRequest(
+                table=table,
+                pkValues=[pk._getGRPC() for pk in primaryKeys],
+                atTx=atTx,
+                sinceTx=sinceTx
+            ),
+            proveSinceTx=state.txId
+        )
+        ventry = await self._stub.VerifiableSQLGet(req)
+        return verifiedSQLGet.verify(ventry, state, primaryKeys, self._vk, self._rs, cache=self._verifiedCache)
+
+    async def verifiableSQLGetMany(self, table: str, primaryKeysList: List[List[datatypesv2.PrimaryKey]], atTx=None, sinceTx=None, maxInFlight: int = 16) -> List[datatypesv2.VerifiableSQLEntry]:
+        """Verifies many SQL rows of a table against current state, up to
+        maxInFlight of them requested concurrently
+
+        Args:
+            table (str): Table Name
+            primaryKeysList (List[List[datatypesv2.PrimaryKey]]): primary
+                keys of every row to check
+            atTx (int): Identifier of the transaction at which point the
+                values should be retrieved.
+            sinceTx (int): Identifier of the earliest transaction from which the
+                values should be retrieved.
+            maxInFlight (int, optional): concurrent requests. Defaults to 16.
+
+        Returns:
+            List[datatypesv2.VerifiableSQLEntry]: verified entries, in the
+                order of primaryKeysList
+        """
+        state = self._rs.get()
+        rows = verifiedSQLGet.VerifiedRows(
+            state, table, self._sqlTables, self._verifiedCache)
+        pending = deque()
+        try:
+            for primaryKeys in primaryKeysList:
+                if len(pending) >= maxInFlight:
+                    call, keys = pending.popleft()
+                    rows.add(await call, keys)
+                req = verifiedSQLGet.buildRequest(
+                    table, primaryKeys, atTx, sinceTx, state)
+                pending.append((self._stub.VerifiableSQLGet(req), primaryKeys))
+            while len(pending) > 0:
+                call, keys = pending.popleft()
+                rows.add(await call, keys)
+        finally:
+            for call, _ in pending:
+                call.cancel()
+        rows.setState(self._vk, self._rs)
+        return rows.entries
@@ -0,0 +1,41 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Stub wrapper that adds headers and timeout to outgoing asyncio requests.
+
+Interceptors of a grpc.aio channel are fixed when the channel is created,
+while immudb headers (token, session, transaction) change during the life
+of a client, so headers are added per call instead.
+"""
+
+import immudb.grpc.schema_pb2_grpc as schema_pb2_grpc
+
+
+class InterceptedStub:
+    def __init__(self, channel, headers=None, timeout=None):
+        self._stub = schema_pb2_grpc.ImmuServiceStub(channel)
+        self._headers = list(headers or [])
+        self._timeout = timeout
+
+    def __getattr__(self, name):
+        method = getattr(self._stub, name)
+        headers = self._headers
+        stubTimeout = self._timeout
+
+        def call(request, timeout=None, metadata=None):
+            allMetadata = headers
+            if metadata is not None:
+                allMetadata = headers + list(metadata)
+            if timeout == None:
+                timeout = stubTimeout
+            return method(request, timeout=timeout, metadata=allMetadata)
+
+        return call
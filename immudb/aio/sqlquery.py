@@ -0,0 +1,88 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import grpc
+from immudb.columnar import ColumnarResult
+from immudb.handler.sqlquery import buildRequest, columnarResult, rowDecoder, ClosedIterator
+
+
+async def call_with_executor(query, params, columnNameMode, dbname, executor, acceptStream=False):
+    it = AsyncRowIterator(executor(buildRequest(query, params)),
+                          columnNameMode, dbname)
+    if acceptStream:
+        return it
+    return [row async for row in it]
+
+
+async def columnar_with_executor(query, params, columnNameMode, dbname, executor) -> ColumnarResult:
+    grpcIt = executor(buildRequest(query, params))
+    result = None
+    while True:
+        res = await grpcIt.read()
+        if res == grpc.aio.EOF:
+            return result
+        if result == None:
+            result = columnarResult(res, columnNameMode, dbname)
+        result.append(res.rows)
+
+
+class AsyncRowIterator:
+    def __init__(self, grpcIt, colNameMode, dbname) -> None:
+        self._grpcIt = grpcIt
+        self._nextRow = 0
+        self._rows = []
+        self._columns = None
+        self._decoder = None
+        self._colNameMode = colNameMode
+        self._dbname = dbname
+        self._closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._fetch_next()
+
+        row = self._rows[self._nextRow]
+        self._nextRow = self._nextRow+1
+        return row
+
+    async def _fetch_next(self):
+        if self._closed:
+            raise ClosedIterator
+
+        if self._nextRow < len(self._rows):
+            return
+
+        res = await self._grpcIt.read()
+        if res == grpc.aio.EOF:
+            raise StopAsyncIteration
+        if self._decoder == None:
+            self._decoder = rowDecoder(res, self._colNameMode, self._dbname)
+            self._columns = list(self._decoder.names)
+
+        self._rows = self._decoder.decode(res.rows)
+        self._nextRow = 0
+
+        if len(self._rows) == 0:
+            raise StopAsyncIteration
+
+    async def columns(self):
+        await self._fetch_next()
+        return self._columns
+
+    def close(self):
+        if self._closed:
+            raise ClosedIterator
+
+        self._grpcIt.cancel()
+        self._closed = True
@@ -0,0 +1,55 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Callable, List
+
+import grpc
+
+# upper bound of the tag and length prefix of an element of a repeated
+# protobuf field
+_FIELD_OVERHEAD = 6
+
+
+def split(items: list, sizeOf: Callable, maxSize: int) -> List[list]:
+    """Splits items in consecutive chunks whose serialized size is at most
+    maxSize. An item bigger than maxSize gets a chunk on its own.
+
+    Args:
+        items (list): items of a repeated field
+        sizeOf (Callable): serialized size of an item
+        maxSize (int): maximum size of a chunk, None or 0 for a single chunk
+
+    Returns:
+        List[list]: chunks, at least one
+    """
+    if not maxSize:
+        return [items]
+    chunks = []
+    chunk = []
+    size = 0
+    for item in items:
+        itemSize = sizeOf(item) + _FIELD_OVERHEAD
+        if len(chunk) > 0 and size + itemSize > maxSize:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(item)
+        size += itemSize
+    if len(chunk) > 0 or len(chunks) == 0:
+        chunks.append(chunk)
+    return chunks
+
+
+def isResourceExhausted(error: Exception) -> bool:
+    """Checks if a GRPC call failed because a message was too big
+    """
+    return isinstance(error, grpc.Call) and error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
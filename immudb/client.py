@@ -11,6 +11,7 @@
 # limitations under the License.
 
 from io import BytesIO
+from concurrent.futures import Future
 from typing import Dict, Generator, List, Tuple, Union
 import grpc
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
@@ -24,14 +25,23 @@ from immudb.handler import (batchGet, batchSet, changePassword, changePermission
                             get, listUsers, sqldescribe, verifiedGet, verifiedSet, setValue, history,
                             scan, reference, verifiedreference, zadd, verifiedzadd,
                             zscan, healthcheck, health, txbyid, verifiedtxbyid, sqlexec, sqlquery,
-                            listtables, execAll, transaction, verifiedSQLGet)
+                            listtables, execAll, transaction, verifiedSQLGet, verifiedBatchGet, verifiedStreamGet,
+                            verifiedTxStream, cursors, bulkInsert)
 
 from immudb.handler.verifiedtxbyid import verify as verifyTransaction
 from immudb.rootService import *
+from immudb.rootService import _AdvanceOnlyRootService
+from immudb.verifiedcache import VerifiedTxCache
+from immudb.pipeline import WritePipeline
+from immudb import scanpartition
+from immudb.cursor import HistoryCursor, ScanCursor, TxScanCursor
+from immudb.columnar import ColumnarResult
+from immudb.prepared import PreparedStatement
 from immudb.grpc import schema_pb2_grpc
 import warnings
 import ecdsa
 from immudb.datatypes import DeleteKeysRequest
+from immudb.embedded import store
 from immudb.embedded.store import KVMetadata
 import threading
 import queue
@@ -39,13 +49,14 @@ import immudb.datatypesv2 as datatypesv2
 import immudb.dataconverter as dataconverter
 
 import datetime
+import os
 
-from immudb.streamsutils import AtTXHeader, KeyHeader, ProvenSinceHeader, ScoreHeader, SetHeader, StreamReader, ValueChunk, ValueChunkHeader, BufferedStreamReader, VerifiedGetStreamReader, ZScanStreamReader
+from immudb.streamsutils import AtTXHeader, KeyHeader, ProvenSinceHeader, ScoreHeader, SetHeader, StreamReader, ValueChunk, ValueChunkHeader, BufferedStreamReader, VerifiedBufferedStreamReader, VerifiedGetStreamReader, ZScanStreamReader, makeSetStream, makeVerifiableSetStream, makeExecAllStream, mapFile
 
 
 class ImmudbClient:
 
-    def __init__(self, immudUrl=None, rs: RootService = None, publicKeyFile: str = None, timeout=None, max_grpc_message_length=None):
+    def __init__(self, immudUrl=None, rs: RootService = None, publicKeyFile: str = None, timeout=None, max_grpc_message_length=None, channelOptions: list = None, verifiedCacheSize: int = 1024, verifiedCache: VerifiedTxCache = None, maxInFlightWrites: int = 64, maxRequestSize: int = None, rawResponses: bool = False):
         """immudb Client
 
         Args:
@@ -61,14 +72,34 @@ class ImmudbClient:
                 will hang until the server responds if no timeout is set.
             max_grpc_message_length (int, optional): maximum size of message the
                 server should send. The default (4Mb) is used is no value is set.
+            verifiedCacheSize (int, optional): number of verified transactions
+                remembered to skip proofs between already trusted transactions.
+                Defaults to 1024, 0 disables the cache.
+            verifiedCache (VerifiedTxCache, optional): cache of verified
+                transactions to use instead of a new one, e.g. a
+                :class:`TrustedTxIndex` persisting it between runs. It is
+                not cleared when logging in or switching database.
+            maxInFlightWrites (int, optional): maximum number of writes sent
+                with the ``*Future`` methods waiting for a response.
+                Defaults to 64.
+            maxRequestSize (int, optional): serialized size above which
+                setAll, getAll and execAll are split into several requests,
+                e.g. ``constants.MAX_REQUEST_SIZE``. Split writes are not
+                atomic. Defaults to None, sending a single request.
+            rawResponses (bool, optional): if True, methods returning
+                datatypesv2 dataclasses return the protobuf messages instead,
+                skipping their conversion. Defaults to False.
+            channelOptions (list, optional): additional ``(key, value)``
+                options for the GRPC channel.
         """
         if immudUrl is None:
             immudUrl = "localhost:3322"
         self.timeout = timeout
-        options = []
+        options = list(channelOptions or [])
         if max_grpc_message_length:
-            options = [('grpc.max_receive_message_length',
-                        max_grpc_message_length)]
+            options.append(('grpc.max_receive_message_length',
+                            max_grpc_message_length))
+        if options:
             self.channel = grpc.insecure_channel(immudUrl, options=options)
         else:
             self.channel = grpc.insecure_channel(immudUrl)
@@ -80,9 +111,24 @@ class ImmudbClient:
         self._url = immudUrl
         self._vk = None
         self._currentdb = None
+        # only the cache owned by the client is reset on a new trusted state
+        self._ownVerifiedCache = verifiedCache is None
+        if verifiedCache is None:
+            verifiedCache = VerifiedTxCache(verifiedCacheSize)
+        self._verifiedCache = verifiedCache
+        # SQL table metadata by (database, table), see verifiableSQLGetMany
+        self._sqlTables = dict()
+        self._pipeline = WritePipeline(maxInFlightWrites)
+        self._maxRequestSize = maxRequestSize
+        self._rawResponses = rawResponses
         if publicKeyFile:
             self.loadKey(publicKeyFile)
 
+    def _convertResponse(self, resp):
+        if self._rawResponses:
+            return resp
+        return dataconverter.convertResponse(resp)
+
     def loadKey(self, kfile: str):
         """Loads public key from path
 
@@ -103,6 +149,7 @@ class ImmudbClient:
     def shutdown(self):
         """Shutdowns client
         """
+        self._pipeline.shutdown()
         self.channel.close()
         self.channel = None
         self.intercept_channel.close
@@ -217,6 +264,8 @@ class ImmudbClient:
         self._stub = self._set_token_header_interceptor(resp)
 
         self._rs.init("{}/{}".format(self._url, database), self._stub)
+        if self._ownVerifiedCache:
+            self._verifiedCache.clear()
         self._currentdb = convertedDatabase
         return login_response
 
@@ -437,7 +486,7 @@ class ImmudbClient:
         request = datatypesv2.CreateDatabaseRequest(
             name=name, settings=settings, ifNotExists=ifNotExists)
         resp = self._stub.CreateDatabaseV2(request._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def databaseListV2(self) -> datatypesv2.DatabaseListResponseV2:
         """Lists databases
@@ -447,7 +496,7 @@ class ImmudbClient:
         """
         req = datatypesv2.DatabaseListRequestV2()
         resp = self._stub.DatabaseListV2(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def loadDatabase(self, database: str) -> datatypesv2.LoadDatabaseResponse:
         """Loads database provided with argument
@@ -460,7 +509,7 @@ class ImmudbClient:
         """
         req = datatypesv2.LoadDatabaseRequest(database)
         resp = self._stub.LoadDatabase(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def unloadDatabase(self, database: str) -> datatypesv2.UnloadDatabaseResponse:
         """Unloads provided database
@@ -473,7 +522,7 @@ class ImmudbClient:
         """
         req = datatypesv2.UnloadDatabaseRequest(database)
         resp = self._stub.UnloadDatabase(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def deleteDatabase(self, database: str) -> datatypesv2.DeleteDatabaseResponse:
         """Deletes database provided with argument. Database needs to be unloaded first
@@ -486,7 +535,7 @@ class ImmudbClient:
         """
         req = datatypesv2.DeleteDatabaseResponse(database)
         resp = self._stub.DeleteDatabase(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def updateDatabaseV2(self, database: str, settings: datatypesv2.DatabaseSettingsV2) -> datatypesv2.UpdateDatabaseResponseV2:
         """Updates database with provided argument
@@ -500,7 +549,7 @@ class ImmudbClient:
         """
         request = datatypesv2.UpdateDatabaseRequest(database, settings)
         resp = self._stub.UpdateDatabaseV2(request._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def useDatabase(self, dbName: bytes):
         """Switches database
@@ -514,6 +563,8 @@ class ImmudbClient:
         # modifies header token accordingly
         self._stub = self._set_token_header_interceptor(resp)
         self._rs.init(dbName, self._stub)
+        if self._ownVerifiedCache:
+            self._verifiedCache.clear()
         self._currentdb = dbName
         return resp
 
@@ -525,7 +576,7 @@ class ImmudbClient:
         """
         req = datatypesv2.DatabaseSettingsRequest()
         resp = self._stub.GetDatabaseSettingsV2(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def setActiveUser(self, active: bool, username: str) -> bool:
         """Sets user as active or not active
@@ -561,7 +612,7 @@ class ImmudbClient:
         """
         req = datatypesv2.FlushIndexRequest(cleanupPercentage, synced)
         resp = self._stub.FlushIndex(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def compactIndex(self):
         """Start full async index compaction.
@@ -608,6 +659,20 @@ class ImmudbClient:
         """
         return setValue.call(self._stub, self._rs, key, value)
 
+    def setFuture(self, key: bytes, value: bytes) -> Future:
+        """Sets key into value in database without waiting for the response.
+
+        Blocks only while ``maxInFlightWrites`` writes are pending.
+
+        Args:
+            key (bytes): key
+            value (bytes): value
+
+        Returns:
+            Future: future of the SetResponse
+        """
+        return setValue.future(self._stub, self._rs, self._pipeline, key, value)
+
     def verifiedSet(self, key: bytes, value: bytes) -> datatypes.SetResponse:
         """Sets key into value in database, and additionally checks it with state saved before
 
@@ -618,7 +683,22 @@ class ImmudbClient:
         Returns:
             SetResponse: response of request
         """
-        return verifiedSet.call(self._stub, self._rs, key, value, self._vk)
+        return verifiedSet.call(self._stub, self._rs, key, value, self._vk, cache=self._verifiedCache)
+
+    def verifiedSetFuture(self, key: bytes, value: bytes) -> Future:
+        """Sets key into value in database without waiting for the response.
+        The response is checked with the state saved before on a background
+        thread, and the future fails with ErrCorruptedData if it does not
+        verify.
+
+        Args:
+            key (bytes): key
+            value (bytes): value
+
+        Returns:
+            Future: future of the SetResponse
+        """
+        return verifiedSet.future(self._stub, _AdvanceOnlyRootService(self._rs), self._pipeline, key, value, self._vk, cache=self._verifiedCache)
 
     def expireableSet(self, key: bytes, value: bytes, expiresAt: datetime.datetime) -> datatypes.SetResponse:
         """Sets key into value in database with additional expiration
@@ -668,7 +748,7 @@ class ImmudbClient:
             SafeGetResponse: Contains information about the transaction
                 and the verified state.
         """
-        return verifiedGet.call(self._stub, self._rs, key, verifying_key=self._vk, atRevision=atRevision)
+        return verifiedGet.call(self._stub, self._rs, key, verifying_key=self._vk, atRevision=atRevision, cache=self._verifiedCache)
 
     def verifiedGetSince(self, key: bytes, sinceTx: int) -> datatypes.SafeGetResponse:
         """Get value for key since a given transaction (and wait if that transaction is not yet indexed).
@@ -686,7 +766,7 @@ class ImmudbClient:
         Returns:
             datatypes.SafeGetResponse: object that contains informations about transaction and verified state
         """
-        return verifiedGet.call(self._stub, self._rs, key, sinceTx=sinceTx, verifying_key=self._vk)
+        return verifiedGet.call(self._stub, self._rs, key, sinceTx=sinceTx, verifying_key=self._vk, cache=self._verifiedCache)
 
     def verifiedGetAt(self, key: bytes, atTx: int) -> datatypes.SafeGetResponse:
         """Get value for key at a given transaction point.
@@ -699,7 +779,7 @@ class ImmudbClient:
         Returns:
             datatypes.SafeGetResponse: object that contains informations about transaction and verified state
         """
-        return verifiedGet.call(self._stub, self._rs, key, atTx, self._vk)
+        return verifiedGet.call(self._stub, self._rs, key, atTx, self._vk, cache=self._verifiedCache)
 
     def history(self, key: bytes, offset: int, limit: int, sortorder: bool) -> List[datatypes.historyResponseItem]:
         """Returns history of values for a given key.
@@ -751,7 +831,7 @@ class ImmudbClient:
         Returns:
             datatypes.SetResponse: Set response contains transaction id
         """
-        return verifiedzadd.call(self._stub, self._rs, zset, score, key, atTx, self._vk)
+        return verifiedzadd.call(self._stub, self._rs, zset, score, key, atTx, self._vk, cache=self._verifiedCache)
 
     def scan(self, key: bytes, prefix: bytes, desc: bool, limit: int, sinceTx: int = None) -> Dict[bytes, bytes]:
         """Scans for provided parameters. Limit for scan is fixed - 1000. You need to introduce pagination.
@@ -813,7 +893,29 @@ class ImmudbClient:
         Returns:
             List[bytes]: Keys list modified in queried transaction
         """
-        return verifiedtxbyid.call(self._stub, self._rs, tx, self._vk)
+        return verifiedtxbyid.call(self._stub, self._rs, tx, self._vk, cache=self._verifiedCache)
+
+    def verifiedTxStream(self, fromTx: int = 1, batchSize: int = 100, follow: bool = False, pollInterval: float = 1.0) -> Generator[store.Tx, None, None]:
+        """Yields verified transactions starting from fromTx.
+
+        Transactions are fetched with txScan in batches of batchSize: their
+        entries are checked against the transaction hash trees, and only the
+        last transaction of every batch is proven against the saved state,
+        which then advances once per batch.
+
+        Args:
+            fromTx (int, optional): first transaction id. Defaults to 1.
+            batchSize (int, optional): transactions fetched (and proven) at
+                once. Defaults to 100.
+            follow (bool, optional): if `True`, waits for new transactions
+                instead of stopping at the last committed one.
+            pollInterval (float, optional): seconds between polls when
+                following. Defaults to 1.
+
+        Yields:
+            Generator[store.Tx, None, None]: verified transactions
+        """
+        return verifiedTxStream.call(self._stub, self._rs, fromTx, batchSize, follow, pollInterval, self._vk, cache=self._verifiedCache)
 
     def txScan(self, initialTx: int, limit: int = 999, desc: bool = False, entriesSpec: datatypesv2.EntriesSpec = None, sinceTx: int = 0, noWait: bool = False) -> datatypesv2.TxList:
         """Scans for transactions with specified parameters
@@ -833,7 +935,7 @@ class ImmudbClient:
         req = datatypesv2.TxScanRequest(
             initialTx, limit, desc, entriesSpec, sinceTx, noWait)
         resp = self._stub.TxScan(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def serverInfo(self) -> datatypesv2.ServerInfoResponse:
         """Returns server info containing version
@@ -843,7 +945,7 @@ class ImmudbClient:
         """
         req = datatypesv2.ServerInfoRequest()
         resp = self._stub.ServerInfo(req._getGRPC())
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def databaseHealth(self) -> datatypesv2.DatabaseHealthResponse:
         """Returns information about database health (pending requests, last request completion timestamp)
@@ -853,18 +955,35 @@ class ImmudbClient:
         """
         req = google_dot_protobuf_dot_empty__pb2.Empty()
         resp = self._stub.DatabaseHealth(req)
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def setAll(self, kv: Dict[bytes, bytes]) -> datatypes.SetResponse:
         """Sets all values for corresponding keys from dictionary
 
+        If the client has a ``maxRequestSize``, bigger dictionaries are split
+        and written concurrently in several transactions, so they are not
+        written atomically anymore.
+
         Args:
             kv (Dict[bytes, bytes]): dictionary of keys and values
 
         Returns:
             datatypes.SetResponse: Set response contains transaction id
+                (the highest one if the dictionary was split)
         """
-        return batchSet.call(self._stub, self._rs, kv)
+        return batchSet.call(self._stub, self._rs, kv, self._maxRequestSize)
+
+    def setAllFuture(self, kv: Dict[bytes, bytes]) -> Future:
+        """Sets all values for corresponding keys from dictionary without
+        waiting for the response
+
+        Args:
+            kv (Dict[bytes, bytes]): dictionary of keys and values
+
+        Returns:
+            Future: future of the SetResponse
+        """
+        return batchSet.future(self._stub, self._rs, self._pipeline, kv)
 
     def getAll(self, keys: List[bytes]) -> Dict[bytes, bytes]:
         """Returns values for specified keys
@@ -875,9 +994,24 @@ class ImmudbClient:
         Returns:
             Dict[bytes, bytes]: Dictionary of key : value pairs
         """
-        resp = batchGet.call(self._stub, self._rs, keys)
+        resp = batchGet.call(self._stub, self._rs, keys, self._maxRequestSize)
         return {key: value.value for key, value in resp.items()}
 
+    def verifiedGetAll(self, keys: List[bytes]) -> Dict[bytes, datatypes.SafeGetResponse]:
+        """Returns values for specified keys, verified against saved state.
+
+        Keys are grouped by the transaction they were written in; every
+        transaction is fetched and checked once, and only the highest one
+        is proven against the saved state, which is then updated once.
+
+        Args:
+            keys (List[bytes]): Keys list
+
+        Returns:
+            Dict[bytes, datatypes.SafeGetResponse]: Dictionary of key : verified response
+        """
+        return verifiedBatchGet.call(self._stub, self._rs, keys, verifying_key=self._vk, cache=self._verifiedCache, maxRequestSize=self._maxRequestSize)
+
     def delete(self, req: DeleteKeysRequest) -> TxHeader:
         """Deletes key
 
@@ -892,14 +1026,36 @@ class ImmudbClient:
     def execAll(self, ops: List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]], noWait=False) -> TxHeader:
         """Exectues all operations from list (KeyValue, ZAddRequest, ReferenceRequest)
 
+        If the client has a ``maxRequestSize``, bigger lists are split and
+        executed in order in several transactions, so they are not executed
+        atomically anymore.
+
         Args:
             ops (List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]]): List of operations
             noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None. Defaults to False.
 
         Returns:
-            TxHeader: Transaction header
+            TxHeader: Transaction header (of the last transaction if the list was split)
         """
-        return execAll.call(self._stub, self._rs, ops, noWait)
+        return execAll.call(self._stub, self._rs, ops, noWait, self._maxRequestSize)
+
+    def execAllFuture(self, ops: List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]], noWait=False) -> Future:
+        """Exectues all operations from list without waiting for the response
+
+        Args:
+            ops (List[Union[datatypes.KeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]]): List of operations
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to False.
+
+        Returns:
+            Future: future of the transaction header
+        """
+        return execAll.future(self._stub, self._rs, self._pipeline, ops, noWait)
+
+    def flushWrites(self):
+        """Waits until all the writes sent with the ``*Future`` methods are
+        completed
+        """
+        self._pipeline.drain()
 
     def setReference(self, referredkey: bytes, newkey:  bytes) -> TxHeader:
         """References key specified by referredkey as newkey
@@ -923,7 +1079,7 @@ class ImmudbClient:
         Returns:
             TxHeader: Transaction header
         """
-        return verifiedreference.call(self._stub, self._rs, referredkey, newkey, verifying_key=self._vk)
+        return verifiedreference.call(self._stub, self._rs, referredkey, newkey, verifying_key=self._vk, cache=self._verifiedCache)
 
     def _rawStreamGet(self, key: bytes, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> Generator[Union[KeyHeader, ValueChunk], None, None]:
         """Helper function that creates generator of chunks from raw GRPC stream
@@ -964,6 +1120,40 @@ class ImmudbClient:
             valueHeader = next(chunks)
             return keyHeader.key, BufferedStreamReader(chunks, valueHeader, resp)
 
+    def streamGetToFile(self, key: bytes, path: str, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> bytes:
+        """Streams a value straight into a file, chunk by chunk, without
+        holding the value in memory. The file is removed if the stream fails.
+
+        Args:
+            key (bytes): Key to get
+            path (str): Destination file path, truncated if it exists
+            atTx (int, optional): Get key at transaction id. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+            atRevision (int, optional): Returns value of key at specified revision. -1 to get relative revision. Defaults to None.
+
+        Returns:
+            bytes: key of the value (the referenced key, when key is a reference)
+        """
+        req = datatypesv2.KeyRequest(
+            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision)
+        resp = self._stub.streamGet(req._getGRPC())
+        chunks = StreamReader(resp).chunks()
+        keyHeader = next(chunks, None)
+        if keyHeader == None:
+            return None
+        try:
+            # unbuffered: every chunk goes straight to the file descriptor
+            with open(path, "wb", buffering=0) as f:
+                for chunk in chunks:
+                    f.write(chunk.chunk)
+        except BaseException:
+            resp.cancel()
+            if os.path.exists(path):
+                os.unlink(path)
+            raise
+        return keyHeader.key
+
     def streamGetFull(self, key: bytes, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> datatypesv2.KeyValue:
         """Streaming method to get full value
 
@@ -982,13 +1172,11 @@ class ImmudbClient:
         resp = self._stub.streamGet(req._getGRPC())
         reader = StreamReader(resp)
         key = None
-        value = b''
         chunks = reader.chunks()
         chunk = next(chunks, None)
         if chunk != None:
             key = chunk.key
-            for it in chunks:
-                value += it.chunk
+            value = b''.join([it.chunk for it in chunks])
             return datatypesv2.KeyValue(key, value)
 
     def streamVerifiedGet(self, key: bytes = None, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> datatypes.SafeGetResponse:
@@ -1007,37 +1195,54 @@ class ImmudbClient:
         Returns:
             datatypes.SafeGetResponse: Response contains informations about verification
         """
-        state = self._rs.get()
-        proveSinceTx = state.txId
-        req = datatypesv2.VerifiableGetRequest(keyRequest=datatypesv2.KeyRequest(
-            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision), proveSinceTx=proveSinceTx)
-        resp = self._stub.streamVerifiableGet(req._getGRPC())
-        reader = VerifiedGetStreamReader(resp)
-        chunks = reader.chunks()
-        key = next(chunks, None)
-        value = b''
-        if key != None:
-            verifiableTx = next(chunks)
-            inclusionProof = next(chunks)
-            for chunk in chunks:
-                value += chunk.chunk
-            verified = verifyTransaction(
-                verifiableTx, state, self._vk, self._rs)
-            if (len(verified) == 0):
-                raise ErrCorruptedData
+        opened = self._openVerifiedStream(
+            key, atTx, sinceTx, noWait, atRevision)
+        if opened != None:
+            keyHeader, verifiableTx, reader = opened
+            value = reader.read()
             return datatypes.SafeGetResponse(
                 id=verifiableTx.tx.header.id,
-                key=key.key,
+                key=keyHeader.key,
                 value=value,
                 timestamp=verifiableTx.tx.header.ts,
                 verified=True,
-                refkey=key.refKey,
+                refkey=keyHeader.refKey,
                 revision=atRevision
             )
 
+    def _openVerifiedStream(self, key: bytes, atTx: int, sinceTx: int, noWait: bool, atRevision: int) -> Tuple[KeyHeader, schema_pb2.VerifiableTx, VerifiedBufferedStreamReader]:
+        """Helper function that opens a verifiable stream, checks the proofs
+        sent ahead of the value and returns a reader verifying the value
+
+        Returns:
+            Tuple[KeyHeader, schema_pb2.VerifiableTx, VerifiedBufferedStreamReader]: key header,
+            transaction and reader of the value (None if no entry was sent)
+        """
+        state = self._rs.get()
+        proveSinceTx = state.txId
+        req = datatypesv2.VerifiableGetRequest(keyRequest=datatypesv2.KeyRequest(
+            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision), proveSinceTx=proveSinceTx)
+        resp = self._stub.streamVerifiableGet(req._getGRPC())
+        reader = VerifiedGetStreamReader(resp)
+        chunks = reader.chunks()
+        keyHeader = next(chunks, None)
+        if keyHeader == None:
+            return None
+        verifiableTx = next(chunks)
+        inclusionProof = next(chunks)
+        verifier = verifiedStreamGet.ValueVerifier(
+            keyHeader.entry, verifiableTx, inclusionProof, state, self._vk, self._rs, cache=self._verifiedCache)
+        valueHeader = next(chunks)
+        return keyHeader, verifiableTx, VerifiedBufferedStreamReader(chunks, valueHeader, resp, verifier)
+
     def streamVerifiedGetBuffered(self, key: bytes = None, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> Tuple[datatypes.SafeGetResponse, BufferedStreamReader]:
         """Gets a value of a key with streaming method, and verifies transaction. Value is represented as BufferedStreamReader
 
+        Proofs are checked before returning, the value is hashed while it is
+        read and verified when its last byte is read: that read raises
+        ErrCorruptedData if the value does not match. The local state is
+        updated only then.
+
         Args:
             key (bytes): Key to get
             atTx (int, optional): Get key at transaction id. Defaults to None.
@@ -1051,32 +1256,66 @@ class ImmudbClient:
         Returns:
             Tuple[datatypes.SafeGetResponse, BufferedStreamReader]: First element is safe get response without value, second is a buffer that you can read from
         """
-        state = self._rs.get()
-        proveSinceTx = state.txId
-        req = datatypesv2.VerifiableGetRequest(keyRequest=datatypesv2.KeyRequest(
-            key=key, atTx=atTx, sinceTx=sinceTx, noWait=noWait, atRevision=atRevision), proveSinceTx=proveSinceTx)
-        resp = self._stub.streamVerifiableGet(req._getGRPC())
-        reader = VerifiedGetStreamReader(resp)
-        chunks = reader.chunks()
-        key = next(chunks, None)
-        if key != None:
-            verifiableTx = next(chunks)
-            inclusionProof = next(chunks)
-            verified = verifyTransaction(
-                verifiableTx, state, self._vk, self._rs)
-            if (len(verified) == 0):
-                raise ErrCorruptedData
+        opened = self._openVerifiedStream(
+            key, atTx, sinceTx, noWait, atRevision)
+        if opened != None:
+            keyHeader, verifiableTx, reader = opened
             toRet = datatypes.SafeGetResponse(
                 id=verifiableTx.tx.header.id,
-                key=key.key,
+                key=keyHeader.key,
                 value=None,
                 timestamp=verifiableTx.tx.header.ts,
                 verified=True,
-                refkey=key.refKey,
+                refkey=keyHeader.refKey,
                 revision=atRevision
             )
-            valueHeader = next(chunks)
-            return toRet, BufferedStreamReader(chunks, valueHeader, resp)
+            return toRet, reader
+
+    def streamVerifiedGetToFile(self, key: bytes, path: str, atTx: int = None, sinceTx: int = None, noWait: bool = None, atRevision: int = None) -> datatypes.SafeGetResponse:
+        """Streams a value into a file and verifies it, with bounded memory.
+        The file is removed if the stream fails or the value does not verify.
+
+        Args:
+            key (bytes): Key to get
+            path (str): Destination file path, truncated if it exists
+            atTx (int, optional): Get key at transaction id. Defaults to None.
+            sinceTx (int, optional): immudb will wait for transaction provided by sinceTx. Defaults to None.
+            noWait (bool, optional): Doesn't wait for the index to be fully generated. Defaults to None.
+            atRevision (int, optional): Returns value of key at specified revision. -1 to get relative revision. Defaults to None.
+
+        Raises:
+            ErrCorruptedData: When data is corrupted or unverifiable
+
+        Returns:
+            datatypes.SafeGetResponse: Response without value
+        """
+        opened = self._openVerifiedStream(
+            key, atTx, sinceTx, noWait, atRevision)
+        if opened == None:
+            return None
+        keyHeader, verifiableTx, reader = opened
+        try:
+            with open(path, "wb", buffering=0) as f:
+                buffer = bytearray(65536)
+                view = memoryview(buffer)
+                readed = reader.readinto(buffer)
+                while readed:
+                    f.write(view[:readed])
+                    readed = reader.readinto(buffer)
+        except BaseException:
+            reader.close()
+            if os.path.exists(path):
+                os.unlink(path)
+            raise
+        return datatypes.SafeGetResponse(
+            id=verifiableTx.tx.header.id,
+            key=keyHeader.key,
+            value=None,
+            timestamp=verifiableTx.tx.header.ts,
+            verified=True,
+            refkey=keyHeader.refKey,
+            revision=atRevision
+        )
 
     def streamHistory(self, key: bytes, offset: int = None, sinceTx: int = None, limit: int = None, desc: bool = None) -> Generator[datatypesv2.KeyValue, None, None]:
         """Streams history of key
@@ -1099,14 +1338,14 @@ class ImmudbClient:
         for chunk in StreamReader(resp).chunks():
             if isinstance(chunk, KeyHeader):
                 if key != None:
-                    yield datatypesv2.KeyValue(key=key, value=value, metadata=None)
+                    yield datatypesv2.KeyValue(key=key, value=b''.join(value), metadata=None)
                 key = chunk.key
-                value = b''
+                value = []
             else:
-                value += chunk.chunk
+                value.append(chunk.chunk)
 
         if key != None and value != None:  # situation when generator consumes all at first run, so it didn't yield first value
-            yield datatypesv2.KeyValue(key=key, value=value, metadata=None)
+            yield datatypesv2.KeyValue(key=key, value=b''.join(value), metadata=None)
 
     def streamHistoryBuffered(self, key: bytes, offset: int = None, sinceTx: int = None, limit: int = None, desc: bool = None) -> Generator[Tuple[datatypesv2.KeyValue, BufferedStreamReader], None, None]:
         """Streams history of key
@@ -1146,18 +1385,10 @@ class ImmudbClient:
             length (int): Length of buffer
             chunkSize (int, optional): Chunk size to set while streaming. Defaults to 65536.
 
-        Yields:
+        Returns:
             Generator[Chunk, None, None]: Chunk that is cmpatible with proto
         """
-        yield Chunk(content=KeyHeader(key=key, length=len(key)).getInBytes())
-        firstChunk = buffer.read(chunkSize)
-        firstChunk = ValueChunkHeader(
-            chunk=firstChunk, length=length).getInBytes()
-        yield Chunk(content=firstChunk)
-        chunk = buffer.read(chunkSize)
-        while chunk:
-            yield Chunk(content=chunk)
-            chunk = buffer.read(chunkSize)
+        return makeSetStream(buffer, key, length, chunkSize)
 
     def _make_verifiable_set_stream(self, buffer, key: bytes, length: int, provenSinceTx: int = None, chunkSize: int = 65536):
         """Helper function to create stream from provided buffer
@@ -1169,20 +1400,10 @@ class ImmudbClient:
             provenSinceTx (int): Prove since this transaction id
             chunkSize (int, optional): Chunk size. Defaults to 65536.
 
-        Yields:
+        Returns:
             Generator[Chunk, None, None]: Yields GRPC chunks
         """
-        header = ProvenSinceHeader(provenSinceTx)
-        yield Chunk(content=header.getInBytes())
-        yield Chunk(content=KeyHeader(key=key, length=len(key)).getInBytes())
-        firstChunk = buffer.read(chunkSize)
-        firstChunk = ValueChunkHeader(
-            chunk=firstChunk, length=length).getInBytes()
-        yield Chunk(content=firstChunk)
-        chunk = buffer.read(chunkSize)
-        while chunk:
-            yield Chunk(content=chunk)
-            chunk = buffer.read(chunkSize)
+        return makeVerifiableSetStream(buffer, key, length, provenSinceTx, chunkSize)
 
     def streamZScanBuffered(self, set: bytes = None, seekKey: bytes = None,
                             seekScore: float = None, seekAtTx: int = None, inclusiveSeek: bool = None, limit: int = None,
@@ -1285,9 +1506,9 @@ class ImmudbClient:
         for chunk in ZScanStreamReader(resp).chunks():
             if isinstance(chunk, SetHeader):
                 if set != None:
-                    yield datatypesv2.ZScanEntry(set=set, key=key, value=value, score=score, atTx=atTx)
+                    yield datatypesv2.ZScanEntry(set=set, key=key, value=b''.join(value), score=score, atTx=atTx)
                 set = chunk.set
-                value = b''
+                value = []
                 atTx = None
                 score = None
                 key = None
@@ -1302,10 +1523,10 @@ class ImmudbClient:
                 atTx = chunk.seenAtTx
 
             else:
-                value += chunk.chunk
+                value.append(chunk.chunk)
 
         if key != None and value != None:  # situation when generator consumes all at first run, so it didn't yield first value
-            yield datatypesv2.ZScanEntry(set=set, key=key, value=value, score=score, atTx=atTx)
+            yield datatypesv2.ZScanEntry(set=set, key=key, value=b''.join(value), score=score, atTx=atTx)
 
     def streamScan(self, seekKey: bytes = None, endKey: bytes = None, prefix: bytes = None, desc: bool = None, limit: int = None, sinceTx: int = None, noWait: bool = None, inclusiveSeek: bool = None, inclusiveEnd: bool = None, offset: int = None) -> Generator[datatypesv2.KeyValue, None, None]:
         """Scan method in streaming maneer
@@ -1326,21 +1547,21 @@ class ImmudbClient:
             Generator[datatypesv2.KeyValue, None, None]: Returns generator of KeyValue
         """
         req = datatypesv2.ScanRequest(seekKey=seekKey, endKey=endKey, prefix=prefix, desc=desc, limit=limit,
-                                      sinceTx=sinceTx, noWait=noWait, inclusiveSeek=None, inclusiveEnd=None, offset=None)
+                                      sinceTx=sinceTx, noWait=noWait, inclusiveSeek=inclusiveSeek, inclusiveEnd=inclusiveEnd, offset=offset)
         resp = self._stub.streamScan(req._getGRPC())
         key = None
         value = None
         for chunk in StreamReader(resp).chunks():
             if isinstance(chunk, KeyHeader):
                 if key != None:
-                    yield datatypesv2.KeyValue(key=key, value=value, metadata=None)
+                    yield datatypesv2.KeyValue(key=key, value=b''.join(value), metadata=None)
                 key = chunk.key
-                value = b''
+                value = []
             else:
-                value += chunk.chunk
+                value.append(chunk.chunk)
 
         if key != None and value != None:  # situation when generator consumes all at first run, so it didn't yield first value
-            yield datatypesv2.KeyValue(key=key, value=value, metadata=None)
+            yield datatypesv2.KeyValue(key=key, value=b''.join(value), metadata=None)
 
     def streamScanBuffered(self, seekKey: bytes = None, endKey: bytes = None, prefix: bytes = None, desc: bool = None, limit: int = None, sinceTx: int = None, noWait: bool = None, inclusiveSeek: bool = None, inclusiveEnd: bool = None, offset: int = None) -> Generator[Tuple[bytes, BufferedStreamReader], None, None]:
         """Scan method in streaming maneer. Differs from streamScan with method to read from buffer also.
@@ -1380,6 +1601,107 @@ class ImmudbClient:
                 yield key, BufferedStreamReader(chunks, valueHeader, resp)
             chunk = next(chunks, None)
 
+    def scanCursor(self, cursor: ScanCursor, pageSize: int = 1000) -> Generator[datatypesv2.Entry, None, None]:
+        """Scans keys from the position of cursor, advancing it.
+
+        The scan is pinned to the current transaction of the server when
+        the cursor is first used: keys changed later are returned with their value at that
+        transaction, keys created later are skipped (keys deleted later
+        are not returned by the server anymore). The cursor can be
+        saved at any time and used again, even from another process, to
+        resume the scan after the last returned key.
+
+        Args:
+            cursor (ScanCursor): position of the scan, e.g. ``ScanCursor(prefix=b"x")``
+            pageSize (int, optional): keys read per request. Defaults to 1000.
+
+        Yields:
+            Generator[datatypesv2.Entry, None, None]: entries, ordered by key
+        """
+        return cursors.scan(self._stub, cursor, pageSize, self._rawResponses)
+
+    def historyCursor(self, cursor: HistoryCursor, pageSize: int = 1000) -> Generator[datatypesv2.Entry, None, None]:
+        """Returns the revisions of a key, oldest first, from the position
+        of cursor, advancing it. Revisions after the transaction the cursor
+        was pinned to are not returned.
+
+        Args:
+            cursor (HistoryCursor): position, e.g. ``HistoryCursor(key=b"x")``
+            pageSize (int, optional): revisions read per request. Defaults to 1000.
+
+        Yields:
+            Generator[datatypesv2.Entry, None, None]: revisions of the key
+        """
+        return cursors.history(self._stub, cursor, pageSize, self._rawResponses)
+
+    def txScanCursor(self, cursor: TxScanCursor, pageSize: int = 100) -> Generator[datatypesv2.Tx, None, None]:
+        """Returns transactions from the position of cursor up to the one
+        the cursor was pinned to, advancing it.
+
+        Args:
+            cursor (TxScanCursor): position, e.g. ``TxScanCursor(nextTx=1)``
+            pageSize (int, optional): transactions read per request. Defaults to 100.
+
+        Yields:
+            Generator[datatypesv2.Tx, None, None]: transactions
+        """
+        return cursors.txScan(self._stub, cursor, pageSize, self._rawResponses)
+
+    def parallelScan(self, prefix: bytes = b'', partitions: int = 4, ordered: bool = True, sinceTx: int = None, noWait: bool = None, pageSize: int = 1000, bufferSize: int = 1024) -> Generator[datatypesv2.KeyValue, None, None]:
+        """Scans all the keys with prefix, reading partitions of the key
+        range concurrently.
+
+        The range between the first and the last key with prefix is split in
+        partitions of about the same width, each one scanned (pages of
+        pageSize keys) with streamScan on its own thread.
+
+        Args:
+            prefix (bytes, optional): Key prefix. Defaults to all keys.
+            partitions (int, optional): number of concurrent scans. Defaults to 4.
+            ordered (bool, optional): if `True`, keys are yielded in
+                ascending order; otherwise as soon as any partition reads
+                them, e.g. for aggregations. Defaults to True.
+            sinceTx (int, optional): transaction every request waits for
+                the index to include. This is not a snapshot: partitions
+                can see writes and deletions committed after it while the
+                scan runs. Defaults to the current transaction of the
+                server.
+            noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to None.
+            pageSize (int, optional): keys read per request. Defaults to 1000.
+            bufferSize (int, optional): keys read ahead per partition. Defaults to 1024.
+
+        Yields:
+            Generator[datatypesv2.KeyValue, None, None]: Returns generator of KeyValue
+        """
+        if sinceTx == None:
+            # every request waits for the index to reach the same tx
+            sinceTx = self._stub.CurrentState(
+                google_dot_protobuf_dot_empty__pb2.Empty()).txId
+        first = list(self.streamScan(
+            prefix=prefix, limit=1, sinceTx=sinceTx, noWait=noWait))
+        if len(first) == 0:
+            return
+        last = list(self.streamScan(
+            prefix=prefix, desc=True, limit=1, sinceTx=sinceTx, noWait=noWait))
+        boundaries = scanpartition.splitKeyRange(
+            first[0].key, last[0].key, partitions)
+        scans = [lambda seekKey=seekKey, endKey=endKey: self._scanPartition(
+            prefix, seekKey, endKey, sinceTx, noWait, pageSize) for seekKey, endKey in scanpartition.keyRanges(boundaries)]
+        yield from scanpartition.runPartitions(scans, ordered, bufferSize)
+
+    def _scanPartition(self, prefix: bytes, seekKey: bytes, endKey: bytes, sinceTx: int, noWait: bool, pageSize: int) -> Generator[datatypesv2.KeyValue, None, None]:
+        inclusiveSeek = True
+        while True:
+            count = 0
+            for kv in self.streamScan(seekKey=seekKey, endKey=endKey, prefix=prefix, limit=pageSize, sinceTx=sinceTx, noWait=noWait,
+                                      inclusiveSeek=inclusiveSeek, inclusiveEnd=False if endKey != None else None):
+                count += 1
+                seekKey = kv.key
+                yield kv
+            if count < pageSize:
+                return
+            inclusiveSeek = False
+
     def _rawStreamSet(self, generator: Generator[Chunk, None, None]) -> datatypesv2.TxHeader:
         """Helper function that grabs generator of chunks and set into opened stream
 
@@ -1390,7 +1712,7 @@ class ImmudbClient:
             datatypesv2.TxHeader: Transaction header
         """
         resp = self._stub.streamSet(generator)
-        return dataconverter.convertResponse(resp)
+        return self._convertResponse(resp)
 
     def _raw_verifiable_stream_set(self, generator: Generator[Chunk, None, None]):
         """Helper function that grabs generator of chunks and set into opened stream
@@ -1412,53 +1734,10 @@ class ImmudbClient:
             noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to False.
             chunkSize (int, optional): Chunk size to set while streaming. Defaults to 65536.
 
-        Yields:
+        Returns:
             Generator[Chunk, None, None]: Generator of chunks
         """
-        kv = 1
-        zadd = 2
-        for op in ops:
-            if type(op) == datatypes.KeyValue:
-                concated = int.to_bytes(1, 8, 'big')
-                concated += int.to_bytes(kv, 1, 'big')
-                yield Chunk(content=concated + KeyHeader(key=op.key, length=len(op.key)).getInBytes())
-                buffer = BytesIO(op.value)
-                firstChunk = buffer.read(chunkSize)
-                firstChunk = ValueChunkHeader(
-                    chunk=firstChunk, length=len(op.value)).getInBytes()
-                yield Chunk(content=firstChunk)
-                chunk = buffer.read(chunkSize)
-                while chunk:
-                    yield Chunk(content=chunk)
-                    chunk = buffer.read(chunkSize)
-            elif type(op) == datatypes.StreamingKeyValue:
-                concated = int.to_bytes(1, 8, 'big')
-                concated += int.to_bytes(kv, 1, 'big')
-                yield Chunk(content=concated + KeyHeader(key=op.key, length=len(op.key)).getInBytes())
-                buffer = op.value
-                firstChunk = buffer.read(chunkSize)
-                firstChunk = ValueChunkHeader(
-                    chunk=firstChunk, length=op.length).getInBytes()
-                yield Chunk(content=firstChunk)
-                chunk = buffer.read(chunkSize)
-                while chunk:
-                    yield Chunk(content=chunk)
-                    chunk = buffer.read(chunkSize)
-            elif type(op) == datatypes.ZAddRequest:
-                concated = int.to_bytes(1, 8, 'big')
-                concated += int.to_bytes(zadd, 1, 'big')
-                zAdd = schema_pb2.ZAddRequest(
-                    set=op.set,
-                    score=op.score,
-                    key=op.key,
-                    atTx=op.atTx,
-                    boundRef=op.boundRef,
-                    noWait=op.noWait
-                )
-                serialized = zAdd.SerializeToString()
-                lengthOf = len(serialized)
-                lengthBytes = int.to_bytes(lengthOf, 8, 'big')
-                yield Chunk(content=concated + lengthBytes + serialized)
+        return makeExecAllStream(ops, noWait, chunkSize)
 
     def _raw_stream_exec_all(self, generator: Generator[Chunk, None, None]) -> datatypesv2.TxHeader:
         """Read everything from generator and yields into opened stream
@@ -1470,7 +1749,7 @@ class ImmudbClient:
             datatypesv2.TxHeader: TxHeader of just executed transaction
         """
 
-        resp = dataconverter.convertResponse(
+        resp = self._convertResponse(
             self._stub.streamExecAll(generator))
         return resp
 
@@ -1502,7 +1781,8 @@ class ImmudbClient:
         state = self._rs.get()
         resp = self._raw_verifiable_stream_set(self._make_verifiable_set_stream(
             buffer, key, bufferLength, state.txId, chunkSize))
-        verified = verifyTransaction(resp, state, self._vk, self._rs)
+        verified = verifyTransaction(
+            resp, state, self._vk, self._rs, cache=self._verifiedCache)
 
         return datatypes.SetResponse(
             id=resp.tx.header.id,
@@ -1524,7 +1804,8 @@ class ImmudbClient:
         state = self._rs.get()
         resp = self._raw_verifiable_stream_set(self._make_verifiable_set_stream(
             BytesIO(value), key, len(value), state.txId, chunkSize))
-        verified = verifyTransaction(resp, state, self._vk, self._rs)
+        verified = verifyTransaction(
+            resp, state, self._vk, self._rs, cache=self._verifiedCache)
 
         return datatypes.SetResponse(
             id=resp.tx.header.id,
@@ -1562,6 +1843,38 @@ class ImmudbClient:
             BytesIO(value), key, len(value), chunkSize))
         return resp
 
+    def streamSetFromFile(self, key: bytes, path: str, chunkSize: int = 65536) -> datatypesv2.TxHeader:
+        """Sets key into the content of a file with streaming method.
+        The file is memory mapped and sent chunk by chunk, so it is never
+        loaded in memory as a whole.
+
+        Args:
+            key (bytes): Key
+            path (str): Path of the file to send
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypesv2.TxHeader: Transaction header of just set transaction
+        """
+        with open(path, "rb") as f, mapFile(f) as buffer:
+            return self.streamSet(key, buffer, os.fstat(f.fileno()).st_size, chunkSize)
+
+    def streamVerifiedSetFromFile(self, key: bytes, path: str, chunkSize: int = 65536) -> datatypes.SetResponse:
+        """Sets key into the content of a memory mapped file with streaming
+        method and verifies with current state
+
+        Args:
+            key (bytes): Key
+            path (str): Path of the file to send
+            chunkSize (int, optional): Specifies chunk size while sending. Defaults to 65536.
+
+        Returns:
+            datatypes.SetResponse: Response contains id of transaction and verification status.
+            Raises exception if corrupted data.
+        """
+        with open(path, "rb") as f, mapFile(f) as buffer:
+            return self.streamVerifiedSet(key, buffer, os.fstat(f.fileno()).st_size, chunkSize)
+
     def exportTx(self, tx: int):
         """Opens stream to export transaction from immudb (you can combine it with replicateTx)
 
@@ -1594,7 +1907,7 @@ class ImmudbClient:
         Returns:
             datatypesv2.TxHeader: tx header of just synchronized transaction
         """
-        return dataconverter.convertResponse(self._stub.replicateTx(self._create_generator(chunkStream)))
+        return self._convertResponse(self._stub.replicateTx(self._create_generator(chunkStream)))
 
     def sqlExec(self, stmt, params={}, noWait=False):
         """Executes an SQL statement
@@ -1613,11 +1926,60 @@ class ImmudbClient:
 
         return sqlexec.call(self._stub, self._rs, stmt, params, noWait)
 
-    def sqlQuery(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False):
+    def bulkInsert(self, table: str, columns: List[str], rows, batchSize: int = 100, noWait: bool = False, parallel: int = 1) -> List[schema_pb2.SQLExecResult]:
+        """Inserts rows with multi-row INSERT statements, every statement
+        of up to batchSize rows committed as one transaction
+
+        Examples:
+            client.bulkInsert("payments", ["id", "amount"], [(1, 10.5), (2, 20.0)])
+
+        Args:
+            table (str): table name
+            columns (List[str]): column names
+            rows (iterable): rows, as sequences in the order of columns or
+                dicts keyed by column name
+            batchSize (int, optional): rows per transaction. Keep it below
+                the maximum number of entries per transaction of the server,
+                every index of the table adding one entry per row.
+                Defaults to 100.
+            noWait (bool, optional): whether to wait for indexing
+            parallel (int, optional): batches sent concurrently. Defaults
+                to 1. If a batch fails, batches already sent stay committed.
+
+        Returns:
+            List[SQLExecResult]: result of every batch
+        """
+        return bulkInsert.call(self._stub, self._rs, table, columns, rows, batchSize, noWait, parallel)
+
+    def prepare(self, stmt, batchSize=100) -> PreparedStatement:
+        """Prepares an SQL statement executed many times with different
+        parameters
+
+        Examples:
+            insert = client.prepare("INSERT INTO t (id, name) VALUES (@id, @name)")
+            insert.executemany([{"id": 1, "name": "a"}, (2, "b")])
+
+        Args:
+            stmt: a statement in immudb SQL dialect.
+            batchSize (int, optional): executions sent in one transaction by
+                executemany. Defaults to 100.
+
+        Returns:
+            PreparedStatement: statement, see prepared.py
+        """
+        return PreparedStatement(stmt, lambda request: self._stub.SQLExec(request),
+                                 lambda request: self._stub.SQLQuery(request),
+                                 self._currentdb, batchSize=batchSize)
+
+    def sqlQuery(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False, prefetch=0):
         """Queries the database using SQL
         Args:
             query: a query in immudb SQL dialect.
             params: a dictionary of parameters to replace in the query
+            prefetch: if greater than 0, the result stream is read and
+                decoded on a background thread, up to prefetch batches
+                ahead of the consumer. A streamed iterator must then be
+                closed if not consumed to the end.
 
         Returns:
             A list of table names. For example:
@@ -1625,12 +1987,45 @@ class ImmudbClient:
             ['table1', 'table2']
         """
         it = sqlquery.call(self._stub, self._rs, query,
-                           params, columnNameMode, self._currentdb)
+                           params, columnNameMode, self._currentdb, prefetch)
         if acceptStream:
             return it
 
         return list(it)
 
+    def sqlQueryColumnar(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_FIELD) -> ColumnarResult:
+        """Queries the database using SQL, decoding the result by column
+
+        Every streamed batch of rows is decoded straight into one typed array
+        per column with a validity mask, without building row objects.
+
+        Args:
+            query: a query in immudb SQL dialect.
+            params: a dictionary of parameters to replace in the query
+            columnNameMode: mode of the column names. Defaults to
+                COLUMN_NAME_MODE_FIELD.
+
+        Returns:
+            ColumnarResult: columns, convertible with toNumpy, toArrow and
+                toPandas
+        """
+        return sqlquery.callColumnar(self._stub, self._rs, query, params, columnNameMode, self._currentdb)
+
+    def sqlQueryArrow(self, query, params={}, columnNameMode=constants.COLUMN_NAME_MODE_FIELD):
+        """Queries the database using SQL, returning an Arrow table.
+        Requires pyarrow.
+
+        Args:
+            query: a query in immudb SQL dialect.
+            params: a dictionary of parameters to replace in the query
+            columnNameMode: mode of the column names. Defaults to
+                COLUMN_NAME_MODE_FIELD.
+
+        Returns:
+            pyarrow.Table: query result
+        """
+        return self.sqlQueryColumnar(query, params, columnNameMode).toArrow()
+
     def listTables(self):
         """List all tables in the current database
 
@@ -1664,7 +2059,7 @@ class ImmudbClient:
                       category=DeprecationWarning,
                       stacklevel=2
                       )
-        return verifiedGet.call(self._stub, self._rs, key, verifying_key=self._vk)
+        return verifiedGet.call(self._stub, self._rs, key, verifying_key=self._vk, cache=self._verifiedCache)
 
     def databaseUse(self, dbName: bytes):  # deprecated
         warnings.warn("Call to deprecated databaseUse. Use useDatabase instead",
@@ -1678,7 +2073,7 @@ class ImmudbClient:
                       category=DeprecationWarning,
                       stacklevel=2
                       )
-        return verifiedSet.call(self._stub, self._rs, key, value)
+        return verifiedSet.call(self._stub, self._rs, key, value, cache=self._verifiedCache)
 
     def verifiableSQLGet(self, table: str, primaryKeys: List[datatypesv2.PrimaryKey], atTx=None, sinceTx=None) -> datatypesv2.VerifiableSQLEntry:
         """Verifies SQL row against current state
@@ -1700,14 +2095,41 @@ class ImmudbClient:
         Returns:
             datatypesv2.VerifiableSQLEntry: Contains all informations about just verified SQL Entry
         """
-        return verifiedSQLGet.call(self._stub, self._rs, table, primaryKeys, atTx, sinceTx, verifying_key=self._vk)
+        return verifiedSQLGet.call(self._stub, self._rs, table, primaryKeys, atTx, sinceTx, verifying_key=self._vk, cache=self._verifiedCache)
 
+    def verifiableSQLGetMany(self, table: str, primaryKeysList: List[List[datatypesv2.PrimaryKey]], atTx=None, sinceTx=None, maxInFlight: int = 16) -> List[datatypesv2.VerifiableSQLEntry]:
+        """Verifies many SQL rows of a table against current state
 
-# immudb-py only
+        Up to maxInFlight rows are requested concurrently. The dual proof of
+        a transaction is verified once for all its rows, and the table
+        metadata is reused across calls.
+
+        Example:
+            client.verifiableSQLGetMany(
+                tabname, [[datatypesv2.PrimaryKeyIntValue(i)] for i in range(100)]
+            )
+
+        Args:
+            table (str): Table Name
+            primaryKeysList (List[List[datatypesv2.PrimaryKey]]): primary
+                keys of every row to check
+            atTx (int): Identifier of the transaction at which point the
+                values should be retrieved.
+            sinceTx (int): Identifier of the earliest transaction from which the
+                values should be retrieved.
+            maxInFlight (int, optional): concurrent requests. Defaults to 16.
 
+        Returns:
+            List[datatypesv2.VerifiableSQLEntry]: verified entries, in the
+                order of primaryKeysList
+        """
+        return verifiedSQLGet.callMany(self._stub, self._rs, table, primaryKeysList, atTx, sinceTx, verifying_key=self._vk, cache=self._verifiedCache, tables=self._sqlTables, maxInFlight=maxInFlight)
+
+
+# immudb-py only
 
     def getAllValues(self, keys: list):  # immudb-py only
-        resp = batchGet.call(self._stub, self._rs, keys)
+        resp = batchGet.call(self._stub, self._rs, keys, self._maxRequestSize)
         return resp
 
     def getValue(self, key: bytes):  # immudb-py only
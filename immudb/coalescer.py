@@ -0,0 +1,220 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from concurrent.futures import Future
+import threading
+import time
+
+from immudb import constants, datatypes
+
+# sealed batches waiting to be sent before writers are blocked
+_MAX_READY_BATCHES = 4
+
+# upper bound of the serialized size of an operation besides its keys and
+# values
+_OP_OVERHEAD = 64
+
+
+def _opSize(op) -> int:
+    if type(op) is datatypes.KeyValue:
+        return len(op.key) + len(op.value) + _OP_OVERHEAD
+    if type(op) is datatypes.ZAddRequest:
+        return len(op.set) + len(op.key) + _OP_OVERHEAD
+    return len(op.key) + len(op.referencedKey) + _OP_OVERHEAD
+
+
+class WriteCoalescer:
+
+    def __init__(self, client, maxEntries: int = 1024, maxDelay: float = 0.005, noWait: bool = False, maxBytes: int = constants.MAX_REQUEST_SIZE):
+        """Groups small independent writes into few transactions.
+
+        Writes are buffered for up to maxDelay seconds, maxEntries
+        operations or maxBytes, then sent as a single transaction: with
+        ``setAll`` if the batch only contains sets, with ``execAll``
+        otherwise. Batches are committed in order by a background thread.
+        A key can be written once per transaction, so writing again a
+        buffered key seals the current batch first.
+
+        Batches are never bigger than the ``maxRequestSize`` of the client,
+        so each one is sent as a single request and committed atomically.
+
+        Args:
+            client (ImmudbClient): client (or pool) used to send batches
+            maxEntries (int, optional): maximum number of operations in a
+                transaction. Defaults to 1024.
+            maxDelay (float, optional): seconds a write can be buffered.
+                Defaults to 0.005.
+            noWait (bool, optional): don't wait for the index when sending
+                batches with execAll. Defaults to False.
+            maxBytes (int, optional): maximum size of the keys and values
+                of a transaction. Defaults to a bit less than 4Mb.
+        """
+        if maxEntries < 1:
+            raise ValueError("maxEntries must be at least 1")
+        # a bigger batch would be split by the client in several transactions
+        maxRequestSize = getattr(client, "_maxRequestSize", None)
+        if maxRequestSize:
+            maxBytes = min(maxBytes, maxRequestSize)
+        self._client = client
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.maxDelay = maxDelay
+        self.noWait = noWait
+        self._cond = threading.Condition()
+        self._ops = []
+        self._futures = []
+        self._keys = set()
+        self._size = 0
+        self._deadline = None
+        self._ready = deque()
+        self._sending = False
+        self._closed = False
+        self._flusher = threading.Thread(target=self._run, daemon=True)
+        self._flusher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def set(self, key: bytes, value: bytes) -> Future:
+        """Buffers a set of key into value
+
+        Args:
+            key (bytes): key
+            value (bytes): value
+
+        Returns:
+            Future: future of a CoalescedWriteResponse, holding the
+                transaction id and the position of the entry in it
+        """
+        return self._add(("kv", key), datatypes.KeyValue(key=key, value=value))
+
+    def zAdd(self, zset: bytes, score: float, key: bytes, atTx: int = 0) -> Future:
+        """Buffers a score (secondary index) for a key and collection
+
+        Args:
+            zset (bytes): collection name
+            score (float): score
+            key (bytes): key name
+            atTx (int, optional): transaction id to bound score to. Defaults
+                to 0, indicating the most recent version should be used.
+
+        Returns:
+            Future: future of a CoalescedWriteResponse
+        """
+        return self._add(("z", zset, score, key, atTx), datatypes.ZAddRequest(
+            set=zset, score=score, key=key, atTx=atTx))
+
+    def setReference(self, referredkey: bytes, newkey: bytes) -> Future:
+        """Buffers a reference to referredkey as newkey
+
+        Args:
+            referredkey (bytes): referred key
+            newkey (bytes): new key
+
+        Returns:
+            Future: future of a CoalescedWriteResponse
+        """
+        return self._add(("kv", newkey), datatypes.ReferenceRequest(
+            key=newkey, referencedKey=referredkey))
+
+    def _add(self, dedupKey, op) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._cond:
+            if self._closed:
+                raise ValueError("WriteCoalescer is closed")
+            size = _opSize(op)
+            if dedupKey in self._keys or self._size + size > self.maxBytes:
+                self._seal()
+            while len(self._ready) >= _MAX_READY_BATCHES:
+                self._cond.wait()
+            if len(self._ops) == 0:
+                self._deadline = time.monotonic() + self.maxDelay
+            self._ops.append(op)
+            self._futures.append(future)
+            self._keys.add(dedupKey)
+            self._size += size
+            if len(self._ops) >= self.maxEntries:
+                self._seal()
+            self._cond.notify_all()
+        return future
+
+    def _seal(self):
+        if len(self._ops) > 0:
+            self._ready.append((self._ops, self._futures))
+            self._ops = []
+            self._futures = []
+            self._keys = set()
+            self._size = 0
+            self._deadline = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while len(self._ready) == 0:
+                    if len(self._ops) > 0 and (self._closed or time.monotonic() >= self._deadline):
+                        self._seal()
+                        break
+                    if self._closed:
+                        return
+                    timeout = None
+                    if len(self._ops) > 0:
+                        timeout = self._deadline - time.monotonic()
+                    self._cond.wait(timeout)
+                ops, futures = self._ready.popleft()
+                self._sending = True
+                self._cond.notify_all()
+            try:
+                self._send(ops, futures)
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+
+    def _send(self, ops: list, futures: list):
+        try:
+            if all(type(op) is datatypes.KeyValue for op in ops):
+                txId = self._client.setAll(
+                    {op.key: op.value for op in ops}).id
+            else:
+                txId = self._client.execAll(ops, self.noWait).id
+        except BaseException as e:
+            for future in futures:
+                future.set_exception(e)
+            return
+        for index, future in enumerate(futures):
+            future.set_result(
+                datatypes.CoalescedWriteResponse(id=txId, index=index))
+
+    def flush(self):
+        """Sends the buffered writes and waits until all of them are
+        committed
+        """
+        with self._cond:
+            self._seal()
+            self._cond.notify_all()
+            while len(self._ready) > 0 or self._sending:
+                self._cond.wait()
+
+    def close(self):
+        """Flushes the buffered writes and stops the background thread
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._flusher.join()
@@ -0,0 +1,218 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from array import array
+import itertools
+import operator
+from typing import Dict, List
+
+from immudb.typeconv import SQL_TYPE_FIELDS
+
+# SQLValue field -> array typecode, None for python lists
+_FIELD_TYPECODES = {
+    "n": "q",
+    "ts": "q",
+    "f": "d",
+    "b": "b",
+    "s": None,
+    "bs": None,
+}
+
+# array typecode -> numpy dtype
+_NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "int8"}
+
+_isNull = operator.methodcaller("HasField", "null")
+_rowValues = operator.attrgetter("values")
+
+
+def _importOptional(name: str):
+    try:
+        return __import__(name)
+    except ImportError:
+        raise ImportError(
+            "{} is required for this conversion: pip install {}".format(
+                name, name)) from None
+
+
+class _ColumnBuilder:
+    def __init__(self, sqlType: str):
+        self.field = SQL_TYPE_FIELDS.get(sqlType.upper())
+        self.valid = bytearray()
+        self.values = None
+        self.nullCount = 0
+        if self.field != None:
+            self._allocate()
+
+    def _allocate(self):
+        typecode = _FIELD_TYPECODES[self.field]
+        if typecode != None:
+            self.values = array(typecode)
+            default = 0
+        else:
+            self.values = list()
+            default = b'' if self.field == "bs" else ''
+        # rows decoded before the type was known are all nulls
+        self.values.extend([default] * len(self.valid))
+        # picked once per column, so cells are read without a lookup each
+        self._read = operator.attrgetter(self.field)
+        self._isValid = operator.methodcaller("HasField", self.field)
+
+    def extend(self, cells: List):
+        if self.field == None:
+            kinds = [cell.WhichOneof("value") for cell in cells]
+            known = [kind for kind in kinds if kind != "null" and kind != None]
+            if len(known) == 0:
+                self.valid.extend(bytes(len(cells)))
+                self.nullCount += len(cells)
+                return
+            self.field = known[0]
+            self._allocate()
+        valid = bytes(map(self._isValid, cells))
+        nulls = len(cells) - sum(valid)
+        if nulls > 0 and sum(map(_isNull, cells)) != nulls:
+            raise TypeError("Mixed types in column of {}".format(self.field))
+        # unset oneof fields read as 0, '' or b''
+        self.values.extend(map(self._read, cells))
+        self.valid.extend(valid)
+        self.nullCount += nulls
+
+
+class ColumnarResult:
+    """SQL query result decoded by column.
+
+    Every column is a typed ``array.array`` (int64 for INTEGER, float64 for
+    FLOAT, int8 for BOOLEAN, int64 microseconds since epoch for TIMESTAMP)
+    or a list (VARCHAR, BLOB), with a validity mask holding 0 for nulls.
+    The result can be converted to NumPy arrays, an Arrow table or a pandas
+    DataFrame when those packages are installed.
+    """
+
+    def __init__(self, columns: List[str], types: List[str]):
+        self.columns = columns
+        self.types = types
+        self._builders = [_ColumnBuilder(t) for t in types]
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def append(self, rows):
+        """Decodes a batch of rows (schema_pb2.Row) into the columns
+        """
+        if len(rows) == 0:
+            return
+        # one pass over the rows, every column is then a slice of the cells
+        cells = list(itertools.chain.from_iterable(map(_rowValues, rows)))
+        width = len(self._builders)
+        for i, builder in enumerate(self._builders):
+            builder.extend(cells[i::width])
+        self._length += len(rows)
+
+    def _builder(self, name: str) -> _ColumnBuilder:
+        return self._builders[self.columns.index(name)]
+
+    def values(self, name: str):
+        """Returns the values of a column, nulls being 0, '' or b''
+
+        Args:
+            name (str): column name
+
+        Returns:
+            array.array or list: values, None for a column of nulls only
+        """
+        return self._builder(name).values
+
+    def validity(self, name: str) -> bytearray:
+        """Returns the validity mask of a column, 0 for nulls
+
+        Args:
+            name (str): column name
+
+        Returns:
+            bytearray: one byte per row
+        """
+        return self._builder(name).valid
+
+    def nullCount(self, name: str) -> int:
+        return self._builder(name).nullCount
+
+    def toNumpy(self) -> Dict:
+        """Converts the columns to NumPy arrays, masked arrays for columns
+        with nulls. Timestamps are ``datetime64[us]`` in UTC.
+
+        Returns:
+            Dict[str, numpy.ndarray]: arrays by column name
+        """
+        np = _importOptional("numpy")
+        ret = dict()
+        for name, builder in zip(self.columns, self._builders):
+            values = builder.values
+            if values == None:
+                arr = np.zeros(len(builder.valid), dtype=object)
+            elif isinstance(values, array):
+                arr = np.frombuffer(
+                    values, dtype=_NUMPY_DTYPES[values.typecode])
+                if builder.field == "b":
+                    arr = arr.astype(bool)
+                elif builder.field == "ts":
+                    arr = arr.view("datetime64[us]")
+            else:
+                arr = np.array(values, dtype=object)
+            if builder.nullCount > 0:
+                mask = np.frombuffer(bytes(builder.valid), dtype=np.uint8) == 0
+                arr = np.ma.MaskedArray(arr, mask=mask)
+            ret[name] = arr
+        return ret
+
+    def toArrow(self):
+        """Converts the result to an Arrow table
+
+        Returns:
+            pyarrow.Table: table, timestamps are ``timestamp[us, tz=UTC]``
+        """
+        pa = _importOptional("pyarrow")
+        np = _importOptional("numpy")
+        types = {
+            "n": pa.int64(),
+            "f": pa.float64(),
+            "b": pa.bool_(),
+            "ts": pa.timestamp("us", tz="UTC"),
+            "s": pa.string(),
+            "bs": pa.binary(),
+            None: pa.null(),
+        }
+        arrays = []
+        for builder in self._builders:
+            values = builder.values
+            mask = None
+            if builder.nullCount > 0:
+                mask = np.frombuffer(bytes(builder.valid), dtype=np.uint8) == 0
+            if values == None:
+                arrays.append(pa.nulls(len(builder.valid)))
+                continue
+            if isinstance(values, array):
+                values = np.frombuffer(
+                    values, dtype=_NUMPY_DTYPES[values.typecode])
+                if builder.field == "b":
+                    values = values.astype(bool)
+            arrays.append(
+                pa.array(values, type=types[builder.field], mask=mask))
+        return pa.Table.from_arrays(arrays, names=self.columns)
+
+    def toPandas(self):
+        """Converts the result to a pandas DataFrame, through Arrow
+
+        Returns:
+            pandas.DataFrame: data frame
+        """
+        _importOptional("pandas")
+        return self.toArrow().to_pandas()
@@ -13,6 +13,9 @@
 LEAF_PREFIX = b'\x00'
 NODE_PREFIX = b'\x01'
 ROOT_CACHE_PATH = ".immudbRoot"
+ROOT_LOG_PATH = ".immudbRoot.log"
+# suggested size limit of a single request of setAll, getAll and execAll
+MAX_REQUEST_SIZE = 4 * 1024 * 1024 - 64 * 1024
 
 PERMISSION_SYS_ADMIN = 255
 PERMISSION_ADMIN = 254
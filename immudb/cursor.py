@@ -0,0 +1,125 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+from dataclasses import dataclass, fields
+import json
+import os
+
+
+class _Cursor:
+    """Serialization of cursors: a JSON object, bytes encoded in base64"""
+
+    def toDict(self) -> dict:
+        ret = {"cursor": type(self).__name__}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if isinstance(value, bytes):
+                value = base64.b64encode(value).decode("ascii")
+            ret[field.name] = value
+        return ret
+
+    @classmethod
+    def fromDict(cls, data: dict):
+        args = dict()
+        for field in fields(cls):
+            if field.name not in data:
+                continue
+            value = data[field.name]
+            if field.type is bytes and value is not None:
+                value = base64.b64decode(value)
+            args[field.name] = value
+        return cls(**args)
+
+    def save(self, filename: str):
+        """Atomically writes the cursor to a file
+
+        Args:
+            filename (str): path of the file
+        """
+        tmp = filename + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.toDict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+
+
+@dataclass
+class ScanCursor(_Cursor):
+    """Position of a key scan.
+
+    Attributes:
+        prefix (bytes): prefix of the scanned keys
+        snapshotTx (int): transaction the scan is pinned to, set when the
+            scan starts. Values are returned as of this transaction.
+        lastKey (bytes): last key returned
+        count (int): number of entries returned
+        finished (bool): `True` once all the keys were returned
+    """
+    prefix: bytes = b''
+    snapshotTx: int = None
+    lastKey: bytes = None
+    count: int = 0
+    finished: bool = False
+
+
+@dataclass
+class HistoryCursor(_Cursor):
+    """Position of a scan of the history of a key, in ascending order.
+
+    Attributes:
+        key (bytes): key
+        snapshotTx (int): transaction the scan is pinned to, set when the
+            scan starts. Later revisions are not returned.
+        offset (int): number of revisions returned
+        finished (bool): `True` once all the revisions were returned
+    """
+    key: bytes = None
+    snapshotTx: int = None
+    offset: int = 0
+    finished: bool = False
+
+
+@dataclass
+class TxScanCursor(_Cursor):
+    """Position of a transaction scan.
+
+    Attributes:
+        nextTx (int): next transaction to return
+        snapshotTx (int): last transaction to return, set when the scan
+            starts
+        finished (bool): `True` once all the transactions were returned
+    """
+    nextTx: int = 1
+    snapshotTx: int = None
+    finished: bool = False
+
+
+_CURSORS = {cls.__name__: cls
+            for cls in (ScanCursor, HistoryCursor, TxScanCursor)}
+
+
+def load(filename: str):
+    """Reads a cursor written with save
+
+    Args:
+        filename (str): path of the file
+
+    Returns:
+        ScanCursor, HistoryCursor or TxScanCursor: cursor
+    """
+    with open(filename) as f:
+        data = json.load(f)
+    if data.get("cursor") not in _CURSORS:
+        raise ValueError("Unknown cursor {}".format(data.get("cursor")))
+    return _CURSORS[data["cursor"]].fromDict(data)
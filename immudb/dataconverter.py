@@ -10,6 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
+from google.protobuf import message_factory
+from google.protobuf.descriptor import FieldDescriptor
 import immudb.datatypesv2 as datatypesv2
 
 
@@ -23,20 +27,81 @@ def convertResponse(fromResponse, toHumanDataClass=True):
     Returns:
         DataClass: corresponding dataclass type
     """
-    if fromResponse.__class__.__name__ == "RepeatedCompositeContainer":
-        all = []
-        for item in fromResponse:
-            all.append(convertResponse(item))
-        return all
-    schemaFrom = datatypesv2.__dict__.get(
-        fromResponse.__class__.__name__, None)
-    if schemaFrom:
-        construct = dict()
-        for field in fromResponse.ListFields():
-            construct[field[0].name] = convertResponse(field[1], False)
-        if toHumanDataClass:
-            return schemaFrom(**construct)._getHumanDataClass()
+    converter = _converters.get(fromResponse.__class__)
+    if converter is None:
+        if fromResponse.__class__.__name__ == "RepeatedCompositeContainer":
+            return [convertResponse(item) for item in fromResponse]
+        converter = _converterFor(fromResponse.__class__)
+    return converter(fromResponse, toHumanDataClass)
+
+
+# protobuf message class -> converter(message, toHumanDataClass)
+_converters = dict()
+
+
+def _identity(value, toHumanDataClass=True):
+    return value
+
+
+def _isFloat(field: FieldDescriptor) -> bool:
+    return field.type in (FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE)
+
+
+def _converterFor(messageClass):
+    """Returns the converter of a message class, generated the first time.
+
+    The dataclass with the same name in datatypesv2 is looked up once, and
+    the converter reads every field directly, keeping the fields that
+    ListFields would return: set fields with presence, and non default
+    scalars, repeated fields and maps.
+    """
+    converter = _converters.get(messageClass)
+    if converter is not None:
+        return converter
+    schemaFrom = datatypesv2.__dict__.get(messageClass.__name__, None)
+    descriptor = getattr(messageClass, "DESCRIPTOR", None)
+    if schemaFrom is None or descriptor is None:
+        _converters[messageClass] = _identity
+        return _identity
+
+    # converters of the message fields, bound lazily for recursive messages
+    namespace = {"schemaFrom": schemaFrom,
+                 "copysign": math.copysign, "nested": dict()}
+    lines = ["def converter(m, toHumanDataClass=True):", "    c = {}"]
+    for field in descriptor.fields:
+        name = field.name
+        value = "m.{}".format(name)
+        convert = None
+        if field.type == FieldDescriptor.TYPE_MESSAGE and not field.message_type.GetOptions().map_entry:
+            convert = field
+        if field.label != FieldDescriptor.LABEL_REPEATED and field.has_presence:
+            lines.append("    if m.HasField('{}'):".format(name))
+        elif _isFloat(field) and field.label != FieldDescriptor.LABEL_REPEATED:
+            # -0.0 is set
+            lines.append("    if {0} or copysign(1, {0}) < 0:".format(value))
+        else:
+            lines.append("    if {}:".format(value))
+        if convert is None:
+            lines.append("        c['{}'] = {}".format(name, value))
+        elif field.label == FieldDescriptor.LABEL_REPEATED:
+            lines.append("        f = nested['{}']".format(name))
+            lines.append(
+                "        c['{0}'] = [f(i, True) for i in {1}] if f else list({1})".format(name, value))
         else:
-            return schemaFrom(**construct)
-    else:
-        return fromResponse
+            lines.append("        f = nested['{}']".format(name))
+            lines.append(
+                "        c['{0}'] = f({1}, False) if f else {1}".format(name, value))
+    lines.append("    o = schemaFrom(**c)")
+    if schemaFrom._getHumanDataClass is not datatypesv2.GRPCTransformable._getHumanDataClass:
+        lines.append("    if toHumanDataClass:")
+        lines.append("        return o._getHumanDataClass()")
+    lines.append("    return o")
+    exec("\n".join(lines), namespace)
+    converter = namespace["converter"]
+    _converters[messageClass] = converter
+    for field in descriptor.fields:
+        if field.type == FieldDescriptor.TYPE_MESSAGE and not field.message_type.GetOptions().map_entry:
+            nested = _converterFor(
+                message_factory.GetMessageClass(field.message_type))
+            namespace["nested"][field.name] = None if nested is _identity else nested
+    return converter
@@ -28,6 +28,12 @@ class SetResponse:
     verified: bool
 
 
+@dataclass
+class CoalescedWriteResponse:
+    id: int
+    index: int
+
+
 @dataclass
 class SafeGetResponse:
     id: int
@@ -0,0 +1,181 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hashing backend of the Merkle tree verifications.
+
+The loops of ahtree, htree and store verifications are delegated to the
+current backend. PythonHashBackend, based on hashlib, is the default; a
+faster implementation (e.g. a C extension hashing whole proofs or tree
+levels at once) can subclass it, override the methods it accelerates and
+be installed with setBackend.
+"""
+
+import hashlib
+import struct
+from typing import List, Tuple
+
+from immudb.constants import LEAF_PREFIX, NODE_PREFIX
+
+
+class PythonHashBackend:
+    """Pure Python backend.
+
+    Hashers already fed with the leaf and node prefixes are copied for every
+    hash, instead of concatenating prefix and children into new bytes. Each
+    node is still hashed with its own hashlib call: hashlib has no batched
+    API and holds the GIL for inputs this small, so this backend runs at
+    about the speed of the former inline loops. Batched hashing is left to
+    native backends installed with setBackend.
+    """
+
+    def __init__(self):
+        self._leaf = hashlib.sha256(LEAF_PREFIX)
+        self._node = hashlib.sha256(NODE_PREFIX)
+
+    def leaf(self, digest: bytes) -> bytes:
+        h = self._leaf.copy()
+        h.update(digest)
+        return h.digest()
+
+    def node(self, left: bytes, right: bytes) -> bytes:
+        h = self._node.copy()
+        h.update(left)
+        h.update(right)
+        return h.digest()
+
+    def leaves(self, digests: List[bytes]) -> List[bytes]:
+        """Hashes many leaves at once"""
+        base = self._leaf
+        hashes = []
+        for d in digests:
+            h = base.copy()
+            h.update(d)
+            hashes.append(h.digest())
+        return hashes
+
+    def parents(self, level: List[bytes]) -> List[bytes]:
+        """Hashes the nodes of a tree level in pairs. An odd node left at
+        the end is carried to the next level unchanged"""
+        base = self._node
+        parents = []
+        w = len(level)
+        for i in range(0, w-1, 2):
+            h = base.copy()
+            h.update(level[i])
+            h.update(level[i+1])
+            parents.append(h.digest())
+        if w % 2 == 1:
+            parents.append(level[w-1])
+        return parents
+
+    def evalInclusion(self, iproof: List[bytes], i: int, j: int, iLeaf: bytes) -> bytes:
+        base = self._node
+        i1 = i - 1
+        j1 = j - 1
+        ciRoot = iLeaf
+        for h in iproof:
+            md = base.copy()
+            if i1 % 2 == 0 and i1 != j1:
+                md.update(ciRoot)
+                md.update(h)
+            else:
+                md.update(h)
+                md.update(ciRoot)
+            ciRoot = md.digest()
+            i1 = i1 >> 1
+            j1 = j1 >> 1
+        return ciRoot
+
+    def evalConsistency(self, cproof: List[bytes], i: int, j: int) -> Tuple[bytes, bytes]:
+        node = self.node
+        fn = i - 1
+        sn = j - 1
+        while fn % 2 == 1:
+            fn = fn >> 1
+            sn = sn >> 1
+        ciRoot, cjRoot = cproof[0], cproof[0]
+        for h in cproof[1:]:
+            if fn % 2 == 1 or fn == sn:
+                ciRoot = node(h, ciRoot)
+                cjRoot = node(h, cjRoot)
+                while fn % 2 == 0 and fn != 0:
+                    fn = fn >> 1
+                    sn = sn >> 1
+            else:
+                cjRoot = node(cjRoot, h)
+            fn = fn >> 1
+            sn = sn >> 1
+        return ciRoot, cjRoot
+
+    def evalLastInclusion(self, iproof: List[bytes], i: int, leaf: bytes) -> bytes:
+        base = self._node
+        root = leaf
+        for h in iproof:
+            md = base.copy()
+            md.update(h)
+            md.update(root)
+            root = md.digest()
+        return root
+
+    def evalTreeInclusion(self, terms: List[bytes], i: int, r: int, digest: bytes) -> Tuple[int, int, bytes]:
+        """Computes the root of a htree from the digest of leaf i, in a tree
+        of r+1 leaves
+
+        Returns:
+            Tuple[int, int, bytes]: final i, final r and root
+        """
+        base = self._node
+        calcRoot = self.leaf(digest)
+        for t in terms:
+            md = base.copy()
+            if i % 2 == 0 and i != r:
+                md.update(calcRoot)
+                md.update(t)
+            else:
+                md.update(t)
+                md.update(calcRoot)
+            calcRoot = md.digest()
+            i = i//2
+            r = r//2
+        return i, r, calcRoot
+
+    def evalLinearProof(self, sourceTxID: int, terms: List[bytes]) -> bytes:
+        """Chains the Alh of transactions following sourceTxID from the
+        terms of a linear proof"""
+        pack = struct.Struct(">Q").pack
+        sha256 = hashlib.sha256
+        calculatedAlh = terms[0]
+        for i in range(1, len(terms)):
+            calculatedAlh = sha256(
+                pack(sourceTxID+i)+calculatedAlh+terms[i]).digest()
+        return calculatedAlh
+
+
+_backend = PythonHashBackend()
+
+
+def getBackend() -> PythonHashBackend:
+    """Returns the hashing backend in use"""
+    return _backend
+
+
+def setBackend(backend: PythonHashBackend = None):
+    """Installs a hashing backend
+
+    Args:
+        backend (PythonHashBackend, optional): backend to use, the pure
+            Python one if None
+    """
+    global _backend
+    if backend is None:
+        backend = PythonHashBackend()
+    _backend = backend
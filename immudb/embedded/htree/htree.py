@@ -9,8 +9,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import hashlib
 from immudb.constants import *
+from immudb.embedded import hashing
 from immudb.exceptions import *
 
 
@@ -40,25 +40,14 @@ class HTree:
             raise ErrMaxWidthExceeded
         if len(digests) == 0:
             raise ErrIllegalArguments
-        for i in range(0, len(digests)):
-            leaf = LEAF_PREFIX+digests[i]
-            self.levels[0][i] = hashlib.sha256(leaf).digest()
+        backend = hashing.getBackend()
+        level = backend.leaves(digests)
+        self.levels[0][:len(level)] = level
         l = 0
-        w = len(digests)
-        while w > 1:
-
-            wn = 0
-            i = 0
-            while i+1 < w:
-                b = NODE_PREFIX+self.levels[l][i]+self.levels[l][i+1]
-                self.levels[l+1][wn] = hashlib.sha256(b).digest()
-                wn = wn+1
-                i = i+2
-            if w % 2 == 1:
-                self.levels[l+1][wn] = self.levels[l][w-1]
-                wn = wn+1
+        while len(level) > 1:
+            level = backend.parents(level)
+            self.levels[l+1][:len(level)] = level
             l += 1
-            w = wn
         self.width = len(digests)
         self.root = self.levels[l][0]
 
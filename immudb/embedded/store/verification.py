@@ -13,7 +13,7 @@
 from operator import xor
 from typing import List
 from immudb import datatypesv2
-from immudb.embedded import store, ahtree
+from immudb.embedded import store, ahtree, hashing
 from immudb.constants import *
 from immudb.exceptions import ErrCorruptedData, ErrUnsupportedTxVersion, ErrMaxKeyLengthExceeded, ErrInvalidValue, ErrMaxLengthExceeded
 import hashlib
@@ -24,19 +24,8 @@ import datetime
 def VerifyInclusion(proof, digest: bytes, root) -> bool:
     if proof == None:
         return False
-    leaf = LEAF_PREFIX+digest
-    calcRoot = hashlib.sha256(leaf).digest()
-    i = proof.leaf
-    r = proof.width-1
-    for t in proof.terms:
-        b = NODE_PREFIX
-        if i % 2 == 0 and i != r:
-            b = b+calcRoot+t
-        else:
-            b = b+t+calcRoot
-        calcRoot = hashlib.sha256(b).digest()
-        i = i//2
-        r = r//2
+    i, r, calcRoot = hashing.getBackend().evalTreeInclusion(
+        proof.terms, proof.leaf, proof.width-1, digest)
     return i == r and root == calcRoot
 
 
@@ -48,10 +37,8 @@ def VerifyLinearProof(proof, sourceTxID: int, targetTxID: int, sourceAlh: bytes,
             len(proof.terms) == 0 or sourceAlh != proof.terms[0]):
         return False
 
-    calculatedAlh = proof.terms[0]
-    for i in range(1, len(proof.terms)):
-        bs = struct.pack(">Q", proof.sourceTxID+i)+calculatedAlh+proof.terms[i]
-        calculatedAlh = hashlib.sha256(bs).digest()
+    calculatedAlh = hashing.getBackend().evalLinearProof(
+        proof.sourceTxID, proof.terms)
 
     return targetAlh == calculatedAlh
 
@@ -108,15 +95,32 @@ def EntrySpecDigestFor(version: int):
 
 
 def EntrySpecDigest_v0(kv: store.EntrySpec) -> bytes:
+    return EntrySpecDigestWithValueDigest_v0(kv, hashlib.sha256(kv.value).digest())
+
+
+def EntrySpecDigest_v1(kv: store.EntrySpec) -> bytes:
+    return EntrySpecDigestWithValueDigest_v1(kv, hashlib.sha256(kv.value).digest())
+
+
+# Same digests, computed from the sha256 of the value (kv.value is ignored),
+# for values hashed incrementally while they are streamed
+def EntrySpecDigestWithValueDigestFor(version: int):
+    if version == 0:
+        return EntrySpecDigestWithValueDigest_v0
+    elif version == 1:
+        return EntrySpecDigestWithValueDigest_v1
+    else:
+        raise ErrUnsupportedTxVersion
+
+
+def EntrySpecDigestWithValueDigest_v0(kv: store.EntrySpec, valueDigest: bytes) -> bytes:
     md = hashlib.sha256()
     md.update(kv.key)
-    valmd = hashlib.sha256()
-    valmd.update(kv.value)
-    md.update(valmd.digest())
+    md.update(valueDigest)
     return md.digest()
 
 
-def EntrySpecDigest_v1(kv: store.EntrySpec) -> bytes:
+def EntrySpecDigestWithValueDigest_v1(kv: store.EntrySpec, valueDigest: bytes) -> bytes:
     mdbs = b''
     if kv.metadata != None:
         mdbs = kv.metadata.Bytes()
@@ -130,15 +134,12 @@ def EntrySpecDigest_v1(kv: store.EntrySpec) -> bytes:
 
     md = hashlib.sha256()
     md.update(b)
-    valmd = hashlib.sha256()
-    valmd.update(kv.value)
-    md.update(valmd.digest())
+    md.update(valueDigest)
     return md.digest()
 
 
 def leafFor(d: bytes) -> bytes:
-    b = LEAF_PREFIX+d
-    return hashlib.sha256(b).digest()
+    return hashing.getBackend().leaf(d)
 
 
 def sqlMapKey(prefix: bytes, mappingPrefix: str, encValues: List[bytes]):
@@ -240,3 +241,126 @@ def encodeAsKey(val, colType, maxLen):
         encv += int.to_bytes(intVal, 8, "big")
         encv[1] = ord(encv[1:2]) ^ ord(b'\x80')
         return bytes(encv)
+
+
+_KEY_VAL_PREFIX_NOT_NULL = 0x80
+_MAX_KEY_LEN = 256  # pkg/client/sql.go
+_INT64_SIGN = 1 << 63
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _intKey(val):
+    return (_KEY_VAL_PREFIX_NOT_NULL, (int(val) + _INT64_SIGN) & _UINT64_MASK)
+
+
+def _tsKey(val):
+    # microseconds to nanoseconds
+    return (_KEY_VAL_PREFIX_NOT_NULL, (int(val) * 1000 + _INT64_SIGN) & _UINT64_MASK)
+
+
+def _boolKey(val):
+    return (_KEY_VAL_PREFIX_NOT_NULL, 1 if val == True else 0)
+
+
+def _varLenKey(encode, maxLen):
+    def key(val):
+        encv = encode(val)
+        if len(encv) > maxLen:
+            raise ErrMaxLengthExceeded()
+        return (_KEY_VAL_PREFIX_NOT_NULL, encv, len(encv))
+    return key
+
+
+def _strBytes(val):
+    return str(val).encode("utf-8")
+
+
+class KeyEncoder:
+    """Encoder of the row keys of a table, equivalent to sqlMapKey of the
+    ``R.`` mapping over encodeAsKey of every primary key value.
+
+    It is built once per table: the prefix with the database and table ids
+    is encoded once and, every primary key column having a fixed encoded
+    length, a whole key is packed with a single precompiled struct.
+    """
+
+    def __init__(self, dbID: int, tableID: int, pkTypes: List[str], pkLens: List[int]):
+        """
+        Args:
+            dbID (int): database id
+            tableID (int): table id
+            pkTypes (List[str]): SQL types of the primary key columns
+            pkLens (List[int]): maximum lengths of the primary key columns
+        """
+        self.head = sqlMapKey(b'\x02', 'R.', [encodeID(dbID), encodeID(
+            tableID), encodeID(0)])
+        self._converters = []
+        self._columns = []
+        for typ, maxLen in zip(pkTypes, pkLens):
+            maxLen = int(maxLen)
+            if maxLen <= 0:
+                raise ErrInvalidValue()
+            if maxLen > _MAX_KEY_LEN:
+                raise ErrMaxKeyLengthExceeded()
+            typ = typ.upper()
+            if typ in ("INTEGER", "TIMESTAMP"):
+                if maxLen != 8:
+                    raise ErrCorruptedData()
+                fmt = "BQ"
+                converter = _intKey if typ == "INTEGER" else _tsKey
+            elif typ == "BOOLEAN":
+                fmt = "BB"
+                converter = _boolKey
+            elif typ == "VARCHAR":
+                fmt = "B{}sI".format(maxLen)
+                converter = _varLenKey(_strBytes, maxLen)
+            elif typ == "BLOB":
+                fmt = "B{}sI".format(maxLen)
+                converter = _varLenKey(bytes, maxLen)
+            else:
+                raise ErrInvalidValue()
+            self._converters.append(converter)
+            self._columns.append(struct.Struct(">" + fmt))
+        self._struct = struct.Struct(
+            ">{}s".format(len(self.head)) + "".join([c.format[1:] for c in self._columns]))
+
+    def encode(self, values) -> bytes:
+        """Encodes the key of a row
+
+        Args:
+            values (sequence): primary key values, in order. Keys with None
+                values, or only a prefix of the primary key, are encoded
+                column by column.
+
+        Returns:
+            bytes: row key
+        """
+        if len(values) != len(self._converters) or None in values:
+            return self._encodeColumns(values)
+        args = [self.head]
+        for converter, value in zip(self._converters, values):
+            args.extend(converter(value))
+        return self._struct.pack(*args)
+
+    def encodeMany(self, rows) -> List[bytes]:
+        """Encodes the keys of many rows
+
+        Args:
+            rows (iterable): primary key values of every row
+
+        Returns:
+            List[bytes]: row keys
+        """
+        encode = self.encode
+        return [encode(values) for values in rows]
+
+    def _encodeColumns(self, values) -> bytes:
+        if len(values) > len(self._converters):
+            raise ErrCorruptedData()
+        encoded = [self.head]
+        for converter, column, value in zip(self._converters, self._columns, values):
+            if value is None:
+                encoded.append(bytes([_KEY_VAL_PREFIX_NOT_NULL]))
+            else:
+                encoded.append(column.pack(*converter(value)))
+        return b''.join(encoded)
@@ -12,6 +12,9 @@
 
 from dataclasses import dataclass
 
+import grpc
+
+from immudb import chunking
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService
@@ -24,13 +27,9 @@ class batchElement:
     value: bytes
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, keys: list):
-    request = schema_pb2.KeyListRequest(
-        keys=keys  # [schema_pb2_grpc.schema__pb2.Key(key=k) for k in keys]
-    )
-    msg = service.GetAll(request)
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, keys: list, maxRequestSize: int = None):
     ret = {}
-    for i in msg.entries:
+    for i in getAllEntries(service, keys, maxRequestSize):
         element = batchElement(
             tx=i.tx,
             key=i.key,
@@ -38,3 +37,35 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, keys: list):
         )
         ret[i.key] = element
     return ret
+
+
+def getAllEntries(service: schema_pb2_grpc.ImmuServiceStub, keys: list, maxRequestSize: int = None) -> list:
+    """Runs GetAll concurrently on chunks of keys of at most maxRequestSize
+    bytes. Chunks whose response is too big for the channel are split in
+    halves and retried.
+    """
+    chunks = chunking.split(list(keys), len, maxRequestSize)
+    if len(chunks) == 1:
+        return _getAll(service, chunks[0])
+    futures = [service.GetAll.future(schema_pb2.KeyListRequest(keys=chunk))
+               for chunk in chunks]
+    entries = []
+    for chunk, f in zip(chunks, futures):
+        error = f.exception()
+        if error is None:
+            entries.extend(f.result().entries)
+        elif chunking.isResourceExhausted(error) and len(chunk) > 1:
+            entries.extend(_getAll(service, chunk))
+        else:
+            raise error
+    return entries
+
+
+def _getAll(service: schema_pb2_grpc.ImmuServiceStub, keys: list) -> list:
+    try:
+        return list(service.GetAll(schema_pb2.KeyListRequest(keys=keys)).entries)
+    except grpc.RpcError as e:
+        if not chunking.isResourceExhausted(e) or len(keys) < 2:
+            raise e
+    half = len(keys) // 2
+    return _getAll(service, keys[:half]) + _getAll(service, keys[half:])
@@ -10,17 +10,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from immudb import datatypes
+from concurrent.futures import Future
+
+from typing import List
+
+from immudb import chunking, datatypes
 from immudb.grpc import schema_pb2, schema_pb2_grpc
+from immudb.pipeline import WritePipeline
 from immudb.rootService import RootService
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, kv: dict):
-    request = schema_pb2.SetRequest(
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, kv: dict, maxRequestSize: int = None):
+    requests = buildRequests(kv, maxRequestSize)
+    if len(requests) == 1:
+        return response(service.Set(requests[0]))
+    # independent transactions: sent concurrently, all waited for
+    futures = [service.Set.future(request) for request in requests]
+    msgs = [f.exception() or f.result() for f in futures]
+    for msg in msgs:
+        if isinstance(msg, Exception):
+            raise msg
+    return response(max(msgs, key=lambda msg: msg.id))
+
+
+def future(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, pipeline: WritePipeline, kv: dict) -> Future:
+    request = buildRequest(kv)
+    return pipeline.submit(lambda: service.Set.future(request), response)
+
+
+def buildRequests(kv: dict, maxRequestSize: int = None) -> List[schema_pb2.SetRequest]:
+    kvs = [schema_pb2.KeyValue(key=key, value=value)
+           for key, value in kv.items()]
+    return [schema_pb2.SetRequest(KVs=chunk) for chunk in chunking.split(
+        kvs, schema_pb2.KeyValue.ByteSize, maxRequestSize)]
+
+
+def buildRequest(kv: dict) -> schema_pb2.SetRequest:
+    return schema_pb2.SetRequest(
         KVs=[schema_pb2.KeyValue(key=key, value=value)
              for key, value in kv.items()]
     )
-    msg = service.Set(request)
+
+
+def response(msg) -> datatypes.SetResponse:
     return datatypes.SetResponse(
         id=msg.id,
         verified=False,
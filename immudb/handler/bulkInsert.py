@@ -0,0 +1,104 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import functools
+from typing import List
+
+from immudb.grpc import schema_pb2, schema_pb2_grpc
+from immudb.rootService import RootService
+from immudb.typeconv import set_sqlvalue
+
+
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, table: str, columns: List[str], rows, batchSize: int = 100, noWait: bool = False, parallel: int = 1) -> List[schema_pb2.SQLExecResult]:
+    if parallel <= 1:
+        return _call_with_executor(table, columns, rows, batchSize, noWait, service.SQLExec)
+    # every batch is its own transaction: up to parallel of them in flight
+    results = []
+    pending = deque()
+    try:
+        for request in buildRequests(table, columns, rows, batchSize, noWait):
+            if len(pending) >= parallel:
+                results.append(pending.popleft().result())
+            pending.append(service.SQLExec.future(request))
+        while len(pending) > 0:
+            results.append(pending.popleft().result())
+    finally:
+        for f in pending:
+            f.cancel()
+    return results
+
+
+def _call_with_executor(table: str, columns: List[str], rows, batchSize: int, noWait: bool, executor) -> List[schema_pb2.SQLExecResult]:
+    return [executor(request) for request in buildRequests(table, columns, rows, batchSize, noWait)]
+
+
+@functools.lru_cache(maxsize=64)
+def statement(table: str, columns: tuple, count: int) -> str:
+    """Returns the INSERT statement of count rows, the value of column j of
+    row i being the parameter ``@v<i>_<j>``
+    """
+    values = ", ".join(["(" + ", ".join(["@v{}_{}".format(i, j) for j in range(len(columns))]) + ")"
+                        for i in range(count)])
+    return "INSERT INTO {} ({}) VALUES {}".format(table, ", ".join(columns), values)
+
+
+@functools.lru_cache(maxsize=64)
+def _paramNames(columnsCount: int, count: int) -> List[List[str]]:
+    return [["v{}_{}".format(i, j) for j in range(columnsCount)] for i in range(count)]
+
+
+def buildRequests(table: str, columns: List[str], rows, batchSize: int, noWait: bool):
+    """Yields one SQLExecRequest inserting up to batchSize rows
+
+    Args:
+        table (str): table name
+        columns (List[str]): column names
+        rows (iterable): rows, as sequences in the order of columns or dicts
+            keyed by column name
+        batchSize (int): rows per request
+        noWait (bool): whether to wait for indexing
+
+    Yields:
+        SQLExecRequest: request
+    """
+    if batchSize < 1:
+        raise ValueError("batchSize must be positive")
+    columns = tuple(columns)
+    batch = []
+    for row in rows:
+        if isinstance(row, dict):
+            try:
+                row = [row[column] for column in columns]
+            except KeyError as e:
+                raise ValueError("Missing column {}".format(e)) from None
+        elif len(row) != len(columns):
+            raise ValueError("Expected {} values, got {}".format(
+                len(columns), len(row)))
+        batch.append(row)
+        if len(batch) == batchSize:
+            yield buildRequest(table, columns, batch, noWait)
+            batch = []
+    if len(batch) > 0:
+        yield buildRequest(table, columns, batch, noWait)
+
+
+def buildRequest(table: str, columns: tuple, batch: list, noWait: bool) -> schema_pb2.SQLExecRequest:
+    request = schema_pb2.SQLExecRequest(
+        sql=statement(table, columns, len(batch)), noWait=noWait)
+    params = request.params
+    for names, row in zip(_paramNames(len(columns), len(batch)), batch):
+        for name, value in zip(names, row):
+            param = params.add()
+            param.name = name
+            set_sqlvalue(param.value, value)
+    return request
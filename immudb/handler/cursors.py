@@ -0,0 +1,120 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Generator
+
+import grpc
+import google.protobuf.empty_pb2 as g_empty
+
+from immudb import datatypesv2
+from immudb.cursor import HistoryCursor, ScanCursor, TxScanCursor
+from immudb.grpc import schema_pb2
+from immudb.grpc import schema_pb2_grpc
+import immudb.dataconverter as dataconverter
+
+
+def _pin(service: schema_pb2_grpc.ImmuServiceStub, cursor):
+    # the local state can lag behind the server, so the snapshot is taken
+    # from the server's current state to include every committed write
+    if cursor.snapshotTx == None:
+        cursor.snapshotTx = service.CurrentState(g_empty.Empty()).txId
+
+
+def _history(service: schema_pb2_grpc.ImmuServiceStub, key: bytes, offset: int, limit: int, desc: bool, sinceTx: int):
+    try:
+        return service.History(schema_pb2.HistoryRequest(
+            key=key, offset=offset, limit=limit, desc=desc, sinceTx=sinceTx)).entries
+    except grpc.RpcError as e:
+        if hasattr(e, 'details') and 'offset out of range' in e.details():
+            return []
+        raise e
+
+
+def _valueAt(service: schema_pb2_grpc.ImmuServiceStub, key: bytes, snapshotTx: int, pageSize: int):
+    """Returns the revision of key current at snapshotTx, or None if the
+    key did not exist (or was deleted) then"""
+    offset = 0
+    while True:
+        entries = _history(service, key, offset, pageSize, True, snapshotTx)
+        for entry in entries:
+            if entry.tx <= snapshotTx:
+                if entry.metadata.deleted:
+                    return None
+                return entry
+        if len(entries) < pageSize:
+            return None
+        offset += len(entries)
+
+
+def scan(service: schema_pb2_grpc.ImmuServiceStub, cursor: ScanCursor, pageSize: int, raw: bool = False) -> Generator[datatypesv2.Entry, None, None]:
+    if cursor.finished:
+        return
+    _pin(service, cursor)
+    while True:
+        request = schema_pb2.ScanRequest(
+            seekKey=cursor.lastKey or b'',
+            prefix=cursor.prefix,
+            limit=pageSize,
+            sinceTx=cursor.snapshotTx,
+            inclusiveSeek=cursor.lastKey == None,
+        )
+        entries = service.Scan(request).entries
+        for entry in entries:
+            if entry.tx > cursor.snapshotTx:
+                # written after the snapshot: look for the previous value
+                entry = _valueAt(service, entry.key,
+                                 cursor.snapshotTx, pageSize)
+                if entry == None:
+                    continue
+            cursor.lastKey = entry.key
+            cursor.count += 1
+            yield entry if raw else dataconverter.convertResponse(entry)
+        if len(entries) < pageSize:
+            cursor.finished = True
+            return
+        cursor.lastKey = entries[-1].key
+
+
+def history(service: schema_pb2_grpc.ImmuServiceStub, cursor: HistoryCursor, pageSize: int, raw: bool = False) -> Generator[datatypesv2.Entry, None, None]:
+    if cursor.finished:
+        return
+    _pin(service, cursor)
+    while True:
+        entries = _history(service, cursor.key, cursor.offset,
+                           pageSize, False, cursor.snapshotTx)
+        for entry in entries:
+            if entry.tx > cursor.snapshotTx:
+                cursor.finished = True
+                return
+            cursor.offset += 1
+            yield entry if raw else dataconverter.convertResponse(entry)
+        if len(entries) < pageSize:
+            cursor.finished = True
+            return
+
+
+def txScan(service: schema_pb2_grpc.ImmuServiceStub, cursor: TxScanCursor, pageSize: int, raw: bool = False) -> Generator[datatypesv2.Tx, None, None]:
+    if cursor.finished:
+        return
+    _pin(service, cursor)
+    while cursor.nextTx <= cursor.snapshotTx:
+        request = schema_pb2.TxScanRequest(
+            initialTx=cursor.nextTx,
+            limit=min(pageSize, cursor.snapshotTx - cursor.nextTx + 1),
+        )
+        txs = service.TxScan(request).txs
+        if len(txs) == 0:
+            break
+        for tx in txs:
+            cursor.nextTx = tx.header.id + 1
+            yield tx if raw else dataconverter.convertResponse(tx)
+    cursor.finished = True
@@ -10,12 +10,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from immudb import datatypes
+from concurrent.futures import Future
+
+from typing import List
+
+from immudb import chunking, datatypes
 from immudb.grpc import schema_pb2, schema_pb2_grpc
+from immudb.pipeline import WritePipeline
 from immudb.rootService import RootService
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, ops: list, noWait: bool):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, ops: list, noWait: bool, maxRequestSize: int = None):
+    # operations can depend on previous ones (references, scores), so
+    # chunks are committed in order
+    for request in buildRequests(ops, noWait, maxRequestSize):
+        msg = service.ExecAll(request)
+    return msg
+
+
+def buildRequests(ops: list, noWait: bool, maxRequestSize: int = None) -> List[schema_pb2.ExecAllRequest]:
+    request = buildRequest(ops, noWait)
+    chunks = chunking.split(request.Operations,
+                            schema_pb2.Op.ByteSize, maxRequestSize)
+    if len(chunks) == 1:
+        return [request]
+    return [schema_pb2.ExecAllRequest(Operations=chunk, noWait=noWait) for chunk in chunks]
+
+
+def future(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, pipeline: WritePipeline, ops: list, noWait: bool) -> Future:
+    request = buildRequest(ops, noWait)
+    return pipeline.submit(lambda: service.ExecAll.future(request), lambda msg: msg)
+
+
+def buildRequest(ops: list, noWait: bool) -> schema_pb2.ExecAllRequest:
     request_ops = []
     for op in ops:
         if type(op) is datatypes.KeyValue:
@@ -56,6 +83,4 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, ops: list, n
         else:
             raise ("unknown op for execAll")
 
-    request = schema_pb2.ExecAllRequest(Operations=request_ops, noWait=noWait)
-    msg = service.ExecAll(request)
-    return msg
+    return schema_pb2.ExecAllRequest(Operations=request_ops, noWait=noWait)
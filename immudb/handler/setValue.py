@@ -10,22 +10,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Future
+
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService
 from immudb import datatypes
 from immudb.embedded.store import KVMetadata
+from immudb.pipeline import WritePipeline
 from immudb.typeconv import MetadataToProto
 
 
 def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, key: bytes, value: bytes, metadata: KVMetadata = None):
-    schemaMetadata = MetadataToProto(metadata)
+    msg = service.Set(buildRequest(key, value, metadata))
+    return response(msg)
+
+
+def future(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, pipeline: WritePipeline, key: bytes, value: bytes, metadata: KVMetadata = None) -> Future:
+    request = buildRequest(key, value, metadata)
+    return pipeline.submit(lambda: service.Set.future(request), response)
 
-    request = schema_pb2.SetRequest(
+
+def buildRequest(key: bytes, value: bytes, metadata: KVMetadata = None) -> schema_pb2.SetRequest:
+    schemaMetadata = MetadataToProto(metadata)
+    return schema_pb2.SetRequest(
         KVs=[schema_pb2.KeyValue(key=key, value=value,
                                  metadata=schemaMetadata)]
     )
-    msg = service.Set(request)
+
+
+def response(msg) -> datatypes.SetResponse:
     return datatypes.SetResponse(
         id=msg.id,
         verified=False,
@@ -14,27 +14,51 @@ from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService
 from immudb.typeconv import py_to_sqlvalue
-from immudb.typeconv import sqlvalue_to_py
+from immudb.typeconv import sqlvalue_to_py, sqlvalue_decoder
 from immudb import constants
 from immudb.exceptions import ErrPySDKInvalidColumnMode
+from immudb.columnar import ColumnarResult
+import functools
+import queue
+import threading
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, query, params, columnNameMode, dbname):
-    return _call_with_executor(query, params, columnNameMode, dbname, service.SQLQuery)
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, query, params, columnNameMode, dbname, prefetch=0):
+    return _call_with_executor(query, params, columnNameMode, dbname, service.SQLQuery, prefetch)
 
 
-def _call_with_executor(query, params, columnNameMode, dbname, executor):
+def callColumnar(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, query, params, columnNameMode, dbname) -> ColumnarResult:
+    result = None
+    for res in service.SQLQuery(buildRequest(query, params)):
+        if result == None:
+            result = columnarResult(res, columnNameMode, dbname)
+        result.append(res.rows)
+    return result
+
+
+def buildRequest(query, params) -> schema_pb2.SQLQueryRequest:
     paramsObj = []
     for key, value in params.items():
         paramsObj.append(schema_pb2.NamedParam(
             name=key, value=py_to_sqlvalue(value)))
 
-    request = schema_pb2.SQLQueryRequest(
+    return schema_pb2.SQLQueryRequest(
         sql=query,
         acceptStream=True,
         params=paramsObj)
 
-    resp = executor(request)
+
+def columnarResult(resp, columnNameMode, dbname) -> ColumnarResult:
+    if columnNameMode == constants.COLUMN_NAME_MODE_NONE:
+        columnNameMode = constants.COLUMN_NAME_MODE_FIELD
+    return ColumnarResult(getColumnNames(resp, dbname, columnNameMode),
+                          [column.type for column in resp.columns])
+
+
+def _call_with_executor(query, params, columnNameMode, dbname, executor, prefetch=0):
+    resp = executor(buildRequest(query, params))
+    if prefetch > 0:
+        return PrefetchingRowIterator(resp, columnNameMode, dbname, prefetch)
     return RowIterator(resp, columnNameMode, dbname)
 
 
@@ -45,29 +69,22 @@ def fix_colnames(cols, dbname, columnNameMode):
     return [x.replace("[@DB]", dbname.decode("utf-8")) for x in cols]
 
 
-def unpack_rows(resp, columnNameMode, colNames):
-    result = []
-    for row in resp.rows:
-        if columnNameMode == constants.COLUMN_NAME_MODE_NONE:
-            result.append(tuple([sqlvalue_to_py(i) for i in row.values]))
-        else:
-            result.append(
-                dict(zip(colNames, tuple([sqlvalue_to_py(i) for i in row.values]))))
-    return result
+def getColumnNames(resp, dbname, columnNameMode):
+    return columnNames([column.name for column in resp.columns], dbname, columnNameMode)
 
 
-def getColumnNames(resp, dbname, columnNameMode):
+def columnNames(names, dbname, columnNameMode):
     cols = []
     if columnNameMode == constants.COLUMN_NAME_MODE_NONE:
         return cols
 
-    for column in resp.columns:
+    for name in names:
         # note that depending on the version parts can be
         # '(dbname.tablename.fieldname)' *or*
         # '(tablename.fieldname)' without dbnname.
         # In that case we mimic the old behavior by using [@DB] as placeholder
         # that will be replaced at higher level.
-        parts = column.name.strip("()").split(".")
+        parts = name.strip("()").split(".")
         if columnNameMode == constants.COLUMN_NAME_MODE_FIELD:
             cols.append(parts[-1])
             continue
@@ -88,6 +105,65 @@ def getColumnNames(resp, dbname, columnNameMode):
     return fix_colnames(cols, dbname, columnNameMode)
 
 
+class RowDecoder:
+    """Decoder of the rows of one result shape, with one decoder per
+    column chosen from its type.
+    """
+
+    def __init__(self, names, types, columnNameMode):
+        self.names = names
+        self._keys = tuple(names)
+        self._decoders = [sqlvalue_decoder(t) for t in types]
+        self._asDict = columnNameMode != constants.COLUMN_NAME_MODE_NONE
+
+    def decode(self, rows) -> list:
+        """Converts rows to tuples, or to dicts keyed by column name
+
+        Args:
+            rows: schema_pb2.Row list
+
+        Returns:
+            list: converted rows
+        """
+        decoders = self._decoders
+        if len(decoders) == 0:
+            # no column metadata, every value is converted by its own type
+            values = [tuple([sqlvalue_to_py(v) for v in row.values])
+                      for row in rows]
+        else:
+            values = [tuple([decode(v) for decode, v in zip(decoders, row.values)])
+                      for row in rows]
+        if not self._asDict:
+            return values
+        keys = self._keys
+        return [dict(zip(keys, row)) for row in values]
+
+
+@functools.lru_cache(maxsize=256)
+def _rowDecoder(columns, columnNameMode, dbname) -> RowDecoder:
+    namesMode = columnNameMode
+    if namesMode == constants.COLUMN_NAME_MODE_NONE:
+        namesMode = constants.COLUMN_NAME_MODE_FIELD
+    names = columnNames([name for name, _ in columns], dbname, namesMode)
+    return RowDecoder(names, [typ for _, typ in columns], columnNameMode)
+
+
+def rowDecoder(resp, columnNameMode, dbname) -> RowDecoder:
+    """Returns the decoder for the columns of a query result, shared by
+    all the results with the same column names and types
+
+    Args:
+        resp (schema_pb2.SQLQueryResult): query result
+        columnNameMode: mode of the column names
+        dbname (bytes): current database
+
+    Returns:
+        RowDecoder: decoder
+    """
+    columns = tuple([(column.name, column.type) for column in resp.columns])
+    return _rowDecoder(columns, columnNameMode, dbname)
+
+
 class ClosedIterator(BaseException):
     pass
 
@@ -98,6 +174,7 @@ class RowIterator:
         self._nextRow = 0
         self._rows = []
         self._columns = None
+        self._decoder = None
         self._colNameMode = colNameMode
         self._dbname = dbname
         self._closed = False
@@ -120,19 +197,16 @@ class RowIterator:
             return
 
         res = next(self._grpcIt)
-        if self._columns == None:
-            self._columns = getColumnNames(res, self._dbname, self._colsMode())
+        if self._decoder == None:
+            self._decoder = rowDecoder(res, self._colNameMode, self._dbname)
+            self._columns = list(self._decoder.names)
 
-        self._rows = unpack_rows(
-            res, self._colNameMode, self._columns)
+        self._rows = self._decoder.decode(res.rows)
         self._nextRow = 0
 
         if len(self._rows) == 0:
             raise StopIteration
 
-    def _colsMode(self):
-        return self._colNameMode if self._colNameMode != constants.COLUMN_NAME_MODE_NONE else constants.COLUMN_NAME_MODE_FIELD
-
     def columns(self):
         self._fetch_next()
         return self._columns
@@ -143,3 +217,80 @@ class RowIterator:
 
         self._grpcIt.cancel()
         self._closed = True
+
+
+# end of the stream, queued by the reader of PrefetchingRowIterator
+_END = object()
+
+
+class PrefetchingRowIterator(RowIterator):
+    """RowIterator reading and decoding the next batches of the stream on a
+    background thread while the current one is consumed.
+
+    At most ``prefetch`` decoded batches are queued, the reader waiting for
+    the consumer beyond that. ``close`` must be called if the iterator is
+    not consumed to the end, to cancel the stream and stop the reader.
+    """
+
+    def __init__(self, grpcIt, colNameMode, dbname, prefetch=2) -> None:
+        super().__init__(grpcIt, colNameMode, dbname)
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._finished = False
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read(self):
+        decoder = None
+        try:
+            for res in self._grpcIt:
+                if decoder == None:
+                    decoder = rowDecoder(res, self._colNameMode, self._dbname)
+                rows = decoder.decode(res.rows)
+                if not self._put((decoder, rows)) or len(rows) == 0:
+                    return
+            self._put(_END)
+        except Exception as e:
+            # raised to the consumer, unless the stream was closed
+            self._put(e)
+
+    def _fetch_next(self):
+        if self._closed:
+            raise ClosedIterator
+
+        if self._nextRow < len(self._rows):
+            return
+
+        if self._finished:
+            raise StopIteration
+
+        item = self._queue.get()
+        if item is _END:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, Exception):
+            self._finished = True
+            raise item
+        decoder, self._rows = item
+        if self._decoder == None:
+            self._decoder = decoder
+            self._columns = list(decoder.names)
+        self._nextRow = 0
+
+        if len(self._rows) == 0:
+            self._finished = True
+            raise StopIteration
+
+    def close(self):
+        super().close()
+        self._stop.set()
+        self._reader.join()
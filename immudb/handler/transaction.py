@@ -18,6 +18,8 @@ from immudb import constants
 from immudb import grpcutils
 from immudb.handler.sqlquery import _call_with_executor as executeSQLQuery
 from immudb.handler.sqlexec import _call_with_executor as executeSQLExec
+from immudb.handler.bulkInsert import _call_with_executor as executeBulkInsert
+from immudb.prepared import PreparedStatement
 
 
 class Tx:
@@ -53,12 +55,25 @@ class Tx:
         self.txStub = None
         return resp
 
-    def sqlQuery(self, query, params=dict(), columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False):
+    def sqlQuery(self, query, params=dict(), columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False, prefetch=0):
         it = executeSQLQuery(query, params, columnNameMode,
-                             self.dbname, self.txStub.TxSQLQuery)
+                             self.dbname, self.txStub.TxSQLQuery, prefetch)
         if acceptStream:
             return it
         return list(it)
 
     def sqlExec(self, stmt, params=dict(), noWait=False):
         return executeSQLExec(stmt, params, noWait, self.txStub.TxSQLExec)
+
+    def prepare(self, stmt, batchSize=100):
+        # the stub is looked up on each call, it is gone once committed
+        def execute(request):
+            return self.txStub.TxSQLExec(request)
+
+        def query(request):
+            return self.txStub.TxSQLQuery(request)
+        return PreparedStatement(stmt, execute, query, self.dbname,
+                                 inTransaction=True, batchSize=batchSize)
+
+    def bulkInsert(self, table, columns, rows, batchSize=100, noWait=False):
+        return executeBulkInsert(table, columns, rows, batchSize, noWait, self.txStub.TxSQLExec)
@@ -0,0 +1,171 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+from typing import Dict, List
+
+from immudb.embedded import store
+from immudb.handler import batchGet
+from immudb.grpc import schema_pb2
+from immudb.grpc import schema_pb2_grpc
+from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
+from immudb import datatypes
+from immudb.exceptions import ErrCorruptedData
+import immudb.database as database
+import immudb.schema as schema
+
+
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, keys: List[bytes], verifying_key=None, cache: VerifiedTxCache = None, maxRequestSize: int = None, maxInFlight: int = 16) -> Dict[bytes, datatypes.SafeGetResponse]:
+    if len(keys) == 0:
+        return {}
+    state = rs.get()
+    entries = batchGet.getAllEntries(service, keys, maxRequestSize)
+    byTx = groupByTx(entries)
+    highest = max(byTx)
+    requests = [schema_pb2.VerifiableTxRequest(
+        tx=highest, proveSinceTx=state.txId)]
+    requests.extend(schema_pb2.VerifiableTxRequest(tx=tx, proveSinceTx=highest)
+                    for tx in byTx if tx != highest)
+    vtxs = dict()
+    pending = deque()
+    try:
+        # up to maxInFlight transactions are requested concurrently
+        for request in requests:
+            if len(pending) >= maxInFlight:
+                tx, f = pending.popleft()
+                vtxs[tx] = f.result()
+            pending.append(
+                (request.tx, service.VerifiableTxById.future(request)))
+        while len(pending) > 0:
+            tx, f = pending.popleft()
+            vtxs[tx] = f.result()
+    finally:
+        for _, f in pending:
+            f.cancel()
+    return verify(byTx, vtxs, state, verifying_key, rs, cache)
+
+
+def entryTx(entry) -> int:
+    if entry.HasField("referencedBy"):
+        return entry.referencedBy.tx
+    return entry.tx
+
+
+def groupByTx(entries) -> Dict[int, list]:
+    byTx = dict()
+    for entry in entries:
+        byTx.setdefault(entryTx(entry), []).append(entry)
+    return byTx
+
+
+def _verifyEntries(tx: store.Tx, entries: list):
+    entrySpecDigest = store.EntrySpecDigestFor(tx.header.version)
+    indexOf = {txEntry.key(): index for index,
+               txEntry in enumerate(tx.entries)}
+    for entry in entries:
+        if not entry.HasField("referencedBy"):
+            e = database.EncodeEntrySpec(entry.key, schema.KVMetadataFromProto(
+                entry.metadata), entry.value)
+        else:
+            ref = entry.referencedBy
+            e = database.EncodeReference(ref.key, schema.KVMetadataFromProto(
+                ref.metadata), entry.key, ref.atTx)
+        if e.key not in indexOf:
+            raise ErrCorruptedData
+        inclusionProof = tx.htree.InclusionProof(indexOf[e.key])
+        if not store.VerifyInclusion(inclusionProof, entrySpecDigest(e), tx.header.eh):
+            raise ErrCorruptedData
+
+
+def verify(byTx: Dict[int, list], vtxs: dict, state, verifying_key, rs: RootService, cache: VerifiedTxCache = None) -> Dict[bytes, datatypes.SafeGetResponse]:
+    """Verifies entries grouped by transaction.
+
+    The highest transaction is proven against the trusted state with a
+    single dual proof; every other transaction is proven against the
+    highest one, so the state is advanced (and stored) only once.
+    """
+    highest = max(byTx)
+    txs = dict()
+    for txId, vtx in vtxs.items():
+        tx = schema.TxFromProto(vtx.tx)
+        if tx.header.iD != txId:
+            raise ErrCorruptedData
+        _verifyEntries(tx, byTx[txId])
+        txs[txId] = tx
+
+    hvtx = vtxs[highest]
+    highestAlh = txs[highest].header.Alh()
+    if state.txId <= highest:
+        sourceid = state.txId
+        sourcealh = schema.DigestFromProto(state.txHash)
+        targetid = highest
+        targetalh = highestAlh
+    else:
+        sourceid = highest
+        sourcealh = highestAlh
+        targetid = state.txId
+        targetalh = schema.DigestFromProto(state.txHash)
+    if state.txId > 0:
+        verifies = verifyDualProof(
+            cache, state,
+            schema.DualProofFromProto(hvtx.dualProof),
+            sourceid,
+            targetid,
+            sourcealh,
+            targetalh)
+        if not verifies:
+            raise ErrCorruptedData
+
+    for txId, tx in txs.items():
+        if txId == highest:
+            continue
+        verifies = verifyDualProof(
+            cache, state,
+            schema.DualProofFromProto(vtxs[txId].dualProof),
+            txId,
+            highest,
+            tx.header.Alh(),
+            highestAlh)
+        if not verifies:
+            raise ErrCorruptedData
+
+    newstate = State(
+        db=state.db,
+        txId=targetid,
+        txHash=targetalh,
+        publicKey=hvtx.signature.publicKey,
+        signature=hvtx.signature.signature,
+    )
+    if verifying_key != None:
+        newstate.Verify(verifying_key)
+    rs.set(newstate)
+
+    ret = dict()
+    for txId, entries in byTx.items():
+        for entry in entries:
+            if entry.HasField("referencedBy"):
+                requested = entry.referencedBy.key
+                refkey = entry.referencedBy.key
+            else:
+                requested = entry.key
+                refkey = None
+            ret[requested] = datatypes.SafeGetResponse(
+                id=txId,
+                key=entry.key,
+                value=entry.value,
+                timestamp=txs[txId].header.ts,
+                verified=True,
+                refkey=refkey,
+                revision=entry.revision
+            )
+    return ret
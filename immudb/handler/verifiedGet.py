@@ -14,13 +14,14 @@ from immudb.embedded import store
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
 from immudb import datatypes
 from immudb.exceptions import ErrCorruptedData
 import immudb.database as database
 import immudb.schema as schema
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, requestkey: bytes, atTx: int = None, verifying_key=None, sinceTx: int = None, atRevision: int = None):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, requestkey: bytes, atTx: int = None, verifying_key=None, sinceTx: int = None, atRevision: int = None, cache: VerifiedTxCache = None):
     state = rs.get()
     req = schema_pb2.VerifiableGetRequest(
         keyRequest=schema_pb2.KeyRequest(
@@ -28,6 +29,10 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, requestkey:
         proveSinceTx=state.txId
     )
     ventry = service.VerifiableGet(req)
+    return verify(ventry, state, requestkey, verifying_key, rs, cache)
+
+
+def verify(ventry, state, requestkey: bytes, verifying_key, rs: RootService, cache: VerifiedTxCache = None):
     entrySpecDigest = store.EntrySpecDigestFor(
         int(ventry.verifiableTx.tx.header.version))
     inclusionProof = schema.InclusionProofFromProto(ventry.inclusionProof)
@@ -63,7 +68,8 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, requestkey:
         raise ErrCorruptedData
 
     if state.txId > 0:
-        verifies = store.VerifyDualProof(
+        verifies = verifyDualProof(
+            cache, state,
             dualProof,
             sourceid,
             targetid,
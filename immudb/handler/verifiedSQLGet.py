@@ -14,51 +14,171 @@ from immudb.embedded import store
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
-from immudb.exceptions import ErrCorruptedData
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
+from immudb.exceptions import ErrCorruptedData, ErrInvalidValue
 import immudb.schema as schema
 from typing import List
 from immudb import datatypesv2
 from immudb.dataconverter import convertResponse
+from collections import deque
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, table: str, primaryKeys: List[datatypesv2.PrimaryKey], atTx: int, sinceTx: int, verifying_key=None):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, table: str, primaryKeys: List[datatypesv2.PrimaryKey], atTx: int, sinceTx: int, verifying_key=None, cache: VerifiedTxCache = None):
     state = rs.get()
-    pkValues = [pk._getGRPC() for pk in primaryKeys]
-    req = schema_pb2.VerifiableSQLGetRequest(
+    ventry = service.VerifiableSQLGet(buildRequest(
+        table, primaryKeys, atTx, sinceTx, state))
+    return verify(ventry, state, primaryKeys, verifying_key, rs, cache)
+
+
+def callMany(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, table: str, primaryKeysList: List[List[datatypesv2.PrimaryKey]], atTx: int, sinceTx: int, verifying_key=None, cache: VerifiedTxCache = None, tables: dict = None, maxInFlight: int = 16) -> List[datatypesv2.VerifiableSQLEntry]:
+    """Verified get of many rows of a table, with up to maxInFlight requests
+    sent concurrently. All rows are proven against the same trusted state,
+    set once when all of them are verified.
+
+    Args:
+        tables (dict, optional): TableMetadata by (database, table), reused
+            across calls
+    """
+    state = rs.get()
+    if tables is None:
+        tables = dict()
+    batch = VerifiedRows(state, table, tables, cache)
+    pending = deque()
+    try:
+        for primaryKeys in primaryKeysList:
+            if len(pending) >= maxInFlight:
+                batch.add(*_result(pending.popleft()))
+            req = buildRequest(table, primaryKeys, atTx, sinceTx, state)
+            pending.append(
+                (service.VerifiableSQLGet.future(req), primaryKeys))
+        while len(pending) > 0:
+            batch.add(*_result(pending.popleft()))
+    finally:
+        for f, _ in pending:
+            f.cancel()
+    batch.setState(verifying_key, rs)
+    return batch.entries
+
+
+def _result(pending):
+    f, primaryKeys = pending
+    return f.result(), primaryKeys
+
+
+def buildRequest(table: str, primaryKeys: List[datatypesv2.PrimaryKey], atTx: int, sinceTx: int, state: State) -> schema_pb2.VerifiableSQLGetRequest:
+    return schema_pb2.VerifiableSQLGetRequest(
         sqlGetRequest=schema_pb2.SQLGetRequest(
             table=table,
-            pkValues=pkValues,
+            pkValues=[pk._getGRPC() for pk in primaryKeys],
             atTx=atTx,
             sinceTx=sinceTx
         ),
         proveSinceTx=state.txId
     )
-    ventry = service.VerifiableSQLGet(req)
-    entrySpecDigest = store.EntrySpecDigestFor(
-        int(ventry.verifiableTx.tx.header.version))
-    inclusionProof = schema.InclusionProofFromProto(ventry.inclusionProof)
-    dualProof = schema.DualProofFromProto(ventry.verifiableTx.dualProof)
-    if len(ventry.ColNamesById) == 0:
-        raise ErrCorruptedData
 
-    dbID = ventry.DatabaseId
-    tableID = ventry.TableId
-    valbuf = b''
-    for index in range(len(primaryKeys)):
-        pkCurrent = primaryKeys[index]
-        pkID = ventry.PKIDs[index]
-        pkType = ventry.ColTypesById[pkID]
-        pkLen = ventry.ColLenById[pkID]
-        pkEncval = store.encodeAsKey(pkCurrent.value, pkCurrent, int(pkLen))
-        valbuf += pkEncval
-
-    pkKey = store.sqlMapKey(b'\x02', 'R.', [
-        store.encodeID(dbID), store.encodeID(
-            tableID), store.encodeID(0), valbuf
-    ])
-    vTx = ventry.sqlEntry.tx
-    e = store.EntrySpec(key=pkKey, value=ventry.sqlEntry.value, md=None)
 
+class TableMetadata:
+    """Columns of a table, as sent with every VerifiableSQLEntry"""
+
+    def __init__(self, ventry):
+        if len(ventry.ColNamesById) == 0:
+            raise ErrCorruptedData
+        self.DatabaseId = ventry.DatabaseId
+        self.TableId = ventry.TableId
+        self.PKIDs = [x for x in ventry.PKIDs]
+        self.ColNamesById = dict(ventry.ColNamesById)
+        self.ColIdsByName = dict(ventry.ColIdsByName)
+        self.ColTypesById = dict(ventry.ColTypesById)
+        self.ColLenById = dict(ventry.ColLenById)
+        try:
+            self.keyEncoder = store.KeyEncoder(self.DatabaseId, self.TableId, [
+                self.ColTypesById[pkID] for pkID in self.PKIDs], [
+                self.ColLenById[pkID] for pkID in self.PKIDs])
+        except ErrInvalidValue:
+            # primary key type without a compiled encoding
+            self.keyEncoder = None
+
+    def matches(self, ventry) -> bool:
+        # columns can be renamed, dropped and added keeping their count
+        return (ventry.DatabaseId == self.DatabaseId and ventry.TableId == self.TableId
+                and list(ventry.PKIDs) == self.PKIDs
+                and dict(ventry.ColNamesById) == self.ColNamesById
+                and dict(ventry.ColIdsByName) == self.ColIdsByName
+                and dict(ventry.ColTypesById) == self.ColTypesById
+                and dict(ventry.ColLenById) == self.ColLenById)
+
+    def rowKey(self, primaryKeys: List[datatypesv2.PrimaryKey]) -> bytes:
+        if self.keyEncoder != None:
+            return self.keyEncoder.encode([pk.value for pk in primaryKeys])
+        if len(primaryKeys) > len(self.PKIDs):
+            raise ErrCorruptedData
+        valbuf = b''.join([store.encodeAsKey(pk.value, pk, int(self.ColLenById[pkID]))
+                           for pk, pkID in zip(primaryKeys, self.PKIDs)])
+        return store.sqlMapKey(b'\x02', 'R.', [store.encodeID(self.DatabaseId), store.encodeID(
+            self.TableId), store.encodeID(0), valbuf])
+
+
+class VerifiedRows:
+    """Rows verified against one trusted state. Dual proofs are verified
+    once per transaction, rows of the same transaction sharing the same
+    proof.
+    """
+
+    def __init__(self, state, table: str, tables: dict, cache: VerifiedTxCache = None):
+        self.state = state
+        self.table = table
+        self.tables = tables
+        self.cache = cache
+        self.entries = []
+        # tx id -> (dual proof message, proof ends, eh)
+        self._proven = dict()
+        self._target = None
+
+    def _metadata(self, ventry) -> TableMetadata:
+        key = (self.state.db, self.table)
+        meta = self.tables.get(key)
+        if meta is None or not meta.matches(ventry):
+            meta = TableMetadata(ventry)
+            self.tables[key] = meta
+        return meta
+
+    def add(self, ventry, primaryKeys: List[datatypesv2.PrimaryKey]):
+        meta = self._metadata(ventry)
+        vTx = ventry.sqlEntry.tx
+        proven = self._proven.get(vTx)
+        if proven is None or proven[0] != ventry.verifiableTx.dualProof:
+            dualProof = schema.DualProofFromProto(
+                ventry.verifiableTx.dualProof)
+            ends = _proofEnds(self.state, vTx, ventry, dualProof)
+            if self.state.txId > 0:
+                if not verifyDualProof(self.cache, self.state, dualProof, *ends[1:]):
+                    raise ErrCorruptedData
+            proven = (ventry.verifiableTx.dualProof, ends)
+            self._proven[vTx] = proven
+        eh, sourceid, targetid, sourcealh, targetalh = proven[1]
+        inclusionProof = _verifyInclusion(
+            ventry, meta.rowKey(primaryKeys), eh)
+        if self._target is None or targetid > self._target[0]:
+            self._target = (targetid, targetalh, ventry.verifiableTx.signature)
+        self.entries.append(_entry(ventry, inclusionProof, meta))
+
+    def setState(self, verifying_key, rs: RootService):
+        if self._target is None:
+            return
+        targetid, targetalh, signature = self._target
+        newstate = State(
+            db=self.state.db,
+            txId=targetid,
+            txHash=targetalh,
+            publicKey=signature.publicKey,
+            signature=signature.signature,
+        )
+        if verifying_key != None:
+            newstate.Verify(verifying_key)
+        rs.set(newstate)
+
+
+def _proofEnds(state, vTx: int, ventry, dualProof):
     if state.txId <= vTx:
         eh = schema.DigestFromProto(
             ventry.verifiableTx.dualProof.targetTxHeader.eH)
@@ -73,56 +193,39 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, table: str,
         sourcealh = dualProof.sourceTxHeader.Alh()
         targetid = state.txId
         targetalh = schema.DigestFromProto(state.txHash)
+    return eh, sourceid, targetid, sourcealh, targetalh
+
 
-    verifies = store.VerifyInclusion(inclusionProof, entrySpecDigest(e), eh)
-    if not verifies:
+def _verifyInclusion(ventry, pkKey: bytes, eh):
+    entrySpecDigest = store.EntrySpecDigestFor(
+        int(ventry.verifiableTx.tx.header.version))
+    inclusionProof = schema.InclusionProofFromProto(ventry.inclusionProof)
+    e = store.EntrySpec(key=pkKey, value=ventry.sqlEntry.value, md=None)
+    if not store.VerifyInclusion(inclusionProof, entrySpecDigest(e), eh):
         raise ErrCorruptedData
+    return inclusionProof
 
-    if state.txId > 0:
-        verifies = store.VerifyDualProof(
-            dualProof,
-            sourceid,
-            targetid,
-            sourcealh,
-            targetalh)
-        if not verifies:
-            raise ErrCorruptedData
-    newstate = State(
-        db=state.db,
-        txId=targetid,
-        txHash=targetalh,
-        publicKey=ventry.verifiableTx.signature.publicKey,
-        signature=ventry.verifiableTx.signature.signature,
-    )
-    if verifying_key != None:
-        newstate.Verify(verifying_key)
-    rs.set(newstate)
-
-    simpleList = [x for x in ventry.PKIDs]
-    ColNamesById = dict()
-    for key in ventry.ColNamesById:
-        ColNamesById[key] = ventry.ColNamesById[key]
-    ColIdsByName = dict()
-    for key in ventry.ColIdsByName:
-        ColIdsByName[key] = ventry.ColIdsByName[key]
-    ColTypesById = dict()
-    for key in ventry.ColTypesById:
-        ColTypesById[key] = ventry.ColTypesById[key]
-    ColLenById = dict()
-    for key in ventry.ColLenById:
-        ColLenById[key] = ventry.ColLenById[key]
+
+def _entry(ventry, inclusionProof, meta: TableMetadata) -> datatypesv2.VerifiableSQLEntry:
     return datatypesv2.VerifiableSQLEntry(
         sqlEntry=datatypesv2.SQLEntry(
             tx=ventry.sqlEntry.tx, key=ventry.sqlEntry.key, value=ventry.sqlEntry.value),
         verifiableTx=convertResponse(ventry.verifiableTx),
         inclusionProof=datatypesv2.InclusionProof(
             leaf=inclusionProof.leaf, width=inclusionProof.width, terms=inclusionProof.terms),
-        DatabaseId=dbID,
-        TableId=tableID,
-        PKIDs=simpleList,
-        ColNamesById=ColNamesById,
-        ColIdsByName=ColIdsByName,
-        ColTypesById=ColTypesById,
-        ColLenById=ColLenById,
+        DatabaseId=meta.DatabaseId,
+        TableId=meta.TableId,
+        PKIDs=meta.PKIDs,
+        ColNamesById=meta.ColNamesById,
+        ColIdsByName=meta.ColIdsByName,
+        ColTypesById=meta.ColTypesById,
+        ColLenById=meta.ColLenById,
         verified=True
     )
+
+
+def verify(ventry, state, primaryKeys: List[datatypesv2.PrimaryKey], verifying_key, rs: RootService, cache: VerifiedTxCache = None):
+    batch = VerifiedRows(state, None, dict(), cache)
+    batch.add(ventry, primaryKeys)
+    batch.setState(verifying_key, rs)
+    return batch.entries[0]
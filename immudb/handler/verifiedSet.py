@@ -10,29 +10,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import Future
+
 from immudb.exceptions import ErrCorruptedData
 
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
 from immudb import datatypes
 from immudb.embedded import store
 import immudb.database as database
 import immudb.schema as schema
+from immudb.pipeline import WritePipeline
 from immudb.typeconv import MetadataToProto
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, key: bytes, value: bytes, verifying_key=None, metadata=None):
-    schemaMetadata = MetadataToProto(metadata)
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, key: bytes, value: bytes, verifying_key=None, metadata=None, cache: VerifiedTxCache = None):
     state = rs.get()
     # print(base64.b64encode(state.SerializeToString()))
+    rawRequest = buildRequest(key, value, metadata, state)
+    verifiableTx = service.VerifiableSet(rawRequest)
+    # print(base64.b64encode(verifiableTx.SerializeToString()))
+    return verify(verifiableTx, state, key, value, verifying_key, rs, cache)
+
+
+def future(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, pipeline: WritePipeline, key: bytes, value: bytes, verifying_key=None, metadata=None, cache: VerifiedTxCache = None) -> Future:
+    state = rs.get()
+    rawRequest = buildRequest(key, value, metadata, state)
+    return pipeline.submit(
+        lambda: service.VerifiableSet.future(rawRequest),
+        lambda verifiableTx: verify(
+            verifiableTx, state, key, value, verifying_key, rs, cache),
+        verify=True)
+
+
+def buildRequest(key: bytes, value: bytes, metadata, state) -> schema_pb2.VerifiableSetRequest:
+    schemaMetadata = MetadataToProto(metadata)
     kv = schema_pb2.KeyValue(key=key, value=value, metadata=schemaMetadata)
-    rawRequest = schema_pb2.VerifiableSetRequest(
+    return schema_pb2.VerifiableSetRequest(
         setRequest=schema_pb2.SetRequest(KVs=[kv]),
         proveSinceTx=state.txId,
     )
-    verifiableTx = service.VerifiableSet(rawRequest)
-    # print(base64.b64encode(verifiableTx.SerializeToString()))
+
+
+def verify(verifiableTx, state, key: bytes, value: bytes, verifying_key, rs: RootService, cache: VerifiedTxCache = None):
     if verifiableTx.tx.header.nentries != 1 or len(verifiableTx.tx.entries) != 1:
         raise ErrCorruptedData
     tx = schema.TxFromProto(verifiableTx.tx)
@@ -57,7 +79,8 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, key: bytes,
     targetAlh = tx.header.Alh()
 
     if state.txId > 0:
-        verifies = store.VerifyDualProof(
+        verifies = verifyDualProof(
+            cache, state,
             schema.DualProofFromProto(verifiableTx.dualProof),
             sourceID,
             targetID,
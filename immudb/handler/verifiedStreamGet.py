@@ -0,0 +1,119 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+
+from immudb.embedded import store
+from immudb.grpc import schema_pb2
+from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
+from immudb.exceptions import ErrCorruptedData
+from immudb.constants import PLAIN_VALUE_PREFIX
+import immudb.database as database
+import immudb.schema as schema
+
+
+class ValueVerifier:
+    """Verifies an entry whose value is received in chunks.
+
+    The dual proof (and the state signature) are checked when the verifier
+    is created, from the headers of the stream. Every chunk of the value is
+    then fed to update(), which only keeps a running sha256, and finish()
+    checks the inclusion of the entry and commits the new state, once the
+    whole value went through.
+
+    For references, the inclusion proof covers the reference entry, not the
+    value, so it is checked up front as well.
+    """
+
+    def __init__(self, entry: schema_pb2.Entry, verifiableTx: schema_pb2.VerifiableTx, inclusionProof: schema_pb2.InclusionProof, state, verifying_key, rs: RootService, cache: VerifiedTxCache = None):
+        self._entry = entry
+        self._rs = rs
+        self._entrySpecDigest = store.EntrySpecDigestWithValueDigestFor(
+            int(verifiableTx.tx.header.version))
+        self._inclusionProof = schema.InclusionProofFromProto(inclusionProof)
+        self._valueHash = hashlib.sha256(PLAIN_VALUE_PREFIX)
+        self._done = False
+        dualProof = schema.DualProofFromProto(verifiableTx.dualProof)
+
+        if not entry.HasField("referencedBy"):
+            self._vTx = entry.tx
+        else:
+            self._vTx = entry.referencedBy.tx
+
+        if state.txId <= self._vTx:
+            self._eh = schema.DigestFromProto(
+                verifiableTx.dualProof.targetTxHeader.eH)
+            sourceid = state.txId
+            sourcealh = schema.DigestFromProto(state.txHash)
+            targetid = self._vTx
+            targetalh = dualProof.targetTxHeader.Alh()
+        else:
+            self._eh = schema.DigestFromProto(
+                verifiableTx.dualProof.sourceTxHeader.eH)
+            sourceid = self._vTx
+            sourcealh = dualProof.sourceTxHeader.Alh()
+            targetid = state.txId
+            targetalh = schema.DigestFromProto(state.txHash)
+
+        if state.txId > 0:
+            if not verifyDualProof(cache, state, dualProof, sourceid, targetid, sourcealh, targetalh):
+                raise ErrCorruptedData
+        self._newstate = State(
+            db=state.db,
+            txId=targetid,
+            txHash=targetalh,
+            publicKey=verifiableTx.signature.publicKey,
+            signature=verifiableTx.signature.signature,
+        )
+        if verifying_key != None:
+            self._newstate.Verify(verifying_key)
+
+        if entry.HasField("referencedBy"):
+            ref = entry.referencedBy
+            e = database.EncodeReference(ref.key, schema.KVMetadataFromProto(
+                ref.metadata), entry.key, ref.atTx)
+            self._verifyInclusion(
+                e, hashlib.sha256(e.value).digest())
+
+    @property
+    def txId(self) -> int:
+        return self._vTx
+
+    def _verifyInclusion(self, e: store.EntrySpec, valueDigest: bytes):
+        digest = self._entrySpecDigest(e, valueDigest)
+        if not store.VerifyInclusion(self._inclusionProof, digest, self._eh):
+            raise ErrCorruptedData
+
+    def update(self, chunk):
+        """Adds a chunk of the value
+
+        Args:
+            chunk (bytes): next chunk, any bytes-like object
+        """
+        self._valueHash.update(chunk)
+
+    def finish(self):
+        """Verifies the entry once all its value has been passed to update(),
+        and commits the new state
+
+        Raises:
+            ErrCorruptedData: When the value does not match the proofs
+        """
+        if self._done:
+            return
+        if not self._entry.HasField("referencedBy"):
+            e = database.EncodeEntrySpec(self._entry.key, schema.KVMetadataFromProto(
+                self._entry.metadata), b'')
+            self._verifyInclusion(e, self._valueHash.digest())
+        self._done = True
+        self._rs.set(self._newstate)
@@ -0,0 +1,119 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Generator, List
+
+from immudb.embedded import store
+from immudb.grpc import schema_pb2
+from immudb.grpc import schema_pb2_grpc
+from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
+from immudb.exceptions import ErrCorruptedData
+import immudb.schema as schema
+
+
+def scanRequest(fromTx: int, batchSize: int) -> schema_pb2.TxScanRequest:
+    return schema_pb2.TxScanRequest(initialTx=fromTx, limit=batchSize)
+
+
+def proofRequest(txs, state) -> schema_pb2.VerifiableTxRequest:
+    return schema_pb2.VerifiableTxRequest(tx=txs[-1].header.id, proveSinceTx=state.txId)
+
+
+def verifyBatch(stxs, fromTx: int, vtx, state, verifying_key, rs: RootService, cache: VerifiedTxCache = None) -> List[store.Tx]:
+    """Verifies a range of consecutive transactions with a single proof.
+
+    Entries of every transaction are checked against its ``eh`` by
+    rebuilding the hash tree, and every transaction is chained to the
+    previous one through ``prevAlh``: the Alh of the last transaction
+    commits to the whole range, so only the last one is proven against
+    the trusted state.
+
+    Args:
+        stxs: transactions (schema_pb2.Tx) returned by TxScan
+        fromTx (int): id of the first requested transaction
+        vtx (schema_pb2.VerifiableTx): proof of the last transaction
+        state (State): trusted state the proof was requested from
+        verifying_key: key to verify the state signature, or None
+        rs (RootService): root service to store the new state into
+        cache (VerifiedTxCache, optional): cache of verified transactions
+
+    Returns:
+        List[store.Tx]: verified transactions
+    """
+    txs = []
+    for stx in stxs:
+        tx = schema.TxFromProto(stx)
+        # TxFromProto sets eh to the root of the hash tree of the entries
+        if tx.header.eh != schema.DigestFromProto(stx.header.eH):
+            raise ErrCorruptedData
+        if len(txs) == 0:
+            if tx.header.iD != fromTx:
+                raise ErrCorruptedData
+        elif tx.header.iD != txs[-1].header.iD + 1 or tx.header.prevAlh != txs[-1].header.Alh():
+            raise ErrCorruptedData
+        txs.append(tx)
+
+    last = txs[-1].header
+    lastAlh = last.Alh()
+    if state.txId <= last.iD:
+        sourceid = state.txId
+        sourcealh = schema.DigestFromProto(state.txHash)
+        targetid = last.iD
+        targetalh = lastAlh
+    else:
+        sourceid = last.iD
+        sourcealh = lastAlh
+        targetid = state.txId
+        targetalh = schema.DigestFromProto(state.txHash)
+    if state.txId > 0:
+        verifies = verifyDualProof(
+            cache, state,
+            schema.DualProofFromProto(vtx.dualProof),
+            sourceid,
+            targetid,
+            sourcealh,
+            targetalh)
+        if not verifies:
+            raise ErrCorruptedData
+
+    newstate = State(
+        db=state.db,
+        txId=targetid,
+        txHash=targetalh,
+        publicKey=vtx.signature.publicKey,
+        signature=vtx.signature.signature,
+    )
+    if verifying_key != None:
+        newstate.Verify(verifying_key)
+    rs.set(newstate)
+    if cache != None:
+        for tx in txs:
+            cache.add(state.db, tx.header.iD, tx.header.Alh(),
+                      tx.header.blTxID, tx.header.blRoot)
+    return txs
+
+
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, fromTx: int = 1, batchSize: int = 100, follow: bool = False, pollInterval: float = 1.0, verifying_key=None, cache: VerifiedTxCache = None) -> Generator[store.Tx, None, None]:
+    while True:
+        stxs = service.TxScan(scanRequest(fromTx, batchSize)).txs
+        if len(stxs) == 0:
+            if not follow:
+                return
+            time.sleep(pollInterval)
+            continue
+        state = rs.get()
+        vtx = service.VerifiableTxById(proofRequest(stxs, state))
+        txs = verifyBatch(stxs, fromTx, vtx, state, verifying_key, rs, cache)
+        yield from txs
+        fromTx = txs[-1].header.iD + 1
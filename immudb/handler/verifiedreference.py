@@ -12,6 +12,7 @@
 
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
 from immudb.embedded import store
 from immudb import datatypes
 from immudb.exceptions import ErrCorruptedData
@@ -20,7 +21,7 @@ import immudb.database as database
 import immudb.schema as schema
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, refkey: bytes, key:  bytes, atTx=0, verifying_key=None):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, refkey: bytes, key:  bytes, atTx=0, verifying_key=None, cache: VerifiedTxCache = None):
     state = rs.get()
     req = schema_pb2_grpc.schema__pb2.ReferenceRequest(
         referencedKey=refkey,
@@ -33,6 +34,10 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, refkey: byte
         proveSinceTx=state.txId
     )
     vtx = service.VerifiableSetReference(vreq)
+    return verify(vtx, state, refkey, key, atTx, verifying_key, rs, cache)
+
+
+def verify(vtx, state, refkey: bytes, key: bytes, atTx: int, verifying_key, rs: RootService, cache: VerifiedTxCache = None):
     if vtx.tx.header.nentries != 1:
         raise ErrCorruptedData
     tx = schema.TxFromProto(vtx.tx)
@@ -52,7 +57,8 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, refkey: byte
     targetAlh = tx.header.Alh()
 
     if state.txId > 0:
-        verifies = store.VerifyDualProof(
+        verifies = verifyDualProof(
+            cache, state,
             schema.DualProofFromProto(vtx.dualProof),
             sourceID,
             targetID,
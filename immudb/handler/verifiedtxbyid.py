@@ -15,12 +15,13 @@ from dataclasses import dataclass
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
 from immudb import exceptions
 from immudb.embedded import store
 import immudb.schema as schema
 
 
-def verify(vtx, state, verifying_key, rs):
+def verify(vtx, state, verifying_key, rs, cache: VerifiedTxCache = None):
     dualProof = schema.DualProofFromProto(vtx.dualProof)
     if state.txId <= vtx.tx.header.id:
         sourceid = state.txId
@@ -32,7 +33,8 @@ def verify(vtx, state, verifying_key, rs):
         sourcealh = dualProof.sourceTxHeader.Alh()
         targetid = state.txId
         targetalh = schema.DigestFromProto(state.txHash)
-    verifies = store.VerifyDualProof(
+    verifies = verifyDualProof(
+        cache, state,
         dualProof,
         sourceid,
         targetid,
@@ -57,7 +59,7 @@ def verify(vtx, state, verifying_key, rs):
     return ret
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, tx: int, verifying_key=None):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, tx: int, verifying_key=None, cache: VerifiedTxCache = None):
     state = rs.get()
     request = schema_pb2.VerifiableTxRequest(
         tx=tx,
@@ -69,4 +71,4 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, tx: int, ver
         if hasattr(e, 'details') and e.details() == 'tx not found':
             return None
         raise e
-    return verify(vtx, state, verifying_key, rs)
+    return verify(vtx, state, verifying_key, rs, cache)
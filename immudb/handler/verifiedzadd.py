@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from immudb.grpc import schema_pb2
 from immudb.grpc import schema_pb2_grpc
 from immudb.rootService import RootService, State
+from immudb.verifiedcache import VerifiedTxCache, verifyDualProof
 from immudb.exceptions import ErrCorruptedData
 from immudb import datatypes
 from immudb.embedded import store
@@ -22,7 +23,7 @@ import immudb.database as database
 import immudb.schema as schema
 
 
-def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, zset: bytes, score: float, key: bytes, atTx: int = 0, verifying_key=None):
+def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, zset: bytes, score: float, key: bytes, atTx: int = 0, verifying_key=None, cache: VerifiedTxCache = None):
     state = rs.get()
     request = schema_pb2.VerifiableZAddRequest(
         zAddRequest=schema_pb2.ZAddRequest(
@@ -34,6 +35,10 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, zset: bytes,
         proveSinceTx=state.txId
     )
     vtx = service.VerifiableZAdd(request)
+    return verify(vtx, state, zset, score, key, atTx, verifying_key, rs, cache)
+
+
+def verify(vtx, state, zset: bytes, score: float, key: bytes, atTx: int, verifying_key, rs: RootService, cache: VerifiedTxCache = None):
     if vtx.tx.header.nentries != 1:
         raise ErrCorruptedData
     tx = schema.TxFromProto(vtx.tx)
@@ -52,7 +57,8 @@ def call(service: schema_pb2_grpc.ImmuServiceStub, rs: RootService, zset: bytes,
     targetID = tx.header.iD
     targetAlh = tx.header.Alh()
     if state.txId > 0:
-        verifies = store.VerifyDualProof(
+        verifies = verifyDualProof(
+            cache, state,
             schema.DualProofFromProto(vtx.dualProof),
             sourceID,
             targetID,
@@ -0,0 +1,99 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from typing import Callable
+
+import grpc
+
+
+class WritePipeline:
+    """Bounded window of requests sent without waiting for the response.
+
+    Requests are started with the ``.future()`` variant of the GRPC calls:
+    submitting blocks only while ``maxInFlight`` requests are pending.
+    Responses needing a verification are verified, in order of arrival, on
+    a single background thread, so the caller can keep sending requests.
+    """
+
+    def __init__(self, maxInFlight: int = 64):
+        if maxInFlight < 1:
+            raise ValueError("maxInFlight must be at least 1")
+        self.maxInFlight = maxInFlight
+        self._window = threading.BoundedSemaphore(maxInFlight)
+        self._verifier = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="immudb-verifier")
+
+    def submit(self, send: Callable[[], grpc.Future], convert: Callable, verify: bool = False) -> Future:
+        """Sends a request, returning a future of its converted response
+
+        Args:
+            send (Callable): starts the request, returning a grpc.Future
+            convert (Callable): builds the result from the response; errors
+                raised by it are set on the returned future
+            verify (bool, optional): if `True`, convert runs on the
+                verification thread instead of the GRPC one
+
+        Returns:
+            Future: future of the result
+        """
+        self._window.acquire()
+        try:
+            call = send()
+        except BaseException:
+            self._window.release()
+            raise
+        result = Future()
+        result.set_running_or_notify_cancel()
+
+        def complete(response):
+            try:
+                result.set_result(convert(response))
+            except BaseException as e:
+                result.set_exception(e)
+            finally:
+                self._window.release()
+
+        def done(call):
+            try:
+                response = call.result()
+            except BaseException as e:
+                self._window.release()
+                result.set_exception(e)
+                return
+            if verify:
+                try:
+                    self._verifier.submit(complete, response)
+                except RuntimeError as e:
+                    # verifier already shut down
+                    self._window.release()
+                    result.set_exception(e)
+            else:
+                complete(response)
+
+        call.add_done_callback(done)
+        return result
+
+    def drain(self):
+        """Waits until all the submitted requests are completed
+        """
+        for i in range(self.maxInFlight):
+            self._window.acquire()
+        for i in range(self.maxInFlight):
+            self._window.release()
+
+    def shutdown(self):
+        """Waits for the pending requests and stops the verification thread
+        """
+        self.drain()
+        self._verifier.shutdown(wait=True)
@@ -0,0 +1,364 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import threading
+import types
+from typing import List, Union
+
+import grpc
+
+from immudb.client import ImmudbClient
+from immudb.rootService import RootService, ConcurrentRootService
+
+POLICY_ROUND_ROBIN = "round-robin"
+POLICY_LEAST_IN_FLIGHT = "least-in-flight"
+
+# Errors meaning that the endpoint (not the request) is failing
+_UNHEALTHY_CODES = (grpc.StatusCode.UNAVAILABLE,
+                    grpc.StatusCode.DEADLINE_EXCEEDED)
+
+
+class _Member:
+    def __init__(self, url: str, client: ImmudbClient):
+        self.url = url
+        self.client = client
+        self.inFlight = 0
+        self.healthy = True
+        # False until login succeeded on this member
+        self.ready = False
+
+
+class _MemberIterator:
+    """Iterates a generator returned by a member, keeping the call in
+    flight until the generator is exhausted, fails or is closed"""
+
+    def __init__(self, pool, member: _Member, generator):
+        self._pool = pool
+        self._member = member
+        self._generator = generator
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._member is None:
+            raise StopIteration
+        try:
+            return next(self._generator)
+        except grpc.RpcError as e:
+            self._pool._failed(self._member, e)
+            self.close()
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        if self._member is not None:
+            member = self._member
+            self._member = None
+            self._generator.close()
+            self._pool._release(member)
+
+    def __del__(self):
+        self.close()
+
+
+class ImmudbClientPool:
+
+    def __init__(self, immudUrls: Union[str, List[str]] = None, size: int = 4, rs: RootService = None, publicKeyFile: str = None, timeout=None, max_grpc_message_length=None, policy: str = POLICY_ROUND_ROBIN, healthCheckInterval: float = None):
+        """Pool of immudb clients, each one with its own channel.
+
+        The pool exposes the same methods as :class:`ImmudbClient`: every
+        call is sent to one healthy member, chosen in round robin or by the
+        lowest number of calls in flight. Methods changing the client state
+        (login, logout, useDatabase) are applied to all members, a session
+        is opened on a single one. The members connected to the same url
+        share one RootService, so verifications done on any of their
+        channels advance the same trusted state. Every url gets its own
+        RootService, as different servers have different histories.
+
+        Members failing with ``UNAVAILABLE`` or ``DEADLINE_EXCEEDED`` are
+        evicted from selection until :meth:`checkHealth` (periodically run
+        when ``healthCheckInterval`` is set) finds them healthy again.
+
+        Args:
+            immudUrls (str or list, optional): one or more urls in format
+                ``host:port``. Defaults to ``localhost:3322``.
+            size (int, optional): number of channels, spread over the urls.
+                Defaults to 4.
+            rs (RootService, optional): RootService shared by all channels,
+                only allowed with a single url. Defaults to a new
+                :class:`ConcurrentRootService` per url.
+            publicKeyFile (str, optional): path of the public key to use
+                for authenticating requests.
+            timeout (int, optional): global timeout for GRPC requests.
+            max_grpc_message_length (int, optional): maximum size of message
+                the server should send.
+            policy (str, optional): ``"round-robin"`` or ``"least-in-flight"``.
+            healthCheckInterval (float, optional): seconds between background
+                health checks. No background check is done if not set.
+        """
+        if immudUrls is None:
+            immudUrls = ["localhost:3322"]
+        elif isinstance(immudUrls, str):
+            immudUrls = [immudUrls]
+        if size < len(immudUrls):
+            size = len(immudUrls)
+        if policy not in (POLICY_ROUND_ROBIN, POLICY_LEAST_IN_FLIGHT):
+            raise ValueError("Unknown policy {}".format(policy))
+        # url -> RootService of its members
+        if rs is None:
+            self._rootServices = {url: ConcurrentRootService()
+                                  for url in immudUrls}
+        elif len(set(immudUrls)) > 1:
+            raise ValueError(
+                "A RootService can not be shared by different urls")
+        else:
+            self._rootServices = {immudUrls[0]: rs}
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._login = None
+        # member holding the session opened with openSession
+        self._session = None
+        self._members = []
+        for i in range(size):
+            url = immudUrls[i % len(immudUrls)]
+            # a local subchannel pool gives every channel its own connection
+            client = ImmudbClient(url, rs=self._rootServices[url], publicKeyFile=publicKeyFile, timeout=timeout,
+                                  max_grpc_message_length=max_grpc_message_length,
+                                  channelOptions=[('grpc.use_local_subchannel_pool', 1)])
+            self._members.append(_Member(url, client))
+        self._stopHealthCheck = threading.Event()
+        self._healthChecker = None
+        if healthCheckInterval:
+            self._healthChecker = threading.Thread(
+                target=self._healthCheckLoop, args=(healthCheckInterval,), daemon=True)
+            self._healthChecker.start()
+
+    @property
+    def members(self) -> List[ImmudbClient]:
+        return [m.client for m in self._members]
+
+    def healthyMembers(self) -> List[ImmudbClient]:
+        """Returns the clients currently used for requests
+
+        Returns:
+            List[ImmudbClient]: healthy clients
+        """
+        return [m.client for m in self._members if m.healthy and m.ready]
+
+    def _select(self) -> _Member:
+        candidates = [m for m in self._members if m.healthy and m.ready]
+        if not candidates:
+            # let the request fail (or succeed) on a member that is logged in
+            candidates = [m for m in self._members if m.ready] or self._members
+        with self._lock:
+            if self._policy == POLICY_LEAST_IN_FLIGHT:
+                member = min(candidates, key=lambda m: m.inFlight)
+            else:
+                member = candidates[next(self._counter) % len(candidates)]
+            member.inFlight += 1
+        return member
+
+    def _release(self, member: _Member):
+        with self._lock:
+            member.inFlight -= 1
+
+    def _failed(self, member: _Member, error: grpc.RpcError):
+        if isinstance(error, grpc.Call) and error.code() in _UNHEALTHY_CODES:
+            member.healthy = False
+
+    def _call(self, name, *args, **kwargs):
+        member = self._select()
+        try:
+            result = getattr(member.client, name)(*args, **kwargs)
+        except grpc.RpcError as e:
+            self._failed(member, e)
+            self._release(member)
+            raise
+        except BaseException:
+            self._release(member)
+            raise
+        if isinstance(result, types.GeneratorType):
+            # requests are sent while iterating
+            return _MemberIterator(self, member, result)
+        self._release(member)
+        return result
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name == "_members":
+            raise AttributeError(name)
+        attr = getattr(self._members[0].client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            return self._call(name, *args, **kwargs)
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+
+    def _broadcast(self, members: List[_Member], name, *args, **kwargs):
+        """Calls a method on members, returning the first result.
+
+        Members failing with a connection error are marked unhealthy and
+        skipped, other errors (or all members failing) are raised.
+        """
+        result = None
+        error = None
+        done = False
+        for member in members:
+            try:
+                ret = getattr(member.client, name)(*args, **kwargs)
+            except grpc.RpcError as e:
+                if not (isinstance(e, grpc.Call) and e.code() in _UNHEALTHY_CODES):
+                    raise
+                member.healthy = False
+                error = e
+                continue
+            if not done:
+                result = ret
+                done = True
+        if not done and error is not None:
+            raise error
+        return result
+
+    def loadKey(self, kfile: str):
+        """Loads public key from path
+
+        Args:
+            kfile (str): key file path
+        """
+        for member in self._members:
+            member.client.loadKey(kfile)
+
+    def loadKeyFromString(self, key: str):
+        """Loads public key from parameter
+
+        Args:
+            key (str): key
+        """
+        for member in self._members:
+            member.client.loadKeyFromString(key)
+
+    def login(self, username, password, database=b"defaultdb"):
+        """Logins all the channels into immudb
+
+        Args:
+            username (str): username
+            password (str): password for user
+            database (bytes, optional): database to switch to. Defaults to b"defaultdb".
+
+        Returns:
+            LoginResponse: login response of the first channel
+        """
+        self._login = (username, password, database)
+        resp = self._broadcast(self._members, "login",
+                               username, password, database)
+        for member in self._members:
+            member.ready = member.healthy
+        return resp
+
+    def logout(self):
+        """Logouts all channels
+        """
+        self._login = None
+        members = [m for m in self._members if m.ready]
+        for member in self._members:
+            member.ready = False
+        self._broadcast(members, "logout")
+
+    def useDatabase(self, dbName: bytes):
+        """Switches database on all channels
+
+        Args:
+            dbName (bytes): database name
+        """
+        if self._login is not None:
+            username, password, database = self._login
+            self._login = (username, password, dbName)
+        return self._broadcast([m for m in self._members if m.ready], "useDatabase", dbName)
+
+    def openSession(self, username, password, database=b"defaultdb"):
+        """Opens a session on one channel, chosen like for any other call.
+
+        Until the session is closed, keepAlive and closeSession are sent to
+        that channel.
+
+        Returns:
+            Tx: Tx object bound to the session (handlers/transaction.py)
+        """
+        member = self._select()
+        try:
+            resp = member.client.openSession(username, password, database)
+        except grpc.RpcError as e:
+            self._failed(member, e)
+            raise
+        finally:
+            self._release(member)
+        member.ready = True
+        self._session = member
+        return resp
+
+    def closeSession(self):
+        """Closes the session opened with openSession
+        """
+        member = self._session
+        if member is None:
+            return
+        self._session = None
+        member.ready = False
+        member.client.closeSession()
+
+    def keepAlive(self):
+        """Sends keep alive packet on the channel of the session
+        """
+        if self._session is not None:
+            self._session.client.keepAlive()
+
+    openManagedSession = ImmudbClient.openManagedSession
+
+    def checkHealth(self) -> int:
+        """Checks every channel with healthCheck, evicting failing ones.
+
+        Channels coming back are logged in again if the pool is logged in.
+
+        Returns:
+            int: number of healthy channels
+        """
+        for member in self._members:
+            try:
+                healthy = bool(member.client.healthCheck())
+                if healthy and not member.ready and self._login is not None:
+                    member.client.login(*self._login)
+                    member.ready = True
+            except grpc.RpcError:
+                healthy = False
+            member.healthy = healthy
+        return len([m for m in self._members if m.healthy])
+
+    def _healthCheckLoop(self, interval: float):
+        while not self._stopHealthCheck.wait(interval):
+            self.checkHealth()
+
+    def shutdown(self):
+        """Shutdowns all channels
+        """
+        self._stopHealthCheck.set()
+        if self._healthChecker is not None:
+            self._healthChecker.join()
+        for member in self._members:
+            member.client.shutdown()
+        self._rootServices = None
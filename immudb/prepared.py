@@ -0,0 +1,167 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from typing import List
+
+from immudb import constants
+from immudb.grpc import schema_pb2
+from immudb.handler.sqlquery import RowIterator
+from immudb.typeconv import set_sqlvalue
+
+# string literals are skipped, group 1 is the name of a parameter
+_TOKENS = re.compile(r"'(?:[^']|'')*'|@([A-Za-z_][A-Za-z0-9_]*)")
+
+
+class PreparedStatement:
+    """SQL statement parsed once and executed many times.
+
+    The parameters of the statement are found when it is prepared, and the
+    SQL text of a batch of ``n`` executions (the statement repeated with
+    parameters renamed ``@p<i>_<name>``) is built once per ``n``, so that
+    :meth:`executemany` only converts the parameter values.
+
+    Parameters are given as a dict keyed by parameter name, or as a
+    sequence in the order the parameters first appear in the statement
+    (see :attr:`params`).
+    """
+
+    def __init__(self, sql: str, execute, query, dbname: bytes, inTransaction: bool = False, batchSize: int = 100):
+        """
+        Args:
+            sql (str): statement in immudb SQL dialect
+            execute (Callable): sends a SQLExecRequest
+            query (Callable): sends a SQLQueryRequest, returning a stream
+            dbname (bytes): database name, for column names
+            inTransaction (bool, optional): True if executed inside an
+                interactive transaction, else every batch is wrapped in
+                ``BEGIN TRANSACTION; ... COMMIT;``
+            batchSize (int, optional): executions sent in one request by
+                executemany. Defaults to 100.
+        """
+        if batchSize < 1:
+            raise ValueError("batchSize must be positive")
+        self.sql = sql.strip().rstrip(";").rstrip()
+        self.batchSize = batchSize
+        self._execute = execute
+        self._query = query
+        self._dbname = dbname
+        self._inTransaction = inTransaction
+        self._pieces = []
+        self._slots = []
+        pos = 0
+        for match in _TOKENS.finditer(self.sql):
+            if match.group(1) is None:
+                continue
+            self._pieces.append(self.sql[pos:match.start()])
+            self._slots.append(match.group(1))
+            pos = match.end()
+        self._pieces.append(self.sql[pos:])
+        self.params = list(dict.fromkeys(self._slots))
+        self._batches = dict()
+
+    def _batch(self, count: int):
+        batch = self._batches.get(count)
+        if batch != None:
+            return batch
+        statements = []
+        names = []
+        for i in range(count):
+            rename = {name: "p{}_{}".format(i, name) for name in self.params}
+            parts = [self._pieces[0]]
+            for slot, piece in zip(self._slots, self._pieces[1:]):
+                parts.append("@" + rename[slot])
+                parts.append(piece)
+            statements.append("".join(parts))
+            names.append([rename[name] for name in self.params])
+        sql = ";\n".join(statements)
+        if not self._inTransaction:
+            sql = "BEGIN TRANSACTION;\n" + sql + ";\nCOMMIT;"
+        batch = (sql, names)
+        self._batches[count] = batch
+        return batch
+
+    def _bind(self, requestParams, names: List[str], values):
+        if isinstance(values, dict):
+            try:
+                values = [values[name] for name in self.params]
+            except KeyError as e:
+                raise ValueError("Missing parameter {}".format(e)) from None
+        elif len(values) != len(self.params):
+            raise ValueError("Expected {} parameters, got {}".format(
+                len(self.params), len(values)))
+        for name, value in zip(names, values):
+            param = requestParams.add()
+            param.name = name
+            set_sqlvalue(param.value, value)
+
+    def execute(self, params=(), noWait=False) -> schema_pb2.SQLExecResult:
+        """Executes the statement once
+
+        Args:
+            params (dict or sequence, optional): parameter values
+            noWait (bool, optional): whether to wait for indexing
+
+        Returns:
+            SQLExecResult: result, as sqlExec
+        """
+        request = schema_pb2.SQLExecRequest(sql=self.sql, noWait=noWait)
+        self._bind(request.params, self.params, params)
+        return self._execute(request)
+
+    def executemany(self, rows, noWait=False) -> List[schema_pb2.SQLExecResult]:
+        """Executes the statement once for every set of parameters, sending
+        up to batchSize executions per request. Outside an interactive
+        transaction every request is committed as one transaction.
+
+        Args:
+            rows (iterable): parameter values of every execution
+            noWait (bool, optional): whether to wait for indexing
+
+        Returns:
+            List[SQLExecResult]: result of every request
+        """
+        results = []
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batchSize:
+                results.append(self._executeBatch(batch, noWait))
+                batch = []
+        if len(batch) > 0:
+            results.append(self._executeBatch(batch, noWait))
+        return results
+
+    def _executeBatch(self, batch, noWait):
+        sql, names = self._batch(len(batch))
+        request = schema_pb2.SQLExecRequest(sql=sql, noWait=noWait)
+        for rowNames, values in zip(names, batch):
+            self._bind(request.params, rowNames, values)
+        return self._execute(request)
+
+    def query(self, params=(), columnNameMode=constants.COLUMN_NAME_MODE_NONE, acceptStream=False):
+        """Runs the statement as a query
+
+        Args:
+            params (dict or sequence, optional): parameter values
+            columnNameMode: mode of the column names
+            acceptStream (bool, optional): if True a RowIterator is returned
+
+        Returns:
+            list or RowIterator: rows, as sqlQuery
+        """
+        request = schema_pb2.SQLQueryRequest(sql=self.sql, acceptStream=True)
+        self._bind(request.params, self.params, params)
+        it = RowIterator(self._query(request), columnNameMode, self._dbname)
+        if acceptStream:
+            return it
+        return list(it)
@@ -19,9 +19,16 @@ import hashlib
 import ecdsa
 import ecdsa.util
 import struct
+import threading
+import zlib
 from dataclasses import dataclass
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 _statefile = constants.ROOT_CACHE_PATH
+_statelog = constants.ROOT_LOG_PATH
 
 
 @dataclass
@@ -76,6 +83,81 @@ class RootService:
     def set(self, root: State):
         self.__cache = root
 
+
+class _AdvanceOnlyRootService:
+    """Wraps the RootService of a client whose verifications can complete
+    out of order (coroutines, pipelined writes).
+
+    A verification that started from an older state can finish after one
+    that already advanced it. Only newer states are committed, so the state
+    can not move backwards.
+    """
+
+    def __init__(self, rs: RootService):
+        self.rs = rs
+
+    def init(self, dbname: str, service):
+        self.rs.init(dbname, service)
+
+    def get(self) -> State:
+        return self.rs.get()
+
+    def set(self, root: State):
+        current = self.rs.get()
+        if current == None or root.txId >= current.txId:
+            self.rs.set(root)
+
+
+# Thread safe in-memory state, meant to be shared by verified calls running
+# on different threads. Readers never take a lock: the trusted state is a
+# single reference, swapped atomically. Writers only advance the state, so a
+# verification that started from an older state and finishes late can not
+# roll back a newer one committed in the meantime.
+class ConcurrentRootService(RootService):
+    def __init__(self):
+        self.__dbname = None
+        self.__cache = None
+        self.__service = None
+        self.__lock = threading.Lock()
+
+    def init(self, dbname: str, service: schema_pb2_grpc.ImmuServiceStub):
+        state = service.CurrentState(g_empty.Empty())
+        with self.__lock:
+            self.__dbname = dbname
+            self.__service = service
+            self.__cache = state
+
+    def get(self) -> State:
+        state = self.__cache
+        if state == None:
+            self.advance(self.__service.CurrentState(g_empty.Empty()))
+            state = self.__cache
+        return state
+
+    def set(self, root: State):
+        self.advance(root)
+
+    def advance(self, root: State) -> bool:
+        """Commits root if it is not older than the trusted state.
+
+        States of another database (left over from before a database
+        switch) are ignored.
+
+        Args:
+            root (State): newly verified state
+
+        Returns:
+            bool: True if root is now the trusted state
+        """
+        with self.__lock:
+            current = self.__cache
+            if current != None:
+                if root.db != current.db or root.txId < current.txId:
+                    return False
+            self.__cache = root
+            return True
+
+
 # Sample implementation of persistent state. A state file is created, with
 # a dictionary of immudb states, one per database. State file name can be
 # set at object creation, will use a default one if name is not set.
@@ -126,3 +208,210 @@ class PersistentRootService(RootService):
         states[self.__dbname] = self.__cache
         with open(self.__filename, "wb") as f:
             pickle.dump(states, f)
+
+
+# Records of the append-only state log: payload length and crc32, followed by
+# txId and the length prefixed dbname, db, txHash, publicKey and signature.
+_recordHeader = struct.Struct(">II")
+_fieldLength = struct.Struct(">I")
+_txId = struct.Struct(">Q")
+
+
+def _encodeState(dbname: str, state: State) -> bytes:
+    fields = [dbname.encode('utf8'), state.db.encode('utf8'), state.txHash,
+              state.publicKey or b'', state.signature or b'']
+    payload = _txId.pack(state.txId) + b''.join(
+        _fieldLength.pack(len(f)) + f for f in fields)
+    return _recordHeader.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _decodeState(payload: bytes):
+    txId, = _txId.unpack_from(payload)
+    offset = _txId.size
+    fields = []
+    for i in range(5):
+        l, = _fieldLength.unpack_from(payload, offset)
+        offset += _fieldLength.size
+        fields.append(payload[offset:offset+l])
+        offset += l
+    dbname, db, txHash, publicKey, signature = fields
+    return dbname.decode('utf8'), State(db=db.decode('utf8'), txId=txId, txHash=txHash,
+                                        publicKey=publicKey, signature=signature)
+
+
+def _readStates(data: bytes):
+    """Decodes a state log, keeping the newest state of every database.
+
+    Returns:
+        (dict, int, int): states by dbname, number of records and length of
+        the valid prefix (a torn or corrupted tail is left out)
+    """
+    states = {}
+    offset = 0
+    count = 0
+    while offset + _recordHeader.size <= len(data):
+        l, crc = _recordHeader.unpack_from(data, offset)
+        payload = data[offset+_recordHeader.size:offset+_recordHeader.size+l]
+        if len(payload) < l or zlib.crc32(payload) != crc:
+            break
+        try:
+            dbname, state = _decodeState(payload)
+        except struct.error:
+            break
+        if dbname not in states or state.txId >= states[dbname].txId:
+            states[dbname] = state
+        offset += _recordHeader.size+l
+        count += 1
+    return states, count, offset
+
+
+# Persistent state stored in an append-only log. Every set appends a small
+# checksummed record instead of rewriting the whole file, and the log is
+# compacted to one record per database once it grows past compactAfter
+# records. Records are fsync'ed every syncEvery sets (0 leaves flushing to the
+# OS, flush() forces it). On platforms with fcntl the log is locked during
+# appends and compaction, so several processes can share the same file; when
+# loading, the newest state of each database wins, whichever process wrote it.
+class AppendOnlyRootService(RootService):
+    def __init__(self, filename: str = None, syncEvery: int = 1, compactAfter: int = 1024):
+        self.__dbname = None
+        self.__cache = None
+        self.__service = None
+        self.__fd = None
+        self.__lock = threading.Lock()
+        self.__syncEvery = syncEvery
+        self.__compactAfter = compactAfter
+        self.__unsynced = 0
+        self.__records = 0
+        if filename != None:
+            self.__filename = filename
+        else:
+            self.__filename = os.path.join(os.path.expanduser("~"), _statelog)
+
+    def init(self, dbname: str, service: schema_pb2_grpc.ImmuServiceStub):
+        with self.__lock:
+            self.__dbname = dbname
+            self.__service = service
+            self.__cache = None
+            self._open()
+            self._flock()
+            try:
+                states = self._load()
+            finally:
+                self._funlock()
+            self.__cache = states.get(dbname)
+        if self.__cache == None:
+            self.__cache = self.__service.CurrentState(g_empty.Empty())
+
+    def get(self) -> State:
+        if self.__cache == None:
+            self.__cache = self.__service.CurrentState(g_empty.Empty())
+        return self.__cache
+
+    def set(self, root: State):
+        if not isinstance(root, State):
+            root = State.FromGrpc(root)
+        record = _encodeState(self.__dbname, root)
+        with self.__lock:
+            self.__cache = root
+            self._flock()
+            try:
+                os.write(self.__fd, record)
+                self.__records += 1
+                self.__unsynced += 1
+                if self.__syncEvery > 0 and self.__unsynced >= self.__syncEvery:
+                    self._sync()
+                if self.__compactAfter > 0 and self.__records >= self.__compactAfter:
+                    self._compact()
+            finally:
+                self._funlock()
+
+    def flush(self):
+        """Forces pending records to disk"""
+        with self.__lock:
+            if self.__fd != None and self.__unsynced > 0:
+                self._sync()
+
+    def compact(self):
+        """Rewrites the log keeping only the newest state of every database"""
+        with self.__lock:
+            self._open()
+            self._flock()
+            try:
+                self._compact()
+            finally:
+                self._funlock()
+
+    def close(self):
+        """Flushes and closes the log"""
+        self.flush()
+        with self.__lock:
+            if self.__fd != None:
+                os.close(self.__fd)
+                self.__fd = None
+
+    def _open(self):
+        if self.__fd == None:
+            self.__fd = os.open(self.__filename,
+                                os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o600)
+
+    def _flock(self):
+        # The log may have been compacted (and replaced) by another process
+        # since it was opened: reopen it until the locked file is the current one.
+        self._open()
+        while fcntl != None:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+            try:
+                if os.stat(self.__filename).st_ino == os.fstat(self.__fd).st_ino:
+                    return
+            except FileNotFoundError:
+                pass
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+            os.close(self.__fd)
+            self.__fd = None
+            self._open()
+
+    def _funlock(self):
+        if fcntl != None:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+
+    def _load(self):
+        os.lseek(self.__fd, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            chunk = os.read(self.__fd, 1 << 20)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        data = b''.join(chunks)
+        states, self.__records, valid = _readStates(data)
+        if valid < len(data):
+            # drop a record torn by a crash, so that appends stay readable
+            os.ftruncate(self.__fd, valid)
+        return states
+
+    def _sync(self):
+        os.fsync(self.__fd)
+        self.__unsynced = 0
+
+    def _compact(self):
+        states = self._load()
+        tmpname = self.__filename + ".tmp"
+        with open(tmpname, "wb") as f:
+            for dbname, state in states.items():
+                f.write(_encodeState(dbname, state))
+            f.flush()
+            os.fsync(f.fileno())
+        fd = self.__fd
+        self.__fd = None
+        if fcntl == None:
+            # open files can not be replaced everywhere
+            os.close(fd)
+        os.replace(tmpname, self.__filename)
+        # keep holding the lock on the old file until the new one is opened,
+        # other processes will notice the replacement in _flock
+        self._open()
+        if fcntl != None:
+            os.close(fd)
+        self.__records = len(states)
+        self.__unsynced = 0
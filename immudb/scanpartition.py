@@ -0,0 +1,122 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import queue
+import threading
+from typing import Callable, Generator, Iterable, List, Tuple
+
+# bytes after the common prefix used to interpolate boundaries
+_WIDTH = 8
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def splitKeyRange(low: bytes, high: bytes, partitions: int) -> List[bytes]:
+    """Returns up to partitions - 1 increasing keys splitting [low, high]
+    in ranges of about the same width, interpolating the bytes following
+    the common prefix of low and high.
+
+    Args:
+        low (bytes): first key of the range
+        high (bytes): last key of the range
+        partitions (int): number of ranges
+
+    Returns:
+        List[bytes]: boundaries, all greater than low and not greater than high
+    """
+    common = os.path.commonprefix([low, high])
+
+    def num(key: bytes) -> int:
+        return int.from_bytes(key[len(common):len(common) + _WIDTH].ljust(_WIDTH, b'\x00'), 'big')
+
+    lo = num(low)
+    hi = num(high)
+    boundaries = []
+    for i in range(1, partitions):
+        offset = lo + (hi - lo) * i // partitions
+        key = common + offset.to_bytes(_WIDTH, 'big')
+        if low < key <= high and (len(boundaries) == 0 or key > boundaries[-1]):
+            boundaries.append(key)
+    return boundaries
+
+
+def keyRanges(boundaries: List[bytes]) -> List[Tuple[bytes, bytes]]:
+    """Returns the (seekKey, endKey) ranges delimited by boundaries, the
+    first one without seekKey and the last one without endKey. seekKey is
+    inclusive, endKey exclusive.
+    """
+    return list(zip([None] + boundaries, boundaries + [None]))
+
+
+def runPartitions(scans: List[Callable[[], Iterable]], ordered: bool = True, bufferSize: int = 1024) -> Generator:
+    """Runs every scan on its own thread, yielding their items.
+
+    Args:
+        scans (List[Callable]): functions returning the items of a partition
+        ordered (bool, optional): if `True`, yields all the items of a
+            partition before the ones of the next one; otherwise items are
+            yielded as soon as any partition produces them.
+        bufferSize (int, optional): items buffered for each partition
+            (for all of them if not ordered). Defaults to 1024.
+
+    Yields:
+        Generator: items of the partitions
+    """
+    stop = threading.Event()
+    if ordered:
+        queues = [queue.Queue(bufferSize) for scan in scans]
+    else:
+        queues = [queue.Queue(bufferSize)] * len(scans)
+
+    def put(q: queue.Queue, item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker(scan, q: queue.Queue):
+        try:
+            for item in scan():
+                if not put(q, item):
+                    return
+        except BaseException as e:
+            put(q, _Failure(e))
+            return
+        put(q, _DONE)
+
+    for scan, q in zip(scans, queues):
+        threading.Thread(target=worker, args=(scan, q), daemon=True).start()
+    try:
+        remaining = len(scans)
+        index = 0
+        while remaining > 0:
+            item = queues[index].get()
+            if item is _DONE:
+                remaining -= 1
+                if ordered:
+                    index += 1
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        # workers still running stop at their next item
+        stop.set()
@@ -3,6 +3,14 @@ from dataclasses import dataclass
 import struct
 from .grpc.schema_pb2 import VerifiableTx, Entry
 from .grpc.schema_pb2 import InclusionProof
+from .grpc.schema_pb2 import Chunk, ZAddRequest
+from . import datatypes
+from .exceptions import ErrCorruptedData
+import io
+import mmap
+import os
+from io import BytesIO
+from typing import List, Union
 
 
 @dataclass
@@ -12,6 +20,7 @@ class KeyHeader:
     refKey: bytes = None
     refKeyTx: int = None
     tx: int = None
+    entry: Entry = None
 
     def getInBytes(self):
         return self.length.to_bytes(8, 'big') + self.key
@@ -91,7 +100,7 @@ class VerifiedGetStreamReader:
         refkey = en.referencedBy.key
         if refkey == b'':
             refkey = None
-        return KeyHeader(length=length, key=en.key, refKey=refkey, refKeyTx=en.referencedBy.tx, tx=en.tx)
+        return KeyHeader(length=length, key=en.key, refKey=refkey, refKeyTx=en.referencedBy.tx, tx=en.tx, entry=en)
 
     def parseValueHeader(self, header: bytes):
         length = int.from_bytes(header[0:8], byteorder='big')
@@ -103,6 +112,10 @@ class VerifiedGetStreamReader:
         for chunk in self.streamToRead:
             yield self.reader(chunk)
 
+    async def asyncChunks(self):
+        async for chunk in self.streamToRead:
+            yield self.reader(chunk)
+
     def headerReader(self, chunk):
         self.reader = self.verifiableTxReader
         return self.parseHeader(chunk.content)
@@ -151,6 +164,10 @@ class StreamReader:
         for chunk in self.streamToRead:
             yield self.reader(chunk)
 
+    async def asyncChunks(self):
+        async for chunk in self.streamToRead:
+            yield self.reader(chunk)
+
     def headerReader(self, chunk):
         self.reader = self.valueHeaderReader
         return self.parseHeader(chunk.content)
@@ -205,6 +222,10 @@ class ZScanStreamReader:
         for chunk in self.streamToRead:
             yield self.reader(chunk)
 
+    async def asyncChunks(self):
+        async for chunk in self.streamToRead:
+            yield self.reader(chunk)
+
     def headerReader(self, chunk):
         self.reader = self.scoreValueHeaderReader
         return self.parseHeader(chunk.content)
@@ -238,19 +259,37 @@ class ZScanStreamReader:
         return readed
 
 
-class BufferedStreamReader:
+class BufferedStreamReader(io.RawIOBase):
+    """Raw binary stream over the chunks of a streamed value.
+
+    Chunks are consumed through memoryviews: readinto() copies them straight
+    into the caller's buffer, and read() makes at most one copy (none when a
+    whole chunk is requested), so large values are read in linear time and
+    can be passed to anything expecting a file, like shutil.copyfileobj.
+    """
+
     def __init__(self, chunksGenerator, valueHeader: ValueChunk, stream):
+        super().__init__()
         self.chunksGenerator = chunksGenerator
         self.size = valueHeader.left + len(valueHeader.chunk)
         self.currentChunk = valueHeader.chunk
         self.readed = 0
         self.currentChunkOffset = 0
         self.currentChunkLength = len(self.currentChunk)
+        self._view = memoryview(self.currentChunk)
         self.stream = stream
 
     def __len__(self):
         return self.size
 
+    def __del__(self):
+        # readers of a scan share the same stream, which must not be
+        # cancelled when one of them is garbage collected
+        pass
+
+    def readable(self) -> bool:
+        return True
+
     def _read_new_chunk(self):
         nextChunk = next(self.chunksGenerator, None)
         if (not nextChunk):
@@ -259,27 +298,315 @@ class BufferedStreamReader:
         self.currentChunk = nextChunk.chunk
         self.currentChunkOffset = 0
         self.currentChunkLength = len(self.currentChunk)
+        self._view = memoryview(self.currentChunk)
 
-    def read(self, length: int = None) -> bytes:
-        if length == None:
-            length = self.size
-        if (self.readed >= self.size):
-            return None
-        if (self.readed + length >= self.size):
-            length = self.size - self.readed
-        bytesToReturn = self.currentChunk[self.currentChunkOffset: self.currentChunkOffset + length]
-        self.currentChunkOffset = self.currentChunkOffset + length
-        while (len(bytesToReturn) < length):
+    def _next_piece(self, length: int) -> memoryview:
+        """Returns a view of at most length bytes of the value, or None at
+        the end of the stream. Never reads past the end of the value"""
+        while self.currentChunkOffset >= self.currentChunkLength:
             self._read_new_chunk()
             if self.currentChunk == None:
-                self.readed = self.readed + len(bytesToReturn)
-                return bytesToReturn
-            self.currentChunkOffset = length - len(bytesToReturn)
-            bytesToReturn = bytesToReturn + \
-                self.currentChunk[0:self.currentChunkOffset]
+                return None
+        end = min(self.currentChunkOffset + length, self.currentChunkLength)
+        piece = self._view[self.currentChunkOffset:end]
+        self.currentChunkOffset = end
+        self.readed = self.readed + len(piece)
+        return piece
+
+    def readinto(self, buffer) -> int:
+        """Reads bytes into a pre-allocated, writable bytes-like object
+
+        Args:
+            buffer: bytearray, memoryview or any writable buffer
+
+        Returns:
+            int: number of bytes read, 0 at the end of the value
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed stream")
+        with memoryview(buffer) as view, view.cast('B') as out:
+            length = min(len(out), self.size - self.readed)
+            filled = 0
+            while filled < length:
+                piece = self._next_piece(length - filled)
+                if piece == None:
+                    break
+                out[filled:filled + len(piece)] = piece
+                filled = filled + len(piece)
+            return filled
+
+    def read(self, length: int = -1) -> bytes:
+        """Reads up to length bytes, the whole remaining value if length is
+        None or negative
+
+        Args:
+            length (int, optional): number of bytes to read
+
+        Returns:
+            bytes: bytes read, empty at the end of the value
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed stream")
+        left = self.size - self.readed
+        if length == None or length < 0 or length > left:
+            length = left
+        pieces = []
+        readed = 0
+        while readed < length:
+            piece = self._next_piece(length - readed)
+            if piece == None:
+                break
+            pieces.append(piece)
+            readed = readed + len(piece)
+        if len(pieces) == 1 and len(pieces[0]) == len(pieces[0].obj):
+            return pieces[0].obj
+        return b''.join(pieces)
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def close(self):
+        if not self.closed:
+            self.stream.cancel()
+        super().close()
+
+
+class VerifiedBufferedStreamReader(BufferedStreamReader):
+    """BufferedStreamReader passing every chunk of the value to a verifier,
+    with update(chunk) and finish() methods. finish() is called as soon as
+    the whole value has been read, so the read returning the last bytes
+    raises if the value does not verify. A stream ending before the value
+    is complete raises ErrCorruptedData.
+    """
+
+    def __init__(self, chunksGenerator, valueHeader: ValueChunk, stream, verifier):
+        self.verifier = verifier
+        super().__init__(chunksGenerator, valueHeader, stream)
+
+    def _next_piece(self, length: int) -> memoryview:
+        piece = super()._next_piece(length)
+        if piece != None:
+            self.verifier.update(piece)
+        return piece
+
+    def _check_end(self):
+        if self.readed >= self.size:
+            self.verifier.finish()
+        elif self.currentChunk == None:
+            raise ErrCorruptedData
+
+    def readinto(self, buffer) -> int:
+        readed = super().readinto(buffer)
+        self._check_end()
+        return readed
+
+    def read(self, length: int = -1) -> bytes:
+        readed = super().read(length)
+        self._check_end()
+        return readed
+
+
+class AsyncBufferedStreamReader:
+    def __init__(self, chunksGenerator, valueHeader: ValueChunk, stream):
+        self.chunksGenerator = chunksGenerator
+        self.size = valueHeader.left + len(valueHeader.chunk)
+        self.currentChunk = valueHeader.chunk
+        self.readed = 0
+        self.currentChunkOffset = 0
+        self.stream = stream
 
-        self.readed = self.readed + length
-        return bytesToReturn
+    def __len__(self):
+        return self.size
+
+    async def _read_new_chunk(self):
+        nextChunk = await self.chunksGenerator.__anext__()
+        self.currentChunk = nextChunk.chunk
+        self.currentChunkOffset = 0
+
+    async def read(self, length: int = None) -> bytes:
+        if length == None or length < 0 or self.readed + length >= self.size:
+            length = self.size - self.readed
+        pieces = []
+        readed = 0
+        while readed < length:
+            if self.currentChunkOffset >= len(self.currentChunk):
+                try:
+                    await self._read_new_chunk()
+                except StopAsyncIteration:
+                    break
+                continue
+            end = min(self.currentChunkOffset + length - readed,
+                      len(self.currentChunk))
+            pieces.append(memoryview(self.currentChunk)[
+                          self.currentChunkOffset:end])
+            readed = readed + end - self.currentChunkOffset
+            self.currentChunkOffset = end
+        self.readed = self.readed + readed
+        return b''.join(pieces)
 
     def close(self):
         self.stream.cancel()
+
+
+def makeSetStream(buffer, key: bytes, length: int, chunkSize: int = 65536):
+    """Creates generator of chunks that sets key into value read from buffer
+
+    Args:
+        buffer (io.BytesIO): Any buffer that implements read(length: int) method
+        key (bytes): Key to set
+        length (int): Length of buffer
+        chunkSize (int, optional): Chunk size to set while streaming. Defaults to 65536.
+
+    Yields:
+        Generator[Chunk, None, None]: Chunk that is compatible with proto
+    """
+    yield Chunk(content=KeyHeader(key=key, length=len(key)).getInBytes())
+    firstChunk = buffer.read(chunkSize)
+    firstChunk = ValueChunkHeader(
+        chunk=firstChunk, length=length).getInBytes()
+    yield Chunk(content=firstChunk)
+    chunk = buffer.read(chunkSize)
+    while chunk:
+        # buffers like MappedFile return memoryviews, copied once here
+        yield Chunk(content=bytes(chunk))
+        chunk = buffer.read(chunkSize)
+
+
+class MappedFile:
+    """Read only memory map of a file, whose read() returns slices of the
+    mapping instead of copies. A slice is valid until the next read() or
+    close().
+    """
+
+    def __init__(self, f):
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._slice = None
+        self._pos = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def read(self, length: int = -1) -> memoryview:
+        if self._slice is not None:
+            self._slice.release()
+        end = len(self._view)
+        if length >= 0:
+            end = min(end, self._pos + length)
+        self._slice = self._view[self._pos:end]
+        self._pos = end
+        return self._slice
+
+    def close(self):
+        if self._view is None:
+            return
+        # the map can not be closed while views of it are alive
+        if self._slice is not None:
+            self._slice.release()
+            self._slice = None
+        self._view.release()
+        self._view = None
+        self._map.close()
+
+
+def mapFile(f):
+    """Maps a file opened for reading into memory.
+
+    The returned object supports read(length: int) and len(), so it can be
+    used as buffer for the set streams: every read() returns a memoryview
+    of the next chunk of the mapping, without going through an
+    intermediate file buffer.
+
+    Args:
+        f: file object opened in binary mode
+
+    Returns:
+        MappedFile: read only map of the file (BytesIO for an empty file,
+        which can not be mapped). Usable as context manager
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return BytesIO(b'')
+    return MappedFile(f)
+
+
+def makeVerifiableSetStream(buffer, key: bytes, length: int, provenSinceTx: int = None, chunkSize: int = 65536):
+    """Creates generator of chunks that sets key into value read from buffer,
+    asking the server to prove the transaction since provenSinceTx
+
+    Args:
+        buffer (io.BytesIO): Any buffer that implements read(length: int) method
+        key (bytes): Key to set
+        length (int): Length of buffer
+        provenSinceTx (int): Prove since this transaction id
+        chunkSize (int, optional): Chunk size. Defaults to 65536.
+
+    Yields:
+        Generator[Chunk, None, None]: Chunk that is compatible with proto
+    """
+    header = ProvenSinceHeader(provenSinceTx)
+    yield Chunk(content=header.getInBytes())
+    for chunk in makeSetStream(buffer, key, length, chunkSize):
+        yield chunk
+
+
+def makeExecAllStream(ops: List[Union[datatypes.KeyValue, datatypes.StreamingKeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]], noWait=False, chunkSize=65536):
+    """Creates generator of chunks that executes all provided operations
+
+    Args:
+        ops (List[Union[datatypes.KeyValue, datatypes.StreamingKeyValue, datatypes.ZAddRequest, datatypes.ReferenceRequest]]): List of actions to execute
+        noWait (bool, optional): When true - scan doesn't wait for the index to be fully generated. Defaults to False.
+        chunkSize (int, optional): Chunk size to set while streaming. Defaults to 65536.
+
+    Yields:
+        Generator[Chunk, None, None]: Generator of chunks
+    """
+    kv = 1
+    zadd = 2
+    for op in ops:
+        if type(op) == datatypes.KeyValue:
+            concated = int.to_bytes(1, 8, 'big')
+            concated += int.to_bytes(kv, 1, 'big')
+            yield Chunk(content=concated + KeyHeader(key=op.key, length=len(op.key)).getInBytes())
+            buffer = BytesIO(op.value)
+            firstChunk = buffer.read(chunkSize)
+            firstChunk = ValueChunkHeader(
+                chunk=firstChunk, length=len(op.value)).getInBytes()
+            yield Chunk(content=firstChunk)
+            chunk = buffer.read(chunkSize)
+            while chunk:
+                yield Chunk(content=chunk)
+                chunk = buffer.read(chunkSize)
+        elif type(op) == datatypes.StreamingKeyValue:
+            concated = int.to_bytes(1, 8, 'big')
+            concated += int.to_bytes(kv, 1, 'big')
+            yield Chunk(content=concated + KeyHeader(key=op.key, length=len(op.key)).getInBytes())
+            buffer = op.value
+            firstChunk = buffer.read(chunkSize)
+            firstChunk = ValueChunkHeader(
+                chunk=firstChunk, length=op.length).getInBytes()
+            yield Chunk(content=firstChunk)
+            chunk = buffer.read(chunkSize)
+            while chunk:
+                yield Chunk(content=bytes(chunk))
+                chunk = buffer.read(chunkSize)
+        elif type(op) == datatypes.ZAddRequest:
+            concated = int.to_bytes(1, 8, 'big')
+            concated += int.to_bytes(zadd, 1, 'big')
+            zAdd = ZAddRequest(
+                set=op.set,
+                score=op.score,
+                key=op.key,
+                atTx=op.atTx,
+                boundRef=op.boundRef,
+                noWait=op.noWait
+            )
+            serialized = zAdd.SerializeToString()
+            lengthOf = len(serialized)
+            lengthBytes = int.to_bytes(lengthOf, 8, 'big')
+            yield Chunk(content=concated + lengthBytes + serialized)
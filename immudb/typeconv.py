@@ -29,24 +29,131 @@ def py_to_sqlvalue(value):
     return sqlValue
 
 
+def _setNull(sqlValue, value):
+    sqlValue.null = True
+
+
+def _setInt(sqlValue, value):
+    sqlValue.n = value
+
+
+def _setBool(sqlValue, value):
+    sqlValue.b = value
+
+
+def _setStr(sqlValue, value):
+    sqlValue.s = value
+
+
+def _setBytes(sqlValue, value):
+    sqlValue.bs = bytes(value)
+
+
+def _setDatetime(sqlValue, value):
+    sqlValue.ts = int(value.timestamp()*1e6)
+
+
+def _setFloat(sqlValue, value):
+    sqlValue.f = float(value)
+
+
+# python type -> setter of the SQLValue field, as in py_to_sqlvalue
+_SQLVALUE_SETTERS = {
+    type(None): _setNull,
+    int: _setInt,
+    bool: _setBool,
+    str: _setStr,
+    bytes: _setBytes,
+    bytearray: _setBytes,
+    datetime: _setDatetime,
+    float: _setFloat,
+    decimal.Decimal: _setFloat,
+}
+
+
+def set_sqlvalue(sqlValue, value):
+    """Sets a python value into an existing SQLValue, like py_to_sqlvalue
+    without allocating a new message
+
+    Args:
+        sqlValue (schema_pb2.SQLValue): value to set
+        value: python value
+    """
+    setter = _SQLVALUE_SETTERS.get(type(value))
+    if setter is None:
+        raise TypeError("Type not supported: {}".format(
+            value.__class__.__name__))
+    setter(sqlValue, value)
+
+
+def _timestamp(ts):
+    return datetime.fromtimestamp(ts/1e6, timezone.utc)
+
+
+def _null(value):
+    return None
+
+
+# SQLValue field -> conversion of its value, None when used as is
+_FIELD_CONVERTERS = {
+    "n": None,
+    "b": bool,
+    "bs": None,
+    "s": None,
+    "ts": _timestamp,
+    "f": None,
+    "null": _null,
+}
+
+# SQL column type -> SQLValue field holding its values
+SQL_TYPE_FIELDS = {
+    "INTEGER": "n",
+    "BOOLEAN": "b",
+    "VARCHAR": "s",
+    "JSON": "s",
+    "BLOB": "bs",
+    "TIMESTAMP": "ts",
+    "FLOAT": "f",
+}
+
+
 def sqlvalue_to_py(sqlValue):
-    if sqlValue.HasField("n"):
-        return sqlValue.n
-    elif sqlValue.HasField("b"):
-        return bool(sqlValue.b)
-    elif sqlValue.HasField("bs"):
-        return sqlValue.bs
-    elif sqlValue.HasField("s"):
-        return sqlValue.s
-    elif sqlValue.HasField("ts"):
-        return datetime.fromtimestamp(sqlValue.ts/1e6, timezone.utc)
-    elif sqlValue.HasField("f"):
-        return sqlValue.f
-    elif sqlValue.HasField("null"):
-        return None
+    field = sqlValue.WhichOneof("value")
+    if field not in _FIELD_CONVERTERS:
+        raise TypeError("Type not supported: {}".format(field))
+    value = getattr(sqlValue, field)
+    convert = _FIELD_CONVERTERS[field]
+    if convert is None:
+        return value
+    return convert(value)
+
+
+def sqlvalue_decoder(sqlType: str):
+    """Returns a function converting the SQLValues of a column type,
+    reading the field of that type directly. Nulls and values of any other
+    type are converted by sqlvalue_to_py.
+
+    Args:
+        sqlType (str): column type, as in SQLQueryResult.columns
+
+    Returns:
+        Callable[[SQLValue], Any]: decoder
+    """
+    field = SQL_TYPE_FIELDS.get(sqlType.upper())
+    if field is None:
+        return sqlvalue_to_py
+    convert = _FIELD_CONVERTERS[field]
+    if convert is None:
+        def decode(sqlValue):
+            if sqlValue.HasField(field):
+                return getattr(sqlValue, field)
+            return sqlvalue_to_py(sqlValue)
     else:
-        raise TypeError("Type not supported: {}".format(
-            sqlValue.WhichOneof("value")))
+        def decode(sqlValue):
+            if sqlValue.HasField(field):
+                return convert(getattr(sqlValue, field))
+            return sqlvalue_to_py(sqlValue)
+    return decode
 
 
 def MetadataToProto(metadata: KVMetadata):
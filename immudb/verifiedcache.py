@@ -0,0 +1,203 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import hashlib
+import os
+import struct
+import threading
+
+from immudb.embedded import store
+
+
+class VerifiedTxCache:
+    """Bounded LRU set of transactions (id and Alh) already proven to be
+    consistent with the trusted state of a client.
+
+    The states of a client form a single verified chain, so a transaction
+    proven consistent with one of them is consistent with all the following
+    ones: a dual proof between two already trusted transactions can be
+    skipped. Entries are scoped by database name, and the cache must be
+    cleared when the client switches to another server or trusted state.
+    """
+
+    def __init__(self, maxSize: int = 1024):
+        self.maxSize = maxSize
+        self._txs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._txs)
+
+    def isVerified(self, db: str, txId: int, alh: bytes) -> bool:
+        """Checks if a transaction is known with that Alh
+
+        Args:
+            db (str): database name
+            txId (int): transaction id
+            alh (bytes): accumulated linear hash of the transaction
+
+        Returns:
+            bool: True if the transaction was already verified
+        """
+        key = (db, txId)
+        with self._lock:
+            if self._txs.get(key) != alh:
+                return False
+            self._txs.move_to_end(key)
+            return True
+
+    def add(self, db: str, txId: int, alh: bytes, blTxID: int = 0, blRoot: bytes = None):
+        """Records a verified transaction, evicting the least recently used
+        one if the cache is full
+
+        Args:
+            db (str): database name
+            txId (int): transaction id
+            alh (bytes): accumulated linear hash of the transaction
+            blTxID (int, optional): binary linking tx id of the header
+            blRoot (bytes, optional): binary linking root of the header
+        """
+        if self.maxSize <= 0:
+            return
+        key = (db, txId)
+        with self._lock:
+            self._txs[key] = alh
+            self._txs.move_to_end(key)
+            while len(self._txs) > self.maxSize:
+                self._txs.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._txs.clear()
+
+
+# database digest, tx id, Alh, blTxID, blRoot
+_INDEX_RECORD = struct.Struct(">16sQ32sQ32s")
+
+
+def _dbKey(db) -> bytes:
+    if isinstance(db, str):
+        db = db.encode("utf-8")
+    return hashlib.sha256(db).digest()[:16]
+
+
+class TrustedTxIndex(VerifiedTxCache):
+    """VerifiedTxCache persisted to a file, surviving restarts.
+
+    Every verified transaction header (id, Alh, blTxID, blRoot) is appended
+    to the file as a fixed-width record, and the whole index is loaded in
+    memory when opened: a transaction already in the index is verified with
+    its inclusion proof only. The index is never evicted nor cleared when
+    the client logs in again, so a file must be used for a single server.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(maxSize=0)
+        self.filename = filename
+        self._headers = dict()
+        self._fd = os.open(filename, os.O_RDWR |
+                           os.O_CREAT | os.O_APPEND, 0o600)
+        self._load()
+
+    def _load(self):
+        size = os.fstat(self._fd).st_size
+        valid = size - size % _INDEX_RECORD.size
+        if valid != size:
+            # torn record from an interrupted write
+            os.ftruncate(self._fd, valid)
+        with open(self.filename, "rb") as f:
+            data = f.read(valid)
+        for dbKey, txId, alh, blTxID, blRoot in _INDEX_RECORD.iter_unpack(data):
+            self._headers[(dbKey, txId)] = (alh, blTxID, blRoot)
+
+    def __len__(self):
+        return len(self._headers)
+
+    def isVerified(self, db: str, txId: int, alh: bytes) -> bool:
+        header = self._headers.get((_dbKey(db), txId))
+        return header is not None and header[0] == alh
+
+    def header(self, db: str, txId: int):
+        """Returns a trusted transaction header
+
+        Args:
+            db (str): database name
+            txId (int): transaction id
+
+        Returns:
+            tuple: (alh, blTxID, blRoot), or None if the transaction is not
+                in the index
+        """
+        return self._headers.get((_dbKey(db), txId))
+
+    def add(self, db: str, txId: int, alh: bytes, blTxID: int = 0, blRoot: bytes = None):
+        if blRoot is None:
+            blRoot = bytes(32)
+        key = (_dbKey(db), txId)
+        header = (alh, blTxID, blRoot)
+        with self._lock:
+            if self._headers.get(key) == header:
+                return
+            if self._fd is None:
+                raise ValueError("TrustedTxIndex is closed")
+            os.write(self._fd, _INDEX_RECORD.pack(key[0], txId, *header))
+            self._headers[key] = header
+
+    def clear(self):
+        """Empties the index, truncating its file
+        """
+        with self._lock:
+            os.ftruncate(self._fd, 0)
+            self._headers.clear()
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+def verifyDualProof(cache: VerifiedTxCache, state, dualProof, sourceid: int, targetid: int, sourcealh: bytes, targetalh: bytes) -> bool:
+    """store.VerifyDualProof, skipped when both ends are the trusted state or
+    already verified transactions. Both ends are recorded in cache once
+    verified.
+
+    Args:
+        cache (VerifiedTxCache): cache of verified transactions, or None
+        state (State): trusted state the proof was requested from
+        dualProof (store.DualProof): proof
+        sourceid (int): source transaction id
+        targetid (int): target transaction id
+        sourcealh (bytes): source transaction Alh
+        targetalh (bytes): target transaction Alh
+
+    Returns:
+        bool: True if the proof verifies or is not needed
+    """
+    if cache == None:
+        return store.VerifyDualProof(dualProof, sourceid, targetid, sourcealh, targetalh)
+
+    def trusted(txId, alh):
+        if txId == state.txId and alh == state.txHash:
+            return True
+        return cache.isVerified(state.db, txId, alh)
+
+    if trusted(sourceid, sourcealh) and trusted(targetid, targetalh):
+        return True
+    if not store.VerifyDualProof(dualProof, sourceid, targetid, sourcealh, targetalh):
+        return False
+    source = dualProof.sourceTxHeader
+    target = dualProof.targetTxHeader
+    cache.add(state.db, sourceid, sourcealh, source.blTxID, source.blRoot)
+    cache.add(state.db, targetid, targetalh, target.blTxID, target.blRoot)
+    return True
@@ -25,7 +25,7 @@ setup(name='immudb-py',
       author='Codenotary',
       url='https://github.com/codenotary/immudb-py',
       # download_url='',
-      packages=['immudb', 'immudb.database', 'immudb.embedded',
+      packages=['immudb', 'immudb.aio', 'immudb.database', 'immudb.embedded',
                 'immudb.embedded.ahtree', 'immudb.embedded.htree', 'immudb.embedded.store',
                 'immudb.grpc', 'immudb.handler', 'immudb.schema'],
       keywords=['immudb', 'immutable'],
@@ -55,6 +55,11 @@ setup(name='immudb-py',
           'uritemplate>=4.1.1',
           'urllib3>=2.2.1',
       ],
+      extras_require={
+          'numpy': ['numpy'],
+          'arrow': ['numpy', 'pyarrow'],
+          'pandas': ['numpy', 'pyarrow', 'pandas'],
+      },
       classifiers=[
           'Intended Audience :: Developers',
           'Topic :: Software Development :: Build Tools',
@@ -0,0 +1,102 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import uuid
+import grpc
+import pytest
+from immudb.aio import AsyncImmudbClient
+from immudb import constants
+
+
+async def connect(url, login, password):
+    client = AsyncImmudbClient(url)
+    try:
+        await client.login(login, password)
+    except grpc.RpcError:
+        await client.shutdown()
+        pytest.skip("Cannot reach immudb server")
+    return client
+
+
+def test_async_get_set(argsToBuildClient):
+    async def run():
+        client = await connect(*argsToBuildClient)
+        key = str(uuid.uuid4()).encode("utf-8")
+        resp = await client.set(key, b"value")
+        assert resp.id > 0
+        assert (await client.get(key)).value == b"value"
+        assert await client.get(b"non_existing_" + key) == None
+        assert (await client.verifiedGet(key)).verified
+        resp = await client.verifiedSet(key, b"value2")
+        assert resp.verified
+        assert (await client.verifiedGetAt(key, resp.id)).value == b"value2"
+        assert key in await client.verifiedTxById(resp.id)
+        await client.shutdown()
+    asyncio.run(run())
+
+
+def test_async_concurrent_verified_reads(argsToBuildClient):
+    async def run():
+        client = await connect(*argsToBuildClient)
+        keys = [str(uuid.uuid4()).encode("utf-8") for i in range(20)]
+        for key in keys:
+            await client.set(key, key)
+        before = (await client.currentState()).txId
+        results = await asyncio.gather(
+            *[client.verifiedGet(key) for key in keys])
+        assert [r.value for r in results] == keys
+        assert all(r.verified for r in results)
+        await asyncio.gather(
+            *[client.verifiedSet(key, b"new") for key in keys])
+        assert client._rs.get().txId >= before + len(keys)
+        await client.shutdown()
+    asyncio.run(run())
+
+
+def test_async_stream(argsToBuildClient):
+    async def run():
+        client = await connect(*argsToBuildClient)
+        prefix = str(uuid.uuid4()).encode("utf-8")
+        value = b"ab" * 100000
+        await client.streamSetFullValue(prefix + b"1", value)
+        await client.streamSetFullValue(prefix + b"2", b"x")
+        key, reader = await client.streamGet(prefix + b"1")
+        assert key == prefix + b"1"
+        assert await reader.read(10) == value[:10]
+        assert await reader.read() == value[10:]
+        full = await client.streamGetFull(prefix + b"2")
+        assert full.value == b"x"
+        verified = await client.streamVerifiedGet(prefix + b"1")
+        assert verified.value == value and verified.verified
+        scanned = [kv async for kv in client.streamScan(prefix=prefix)]
+        assert [kv.key for kv in scanned] == [prefix + b"1", prefix + b"2"]
+        await client.shutdown()
+    asyncio.run(run())
+
+
+def test_async_sql(argsToBuildClient):
+    async def run():
+        client = await connect(*argsToBuildClient)
+        table = "t" + str(uuid.uuid4()).replace("-", "")
+        await client.sqlExec(
+            f"CREATE TABLE {table} (id INTEGER, name VARCHAR, PRIMARY KEY id)")
+        await client.sqlExec(
+            f"INSERT INTO {table} (id, name) VALUES (@id, @name)", {"id": 1, "name": "one"})
+        assert table in await client.listTables()
+        rows = await client.sqlQuery(f"SELECT id, name FROM {table}")
+        assert rows == [(1, "one")]
+        it = await client.sqlQuery(f"SELECT id, name FROM {table}",
+                                   columnNameMode=constants.COLUMN_NAME_MODE_FIELD, acceptStream=True)
+        assert [row async for row in it] == [{"id": 1, "name": "one"}]
+        await client.shutdown()
+    asyncio.run(run())
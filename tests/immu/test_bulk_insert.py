@@ -0,0 +1,93 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future
+
+import pytest
+from immudb import ImmudbClient
+from immudb.grpc import schema_pb2
+from immudb.handler import bulkInsert
+from immudb.typeconv import sqlvalue_to_py
+
+
+class FakeSQLExec(object):
+    def __init__(self, failAt=None):
+        self.requests = []
+        self.failAt = failAt
+
+    def _result(self, request):
+        self.requests.append(request)
+        if len(self.requests) == self.failAt:
+            raise RuntimeError("failed")
+        return schema_pb2.SQLExecResult(txs=[schema_pb2.CommittedSQLTx(
+            updatedRows=len(request.params) // 2)])
+
+    def __call__(self, request):
+        return self._result(request)
+
+    def future(self, request):
+        f = Future()
+        try:
+            f.set_result(self._result(request))
+        except Exception as e:
+            f.set_exception(e)
+        return f
+
+
+class FakeService(object):
+    def __init__(self, failAt=None):
+        self.SQLExec = FakeSQLExec(failAt)
+
+
+def test_statement():
+    assert bulkInsert.statement("t", ("id", "name"), 2) == \
+        "INSERT INTO t (id, name) VALUES (@v0_0, @v0_1), (@v1_0, @v1_1)"
+
+
+def test_bulk_insert_batches():
+    service = FakeService()
+    rows = [(i, str(i)) for i in range(4)] + [{"name": "x", "id": 4}]
+    results = bulkInsert.call(service, None, "t", ["id", "name"], rows, 2)
+    assert [r.txs[0].updatedRows for r in results] == [2, 2, 1]
+    requests = service.SQLExec.requests
+    assert requests[2].sql == "INSERT INTO t (id, name) VALUES (@v0_0, @v0_1)"
+    assert {p.name: sqlvalue_to_py(p.value) for p in requests[2].params} == {
+        "v0_0": 4, "v0_1": "x"}
+
+
+@pytest.mark.parametrize("parallel", [1, 3])
+def test_bulk_insert_parallel(parallel):
+    service = FakeService()
+    results = bulkInsert.call(service, None, "t", ["id", "name"],
+                              [(i, None) for i in range(10)], 3, parallel=parallel)
+    assert [r.txs[0].updatedRows for r in results] == [3, 3, 3, 1]
+    with pytest.raises(RuntimeError):
+        bulkInsert.call(FakeService(failAt=2), None, "t", ["id", "name"],
+                        [(i, None) for i in range(10)], 3, parallel=parallel)
+
+
+def test_bulk_insert_invalid_rows():
+    with pytest.raises(ValueError):
+        bulkInsert.call(FakeService(), None, "t", ["id", "name"], [(1,)])
+    with pytest.raises(ValueError):
+        bulkInsert.call(FakeService(), None, "t",
+                        ["id", "name"], [{"id": 1}])
+
+
+def test_bulk_insert(client: ImmudbClient):
+    client.sqlExec(
+        "CREATE TABLE IF NOT EXISTS bulk (id INTEGER AUTO_INCREMENT, name VARCHAR, PRIMARY KEY id)")
+    before = client.sqlQuery("SELECT COUNT(*) FROM bulk")[0][0]
+    results = client.bulkInsert("bulk", ["name"], [("name{}".format(i),) for i in range(250)],
+                                batchSize=100, parallel=2)
+    assert len(results) == 3
+    assert client.sqlQuery("SELECT COUNT(*) FROM bulk")[0][0] == before + 250
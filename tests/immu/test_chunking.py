@@ -0,0 +1,129 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future
+import grpc
+import pytest
+from immudb import ImmudbClient, chunking, datatypes
+from immudb.grpc import schema_pb2
+from immudb.handler import batchGet, batchSet, execAll
+
+
+class Exhausted(grpc.RpcError, grpc.Call):
+    def code(self):
+        return grpc.StatusCode.RESOURCE_EXHAUSTED
+
+
+class FakeMethod(object):
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return self.handler(request)
+
+    def future(self, request):
+        f = Future()
+        try:
+            f.set_result(self(request))
+        except Exception as e:
+            f.set_exception(e)
+        return f
+
+
+class FakeService(object):
+    def __init__(self, maxKeys=None):
+        self.kv = {}
+        self.tx = 0
+        self.maxKeys = maxKeys
+        self.Set = FakeMethod(self._set)
+        self.GetAll = FakeMethod(self._getAll)
+        self.ExecAll = FakeMethod(self._execAll)
+
+    def _set(self, request):
+        for kv in request.KVs:
+            self.kv[kv.key] = kv.value
+        self.tx += 1
+        return schema_pb2.TxHeader(id=self.tx)
+
+    def _getAll(self, request):
+        if self.maxKeys is not None and len(request.keys) > self.maxKeys:
+            raise Exhausted()
+        return schema_pb2.Entries(entries=[schema_pb2.Entry(
+            key=key, value=self.kv[key]) for key in request.keys])
+
+    def _execAll(self, request):
+        self.tx += 1
+        return schema_pb2.TxHeader(id=self.tx)
+
+
+def test_split():
+    assert chunking.split([], len, 10) == [[]]
+    assert chunking.split([b"a"] * 5, len, 0) == [[b"a"] * 5]
+    chunks = chunking.split([b"a" * 10] * 5, len, 32)
+    assert chunks == [[b"a" * 10] * 2] * 2 + [[b"a" * 10]]
+    # an item bigger than the limit goes alone
+    assert chunking.split([b"a", b"b" * 100, b"c"], len, 32) == [
+        [b"a"], [b"b" * 100], [b"c"]]
+
+
+def test_set_get_all_chunked():
+    service = FakeService(maxKeys=30)
+    kv = {"key{}".format(i).encode(): b"v" * 100 for i in range(100)}
+    resp = batchSet.call(service, None, kv, 2048)
+    assert len(service.Set.requests) > 1
+    assert all(r.ByteSize() <= 2048 for r in service.Set.requests)
+    assert resp == datatypes.SetResponse(id=service.tx, verified=False)
+    assert service.kv == kv
+
+    # responses too big are retried in halves
+    got = batchGet.call(service, None, list(kv), 4096)
+    assert list(got) == list(kv)
+    served = [r for r in service.GetAll.requests if len(r.keys) <= 30]
+    assert sum(len(r.keys) for r in served) == 100
+
+    service.Set.requests = []
+    batchSet.call(service, None, kv)
+    assert len(service.Set.requests) == 1
+
+
+def test_client_does_not_split_by_default():
+    client = ImmudbClient("localhost:1")
+    client._stub = FakeService()
+    kv = {"key{}".format(i).encode(): b"v" * 1024 for i in range(5000)}
+    client.setAll(kv)
+    assert len(client._stub.Set.requests) == 1
+    client.execAll([datatypes.KeyValue(k, v) for k, v in kv.items()])
+    assert len(client._stub.ExecAll.requests) == 1
+
+
+def test_exec_all_chunked():
+    service = FakeService()
+    ops = [datatypes.KeyValue("key{}".format(i).encode(), b"v" * 100)
+           for i in range(50)]
+    ops.append(datatypes.ReferenceRequest(b"ref", b"key0"))
+    resp = execAll.call(service, None, ops, False, 1024)
+    requests = service.ExecAll.requests
+    assert len(requests) > 1
+    assert resp.id == len(requests)
+    sent = [op for r in requests for op in r.Operations]
+    assert sent == list(execAll.buildRequest(ops, False).Operations)
+
+
+def test_chunked_bulk(client: ImmudbClient):
+    chunked = ImmudbClient(client._url, rs=client._rs, maxRequestSize=64 * 1024)
+    chunked.login("immudb", "immudb")
+    kv = {"chunked{}".format(i).encode(): b"x" * 1024 for i in range(500)}
+    chunked.setAll(kv)
+    assert chunked.getAll(list(kv)) == kv
+    assert client.get(b"chunked499").value == b"x" * 1024
@@ -0,0 +1,104 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import pytest
+from immudb import ImmudbClient, datatypes
+from immudb.coalescer import WriteCoalescer
+
+
+class FakeClient(object):
+    def __init__(self):
+        self.txs = []
+        self.fail = False
+        self.lock = threading.Lock()
+
+    def _commit(self, ops):
+        if self.fail:
+            raise RuntimeError("commit failed")
+        with self.lock:
+            self.txs.append(ops)
+            return datatypes.SetResponse(id=len(self.txs), verified=False)
+
+    def setAll(self, kv):
+        return self._commit([datatypes.KeyValue(k, v) for k, v in kv.items()])
+
+    def execAll(self, ops, noWait=False):
+        return self._commit(list(ops))
+
+
+def test_coalesce_by_size():
+    client = FakeClient()
+    with WriteCoalescer(client, maxEntries=10, maxDelay=60) as coalescer:
+        futures = [coalescer.set("key{}".format(i).encode(), b"v")
+                   for i in range(25)]
+        assert [f.result().id for f in futures[:20]] == [1] * 10 + [2] * 10
+        assert [f.result().index for f in futures[:10]] == list(range(10))
+    # the last partial batch is sent on close
+    assert futures[-1].result() == datatypes.CoalescedWriteResponse(id=3, index=4)
+    assert [len(tx) for tx in client.txs] == [10, 10, 5]
+
+
+def test_coalesce_by_bytes():
+    client = FakeClient()
+    client._maxRequestSize = 4096
+    with WriteCoalescer(client, maxDelay=60, maxBytes=1 << 20) as coalescer:
+        assert coalescer.maxBytes == 4096
+        futures = [coalescer.set("key{}".format(i).encode(), b"v" * 1000)
+                   for i in range(10)]
+    assert [f.result().id for f in futures] == [1] * 3 + [2] * 3 + [3] * 3 + [4]
+    assert [len(tx) for tx in client.txs] == [3, 3, 3, 1]
+
+
+def test_coalesce_by_delay():
+    client = FakeClient()
+    with WriteCoalescer(client, maxEntries=1000, maxDelay=0.01) as coalescer:
+        first = coalescer.set(b"a", b"1")
+        assert first.result(timeout=5).id == 1
+
+
+def test_mixed_ops_and_duplicates():
+    client = FakeClient()
+    with WriteCoalescer(client, maxEntries=100, maxDelay=60) as coalescer:
+        a = coalescer.set(b"a", b"1")
+        ref = coalescer.setReference(b"a", b"refa")
+        z = coalescer.zAdd(b"zset", 1.0, b"a")
+        # same key again: goes to the next transaction
+        again = coalescer.set(b"a", b"2")
+        coalescer.flush()
+        assert (a.result().id, ref.result().id, z.result().id) == (1, 1, 1)
+        assert z.result().index == 2
+        assert again.result() == datatypes.CoalescedWriteResponse(id=2, index=0)
+    assert type(client.txs[0][1]) is datatypes.ReferenceRequest
+    with pytest.raises(ValueError):
+        coalescer.set(b"b", b"1")
+
+
+def test_failed_batch():
+    client = FakeClient()
+    client.fail = True
+    with WriteCoalescer(client, maxEntries=2, maxDelay=60) as coalescer:
+        futures = [coalescer.set(b"a", b"1"), coalescer.set(b"b", b"1")]
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result()
+
+
+def test_coalescer(client: ImmudbClient):
+    with WriteCoalescer(client, maxEntries=50) as coalescer:
+        futures = [coalescer.set("coalesced{}".format(i).encode(), b"value")
+                   for i in range(120)]
+        futures.append(coalescer.zAdd(b"coalescedset", 1.0, b"coalesced0"))
+    ids = [f.result().id for f in futures]
+    assert len(set(ids)) >= 3
+    assert client.get(b"coalesced119").value == b"value"
+    assert client.get(b"coalesced0").tx == ids[0]
@@ -0,0 +1,70 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from random import shuffle
+from immudb.client import ImmudbClient, ConcurrentRootService
+from immudb.rootService import State
+from immudb.grpc import schema_pb2
+import grpc
+import pytest
+
+
+class FakeStateService(object):
+    def CurrentState(self, request):
+        return schema_pb2.ImmutableState(db="defaultdb", txId=5, txHash=b"5")
+
+
+def makeState(txId, db="defaultdb"):
+    return State(db=db, txId=txId, txHash=str(txId).encode(),
+                 publicKey=None, signature=None)
+
+
+def test_advance_only():
+    rs = ConcurrentRootService()
+    rs.init("defaultdb", FakeStateService())
+    assert rs.get().txId == 5
+    assert not rs.advance(makeState(4))
+    assert rs.get().txId == 5
+    assert rs.advance(makeState(7))
+    rs.set(makeState(6))
+    assert rs.get().txId == 7
+    assert not rs.advance(makeState(9, db="otherdb"))
+    assert rs.get().txId == 7
+
+
+def test_concurrent_advance():
+    rs = ConcurrentRootService()
+    rs.init("defaultdb", FakeStateService())
+    txIds = list(range(1000))
+    shuffle(txIds)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda txId: rs.set(makeState(txId)), txIds))
+    assert rs.get().txId == 999
+
+
+def test_shared_verified_calls(argsToBuildClient):
+    url, login, password = argsToBuildClient
+    client = ImmudbClient(url, rs=ConcurrentRootService())
+    try:
+        client.login(login, password)
+    except grpc.RpcError:
+        pytest.skip("Cannot reach immudb server")
+    keys = [b"concurrent_state_%d" % i for i in range(16)]
+    for key in keys:
+        client.set(key, key)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(client.verifiedGet, keys))
+    assert [r.value for r in results] == keys
+    assert client._rs.get().txId >= max(r.id for r in results)
+    client.logout()
@@ -0,0 +1,138 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from immudb import ImmudbClient
+from immudb.cursor import HistoryCursor, ScanCursor, TxScanCursor, load
+from immudb.grpc import schema_pb2
+from immudb.handler import cursors
+
+
+class FakeKVService(object):
+    """Versioned key-value store, one transaction per write"""
+
+    def __init__(self):
+        self.tx = 0
+        self.revisions = {}
+
+    def set(self, key, value, deleted=False):
+        self.tx += 1
+        self.revisions.setdefault(key, []).append(schema_pb2.Entry(
+            tx=self.tx, key=key, value=value,
+            metadata=schema_pb2.KVMetadata(deleted=deleted)))
+
+    def CurrentState(self, request):
+        return schema_pb2.ImmutableState(txId=self.tx)
+
+    def Scan(self, request):
+        keys = sorted(k for k, revs in self.revisions.items()
+                      if k.startswith(request.prefix) and not revs[-1].metadata.deleted)
+        if request.seekKey:
+            keys = [k for k in keys if k > request.seekKey or (
+                request.inclusiveSeek and k == request.seekKey)]
+        return schema_pb2.Entries(entries=[self.revisions[k][-1] for k in keys[:request.limit]])
+
+    def History(self, request):
+        revs = self.revisions[request.key]
+        if request.desc:
+            revs = revs[::-1]
+        return schema_pb2.Entries(entries=revs[request.offset:request.offset + request.limit])
+
+    def TxScan(self, request):
+        return schema_pb2.TxList(txs=[schema_pb2.Tx(header=schema_pb2.TxHeader(id=i))
+                                      for i in range(request.initialTx, min(self.tx + 1, request.initialTx + request.limit))])
+
+
+def test_scan_cursor_resumes_from_snapshot(tmp_path):
+    service = FakeKVService()
+    for i in range(10):
+        service.set("key{}".format(i).encode(), b"v1")
+    cursor = ScanCursor(prefix=b"key")
+    scan = cursors.scan(service, cursor, pageSize=3)
+    got = [next(scan).key for i in range(4)]
+    assert got == [b"key0", b"key1", b"key2", b"key3"]
+    filename = str(tmp_path / "cursor")
+    cursor.save(filename)
+
+    # writes after the snapshot are not seen by the resumed scan
+    service.set(b"key5", b"v2")
+    service.set(b"key55", b"new")
+    service.set(b"key7", b"v2", deleted=True)
+    resumed = load(filename)
+    assert resumed == cursor
+    rest = list(cursors.scan(service, resumed, pageSize=3))
+    # deleted keys are not returned by the server anymore
+    assert [e.key for e in rest] == [
+        "key{}".format(i).encode() for i in (4, 5, 6, 8, 9)]
+    assert all(e.value == b"v1" for e in rest)
+    assert resumed.finished and resumed.count == 9
+    assert list(cursors.scan(service, resumed, pageSize=3)) == []
+
+
+def test_scan_cursor_pinned_to_server_state():
+    service = FakeKVService()
+    # written after login, not in the local trusted state of the client
+    for i in range(5):
+        service.set("key{}".format(i).encode(), b"v1")
+    cursor = ScanCursor(prefix=b"key")
+    got = list(cursors.scan(service, cursor, pageSize=2))
+    assert [e.key for e in got] == [
+        "key{}".format(i).encode() for i in range(5)]
+    assert cursor.snapshotTx == 5 and cursor.count == 5
+
+
+def test_history_cursor():
+    service = FakeKVService()
+    for i in range(7):
+        service.set(b"key", str(i).encode())
+    cursor = HistoryCursor(key=b"key")
+    history = cursors.history(service, cursor, pageSize=2)
+    assert [next(history).value for i in range(3)] == [b"0", b"1", b"2"]
+    service.set(b"key", b"late")
+    resumed = HistoryCursor.fromDict(cursor.toDict())
+    assert [e.value for e in cursors.history(service, resumed, pageSize=2)] == [
+        b"3", b"4", b"5", b"6"]
+    assert resumed.finished and resumed.offset == 7
+
+
+def test_tx_scan_cursor(tmp_path):
+    service = FakeKVService()
+    for i in range(25):
+        service.set(b"key", b"v")
+    cursor = TxScanCursor(nextTx=3)
+    txs = cursors.txScan(service, cursor, pageSize=10)
+    assert [next(txs).header.id for i in range(5)] == [3, 4, 5, 6, 7]
+    filename = str(tmp_path / "cursor")
+    cursor.save(filename)
+    service.set(b"key", b"late")
+    resumed = load(filename)
+    assert [tx.header.id for tx in cursors.txScan(service, resumed, pageSize=10)] == list(range(8, 26))
+    assert resumed.nextTx == 26 and resumed.finished
+
+
+def test_load_unknown(tmp_path):
+    filename = tmp_path / "cursor"
+    filename.write_text('{"cursor": "Other"}')
+    with pytest.raises(ValueError):
+        load(str(filename))
+
+
+def test_scan_cursor(client: ImmudbClient):
+    client.setAll({"cursorscan{:03d}".format(i).encode(): b"v" for i in range(50)})
+    cursor = ScanCursor(prefix=b"cursorscan")
+    first = [e.key for e, i in zip(client.scanCursor(cursor, pageSize=7), range(20))]
+    client.set(b"cursorscan010", b"changed")
+    rest = list(client.scanCursor(ScanCursor.fromDict(cursor.toDict()), pageSize=7))
+    assert first + [e.key for e in rest] == ["cursorscan{:03d}".format(i).encode() for i in range(50)]
+    snapshot = cursor.snapshotTx
+    txs = list(client.txScanCursor(TxScanCursor(nextTx=snapshot - 2)))
+    assert [tx.header.id for tx in txs][:3] == [snapshot - 2, snapshot - 1, snapshot]
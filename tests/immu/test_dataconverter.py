@@ -0,0 +1,94 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from immudb import ImmudbClient, datatypesv2
+from immudb.dataconverter import convertResponse
+from immudb.grpc import schema_pb2
+
+
+def reflectiveConvert(fromResponse, toHumanDataClass=True):
+    """Conversion by reflection on every message, as done before the
+    converter registry"""
+    if fromResponse.__class__.__name__ == "RepeatedCompositeContainer":
+        return [reflectiveConvert(item) for item in fromResponse]
+    schemaFrom = datatypesv2.__dict__.get(
+        fromResponse.__class__.__name__, None)
+    if schemaFrom:
+        construct = dict()
+        for field in fromResponse.ListFields():
+            construct[field[0].name] = reflectiveConvert(field[1], False)
+        if toHumanDataClass:
+            return schemaFrom(**construct)._getHumanDataClass()
+        return schemaFrom(**construct)
+    return fromResponse
+
+
+def messages():
+    header = schema_pb2.TxHeader(id=3, prevAlh=b"a" * 32, ts=100, nentries=2,
+                                 eH=b"e" * 32, blTxId=2, blRoot=b"r" * 32, version=1)
+    yield schema_pb2.TxList(txs=[
+        schema_pb2.Tx(header=header, entries=[
+            schema_pb2.TxEntry(key=b"k", hValue=b"h" * 32, vLen=4,
+                               metadata=schema_pb2.KVMetadata(deleted=True))]),
+        schema_pb2.Tx(header=schema_pb2.TxHeader(id=4))])
+    yield schema_pb2.Entry(tx=1, key=b"key", value=b"value",
+                           referencedBy=schema_pb2.Reference(tx=2, key=b"ref"))
+    yield schema_pb2.ServerInfoResponse(version="1.9.0", startedAt=10,
+                                        numTransactions=5, numDatabases=1, databasesDiskSize=99)
+    yield schema_pb2.DatabaseSettingsResponse(database="db", settings=schema_pb2.DatabaseNullableSettings(
+        maxKeyLen=schema_pb2.NullableUint32(value=512),
+        autoload=schema_pb2.NullableBool(value=True)))
+    yield schema_pb2.DatabaseHealthResponse(pendingRequests=1)
+    yield schema_pb2.VerifiableSQLEntry(ColNamesById={1: "id"}, PKIDs=[1])
+    yield schema_pb2.TxHeader()
+
+
+def test_convert_response_registry():
+    for message in messages():
+        for toHuman in [True, False]:
+            assert convertResponse(message, toHuman) == reflectiveConvert(
+                message, toHuman)
+    txs = schema_pb2.TxList(txs=[schema_pb2.Tx(header=schema_pb2.TxHeader(id=1))]).txs
+    assert convertResponse(txs) == reflectiveConvert(txs)
+    assert convertResponse(b"bytes") == b"bytes"
+
+
+def test_convert_response_all_messages():
+    for name, descriptor in schema_pb2.DESCRIPTOR.message_types_by_name.items():
+        message = getattr(schema_pb2, name)()
+        try:
+            expected = reflectiveConvert(message)
+        except TypeError:
+            # dataclass with required fields
+            with pytest.raises(TypeError):
+                convertResponse(message)
+            continue
+        assert convertResponse(message) == expected
+    for value in [schema_pb2.ZEntry(score=-0.0), schema_pb2.ZEntry(score=0.0), schema_pb2.SQLValue(n=0),
+                  schema_pb2.SQLValue(null=0)]:
+        assert convertResponse(value) == reflectiveConvert(value)
+
+
+class FakeStub(object):
+    def ServerInfo(self, request):
+        return schema_pb2.ServerInfoResponse(version="1.9.0")
+
+
+def test_raw_responses():
+    client = ImmudbClient(rawResponses=True)
+    client._stub = FakeStub()
+    assert isinstance(client.serverInfo(), schema_pb2.ServerInfoResponse)
+    client = ImmudbClient()
+    client._stub = FakeStub()
+    assert client.serverInfo() == datatypesv2.ServerInfoResponse(
+        version="1.9.0")
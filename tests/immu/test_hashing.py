@@ -0,0 +1,121 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import random
+import struct
+from immudb.constants import LEAF_PREFIX, NODE_PREFIX
+from immudb.embedded import ahtree, hashing, htree, store
+
+
+def node(left, right):
+    return hashlib.sha256(NODE_PREFIX+left+right).digest()
+
+
+def referenceEvalInclusion(iproof, i, j, iLeaf):
+    i1, j1 = i - 1, j - 1
+    ciRoot = iLeaf
+    for h in iproof:
+        if i1 % 2 == 0 and i1 != j1:
+            ciRoot = node(ciRoot, h)
+        else:
+            ciRoot = node(h, ciRoot)
+        i1, j1 = i1 >> 1, j1 >> 1
+    return ciRoot
+
+
+def referenceEvalConsistency(cproof, i, j):
+    fn, sn = i - 1, j - 1
+    while fn % 2 == 1:
+        fn, sn = fn >> 1, sn >> 1
+    ciRoot, cjRoot = cproof[0], cproof[0]
+    for h in cproof[1:]:
+        if fn % 2 == 1 or fn == sn:
+            ciRoot = node(h, ciRoot)
+            cjRoot = node(h, cjRoot)
+            while fn % 2 == 0 and fn != 0:
+                fn, sn = fn >> 1, sn >> 1
+        else:
+            cjRoot = node(cjRoot, h)
+        fn, sn = fn >> 1, sn >> 1
+    return ciRoot, cjRoot
+
+
+def test_ahtree_backend():
+    rnd = random.Random(42)
+    for n in range(1, 20):
+        proof = [os.urandom(32) for k in range(n)]
+        j = rnd.randint(1, 1 << 20)
+        i = rnd.randint(1, j)
+        leaf = os.urandom(32)
+        assert ahtree.EvalInclusion(proof, i, j, leaf) == \
+            referenceEvalInclusion(proof, i, j, leaf)
+        assert ahtree.EvalConsistency(proof, i, j) == \
+            referenceEvalConsistency(proof, i, j)
+        root = leaf
+        for h in proof:
+            root = node(h, root)
+        assert ahtree.EvalLastInclusion(proof, j, leaf) == root
+
+
+def test_htree_backend():
+    for width in range(1, 34):
+        digests = [os.urandom(32) for i in range(width)]
+        tree = htree.HTree(width)
+        tree.BuildWith(digests)
+        level = [hashlib.sha256(LEAF_PREFIX+d).digest() for d in digests]
+        while len(level) > 1:
+            parents = [node(level[i], level[i+1])
+                       for i in range(0, len(level)-1, 2)]
+            if len(level) % 2 == 1:
+                parents.append(level[-1])
+            level = parents
+        assert tree.root == level[0]
+        for i in range(width):
+            proof = tree.InclusionProof(i)
+            proof.terms = [proof.terms[k:k+32]
+                           for k in range(0, len(proof.terms), 32)]
+            assert store.VerifyInclusion(proof, digests[i], tree.root)
+            assert not store.VerifyInclusion(proof, digests[i][::-1], tree.root)
+
+
+def test_linear_proof_backend():
+    terms = [os.urandom(32) for i in range(5)]
+    alh = terms[0]
+    for i in range(1, 5):
+        alh = hashlib.sha256(struct.pack(">Q", 10+i)+alh+terms[i]).digest()
+    assert hashing.getBackend().evalLinearProof(10, terms) == alh
+
+
+class CountingBackend(hashing.PythonHashBackend):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def evalInclusion(self, iproof, i, j, iLeaf):
+        self.calls += 1
+        return super().evalInclusion(iproof, i, j, iLeaf)
+
+
+def test_set_backend():
+    backend = CountingBackend()
+    hashing.setBackend(backend)
+    try:
+        leaf = os.urandom(32)
+        proof = [os.urandom(32)]
+        root = ahtree.EvalInclusion(proof, 1, 2, leaf)
+        assert ahtree.VerifyInclusion(proof, 1, 2, leaf, root)
+        assert backend.calls == 2
+    finally:
+        hashing.setBackend()
+    assert type(hashing.getBackend()) == hashing.PythonHashBackend
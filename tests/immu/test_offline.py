@@ -11,6 +11,7 @@
 # limitations under the License.
 
 import base64
+from concurrent.futures import Future
 from string import printable
 from immudb.embedded import store, htree, ahtree
 from immudb.embedded.store.tx import TxEntryDigest_v1_1
@@ -22,6 +23,9 @@ from immudb.embedded.store import KVMetadata, EntrySpecDigestFor, Tx as storeTx,
 import pytest
 import datetime
 from immudb.printable import printable
+from immudb.handler import verifiedBatchGet, verifiedTxStream
+from immudb.rootService import RootService
+from immudb.client import ImmudbClient
 
 v0 = b'CnIIGhIg0IswQi+55M5xLZSEZUNnpSqoU7JSjtSgNZBlyCMK/3IYzfrjgAYgASogsgXOdHznBIOL0fRjDit+QmDn+9M5FZms8jTI5fHfcpIwGTogmXu3vjcP/kHZTXvT0O158Tx9A3ywjmHG0LOPxS5Bk9kSOwoLAHNhbGFjYWR1bGESIMTfI1H+rKu77CCQQ/ktaUmx/krECfmjHSg+Gy3Zc2NvGMyAgICAgICAASAL'
 s1 = b'CglkZWZhdWx0ZGIaIOOwxEKY/BwUmvv0yJlvuSQnrkHkZJuTTKSVmRt4UrhV'
@@ -253,3 +257,150 @@ def test_KVMetadataFromProto():
 
 def test_TxMetadataFromProto():
     assert schema.TxMetadataFromProto(None) == None
+
+
+class FakeUnaryMethod(object):
+    def __init__(self, handler):
+        self.handler = handler
+        self.futures = 0
+
+    def __call__(self, request):
+        return self.handler(request)
+
+    def future(self, request):
+        self.futures += 1
+        f = Future()
+        f.set_result(self.handler(request))
+        return f
+
+
+class FakeBatchService(object):
+    def __init__(self, state, vtx, value):
+        self.state = schema_pb2.ImmutableState()
+        self.state.ParseFromString(base64.b64decode(state))
+        self.vtx = schema_pb2.VerifiableTx()
+        self.vtx.ParseFromString(base64.b64decode(vtx))
+        self.value = value
+        self.VerifiableTxById = FakeUnaryMethod(lambda request: self.vtx)
+
+    def CurrentState(self, request):
+        return self.state
+
+    def GetAll(self, request):
+        return schema_pb2.Entries(entries=[schema_pb2.Entry(
+            key=b"immutable", value=self.value, tx=self.vtx.tx.header.id)])
+
+
+def test_verified_batch_get():
+    for ss, vv in ((s1, v1), (s2, v2)):
+        service = FakeBatchService(ss, vv, b"database")
+        rs = RootService()
+        rs.init("defaultdb", service)
+        resp = verifiedBatchGet.call(service, rs, [b"immutable"])
+        assert resp[b"immutable"].value == b"database"
+        assert resp[b"immutable"].id == service.vtx.tx.header.id
+        assert rs.get().txId == service.vtx.tx.header.id
+        assert service.VerifiableTxById.futures == 1
+
+        service = FakeBatchService(ss, vv, b"tampered")
+        rs = RootService()
+        rs.init("defaultdb", service)
+        with pytest.raises(ErrCorruptedData):
+            verifiedBatchGet.call(service, rs, [b"immutable"])
+        assert rs.get().txId == service.state.txId
+
+
+class FakeTxScanService(FakeBatchService):
+    def __init__(self, state, vtx, txs):
+        super().__init__(state, vtx, b"database")
+        self.txs = txs
+
+    def TxScan(self, request):
+        txs = [tx for tx in self.txs if tx.header.id >= request.initialTx]
+        return schema_pb2.TxList(txs=txs[:request.limit])
+
+
+def test_verified_tx_stream():
+    service = FakeTxScanService(s2, v2, [])
+    service.txs = [service.vtx.tx]
+    rs = RootService()
+    rs.init("defaultdb", service)
+    txs = list(verifiedTxStream.call(service, rs, 4, batchSize=10))
+    assert [tx.header.iD for tx in txs] == [4]
+    assert txs[0].entries[0].key() == b"\x00immutable"
+    assert rs.get().txId == 4
+    assert list(verifiedTxStream.call(service, rs, 5)) == []
+
+    # entries not matching eh
+    tampered = schema_pb2.Tx()
+    tampered.CopyFrom(service.vtx.tx)
+    tampered.entries[0].hValue = bytes(32)
+    # a gap in the transaction ids
+    gap = schema_pb2.Tx()
+    gap.CopyFrom(service.vtx.tx)
+    for txs in ([tampered], [service.vtx.tx, gap]):
+        service = FakeTxScanService(s2, v2, txs)
+        rs = RootService()
+        rs.init("defaultdb", service)
+        with pytest.raises(ErrCorruptedData):
+            list(verifiedTxStream.call(service, rs, 4))
+        assert rs.get().txId == 3
+
+
+class FakeStream(list):
+    def cancel(self):
+        pass
+
+
+class FakeVerifiableStreamService(FakeBatchService):
+    def streamVerifiableGet(self, request):
+        def frame(content):
+            return schema_pb2.Chunk(content=len(content).to_bytes(8, 'big') + content)
+        entry = schema_pb2.Entry(key=b"immutable", tx=self.vtx.tx.header.id)
+        proof = schema_pb2.InclusionProof(leaf=0, width=1)
+        value = self.value
+        return FakeStream([
+            frame(entry.SerializeToString()),
+            frame(self.vtx.SerializeToString()),
+            frame(proof.SerializeToString()),
+            schema_pb2.Chunk(content=len(value).to_bytes(8, 'big') + value[:3])
+        ] + [schema_pb2.Chunk(content=value[i:i + 2]) for i in range(3, len(value), 2)])
+
+
+def makeStreamClient(state, vtx, value):
+    client = ImmudbClient("localhost:1")
+    client._stub = FakeVerifiableStreamService(state, vtx, value)
+    client._rs = RootService()
+    client._rs.init("defaultdb", client._stub)
+    return client
+
+
+def test_stream_verified_get_incremental(tmp_path):
+    for ss, vv in ((s1, v1), (s2, v2)):
+        client = makeStreamClient(ss, vv, b"database")
+        resp = client.streamVerifiedGet(b"immutable")
+        assert resp.value == b"database"
+        assert client._rs.get().txId == client._stub.vtx.tx.header.id
+
+        client = makeStreamClient(ss, vv, b"database")
+        resp, reader = client.streamVerifiedGetBuffered(b"immutable")
+        assert resp.id == client._stub.vtx.tx.header.id
+        assert reader.read(5) == b"datab"
+        # the state is committed once the value is verified
+        assert client._rs.get().txId == client._stub.state.txId
+        assert reader.read(5) == b"ase"
+        assert client._rs.get().txId == client._stub.vtx.tx.header.id
+
+        client = makeStreamClient(ss, vv, b"database")
+        path = tmp_path / "value"
+        client.streamVerifiedGetToFile(b"immutable", str(path))
+        assert path.read_bytes() == b"database"
+
+        client = makeStreamClient(ss, vv, b"databasX")
+        with pytest.raises(ErrCorruptedData):
+            client.streamVerifiedGet(b"immutable")
+        assert client._rs.get().txId == client._stub.state.txId
+        client = makeStreamClient(ss, vv, b"databasX")
+        with pytest.raises(ErrCorruptedData):
+            client.streamVerifiedGetToFile(b"immutable", str(path))
+        assert not path.exists()
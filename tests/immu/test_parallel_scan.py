@@ -0,0 +1,99 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import pytest
+from immudb import ImmudbClient
+from immudb.datatypesv2 import KeyValue
+from immudb.grpc import schema_pb2
+from immudb.scanpartition import keyRanges, runPartitions, splitKeyRange
+
+
+def test_split_key_range():
+    boundaries = splitKeyRange(b"key0000", b"key9999", 4)
+    assert len(boundaries) == 3
+    assert b"key0000" < boundaries[0] < boundaries[1] < boundaries[2] <= b"key9999"
+    assert all(b.startswith(b"key") for b in boundaries)
+    # a single key can not be split
+    assert splitKeyRange(b"k", b"k", 4) == []
+    assert splitKeyRange(b"a", b"b", 1) == []
+    assert keyRanges([]) == [(None, None)]
+    assert keyRanges([b"b", b"c"]) == [(None, b"b"), (b"b", b"c"), (b"c", None)]
+
+
+def test_run_partitions():
+    parts = [range(0, 100), range(100, 150), range(150, 400)]
+    scans = [lambda part=part: iter(part) for part in parts]
+    assert list(runPartitions(scans, bufferSize=7)) == list(range(400))
+    assert sorted(runPartitions(scans, ordered=False, bufferSize=7)) == list(range(400))
+
+
+def test_run_partitions_errors_and_close():
+    def failing():
+        yield 1
+        raise RuntimeError("scan failed")
+    with pytest.raises(RuntimeError):
+        list(runPartitions([lambda: iter(range(10)), failing]))
+
+    stopped = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield 0
+        finally:
+            stopped.set()
+    scan = runPartitions([endless], bufferSize=1)
+    next(scan)
+    scan.close()
+    assert stopped.wait(5)
+
+
+class FakeStateStub(object):
+    def CurrentState(self, request):
+        return schema_pb2.ImmutableState(txId=42)
+
+
+def test_parallel_scan_reads_one_transaction():
+    client = ImmudbClient("localhost:1")
+    client._stub = FakeStateStub()
+    keys = ["k{:03d}".format(i).encode() for i in range(100)]
+    requests = []
+    lock = threading.Lock()
+
+    def streamScan(prefix=b'', desc=False, limit=0, seekKey=None, endKey=None, sinceTx=None,
+                   inclusiveSeek=None, inclusiveEnd=None, **kwargs):
+        with lock:
+            requests.append(sinceTx)
+        found = [k for k in keys if (seekKey == None or k > seekKey or (inclusiveSeek and k == seekKey))
+                 and (endKey == None or k < endKey)]
+        if desc:
+            found = found[::-1]
+        return [KeyValue(key=k, value=b"v") for k in found[:limit]]
+    client.streamScan = streamScan
+
+    got = [kv.key for kv in client.parallelScan(b"k", partitions=4, pageSize=10)]
+    assert got == keys
+    assert len(requests) > 4 and set(requests) == {42}
+    requests.clear()
+    list(client.parallelScan(b"k", sinceTx=7, partitions=2))
+    assert set(requests) == {7}
+
+
+def test_parallel_scan(client: ImmudbClient):
+    kv = {"pscan:{:05d}".format(i).encode(): b"v" for i in range(2500)}
+    client.setAll(kv)
+    keys = [item.key for item in client.parallelScan(b"pscan:", partitions=4, pageSize=300)]
+    assert keys == sorted(kv)
+    keys = [item.key for item in client.parallelScan(b"pscan:", partitions=3, ordered=False)]
+    assert sorted(keys) == sorted(kv)
+    assert list(client.parallelScan(b"pscan-missing:")) == []
@@ -0,0 +1,123 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+from concurrent.futures import Future
+import threading
+import pytest
+from immudb import ImmudbClient
+from immudb.exceptions import ErrCorruptedData
+from immudb.grpc import schema_pb2
+from immudb.handler import verifiedSet
+from immudb.pipeline import WritePipeline
+from immudb.rootService import RootService, _AdvanceOnlyRootService
+from tests.immu.test_offline import s2, v2
+
+
+class FakeCall(object):
+    """grpc multicallable whose futures are completed by the test"""
+
+    def __init__(self, response=None):
+        self.response = response
+        self.pending = []
+
+    def future(self, request):
+        f = Future()
+        self.pending.append(f)
+        return f
+
+    def complete(self):
+        pending, self.pending = self.pending, []
+        for f in pending:
+            if isinstance(self.response, Exception):
+                f.set_exception(self.response)
+            else:
+                f.set_result(self.response)
+
+
+def test_window_is_bounded():
+    pipeline = WritePipeline(2)
+    call = FakeCall(schema_pb2.TxHeader(id=1))
+    futures = [pipeline.submit(lambda: call.future(None), lambda r: r.id)
+               for i in range(2)]
+    third = []
+    t = threading.Thread(target=lambda: third.append(
+        pipeline.submit(lambda: call.future(None), lambda r: r.id)))
+    t.start()
+    t.join(0.1)
+    # the window is full: the third request is not sent yet
+    assert t.is_alive()
+    assert len(call.pending) == 2
+    call.complete()
+    t.join()
+    call.complete()
+    assert [f.result() for f in futures + third] == [1, 1, 1]
+    pipeline.shutdown()
+
+
+def test_errors_are_set_on_futures():
+    pipeline = WritePipeline(1)
+    call = FakeCall(RuntimeError("failed"))
+    f = pipeline.submit(lambda: call.future(None), lambda r: r)
+    call.complete()
+    with pytest.raises(RuntimeError):
+        f.result()
+
+    def broken():
+        raise ValueError("not sent")
+    with pytest.raises(ValueError):
+        pipeline.submit(broken, lambda r: r)
+    # the window was released by both failures
+    pipeline.drain()
+    pipeline.shutdown()
+
+
+class FakeVerifiableSetService(object):
+    def __init__(self):
+        self.state = schema_pb2.ImmutableState()
+        self.state.ParseFromString(base64.b64decode(s2))
+        vtx = schema_pb2.VerifiableTx()
+        vtx.ParseFromString(base64.b64decode(v2))
+        self.VerifiableSet = FakeCall(vtx)
+
+    def CurrentState(self, request):
+        return self.state
+
+
+def test_verified_set_future():
+    pipeline = WritePipeline()
+    service = FakeVerifiableSetService()
+    rs = RootService()
+    rs.init("defaultdb", service)
+    good = verifiedSet.future(service, _AdvanceOnlyRootService(rs), pipeline,
+                              b"immutable", b"database")
+    bad = verifiedSet.future(service, _AdvanceOnlyRootService(rs), pipeline,
+                             b"immutable", b"tampered")
+    service.VerifiableSet.complete()
+    assert good.result().id == 4
+    assert good.result().verified
+    with pytest.raises(ErrCorruptedData):
+        bad.result()
+    assert rs.get().txId == 4
+    pipeline.shutdown()
+
+
+def test_pipelined_writes(client: ImmudbClient):
+    futures = [client.setFuture("pipeline{}".format(i).encode(), b"value")
+               for i in range(100)]
+    futures.append(client.verifiedSetFuture(b"pipelineverified", b"value"))
+    futures.append(client.setAllFuture({b"pipelineall": b"value"}))
+    client.flushWrites()
+    ids = [f.result().id for f in futures]
+    assert len(set(ids)) == len(ids)
+    assert futures[-2].result().verified
+    assert client.get(b"pipeline99").value == b"value"
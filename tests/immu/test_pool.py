@@ -0,0 +1,195 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from immudb.pool import ImmudbClientPool
+from immudb.rootService import ConcurrentRootService
+import grpc
+import pytest
+
+
+class Unavailable(grpc.RpcError, grpc.Call):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+class FakeClient(object):
+    def __init__(self, name):
+        self.name = name
+        self.up = True
+        self.calls = 0
+        self.gate = None
+
+    def login(self, username, password, database=b"defaultdb"):
+        if not self.up:
+            raise Unavailable()
+        return self.name
+
+    def healthCheck(self):
+        if not self.up:
+            raise Unavailable()
+        return True
+
+    def get(self, key):
+        if not self.up:
+            raise Unavailable()
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait()
+        return self.name
+
+    def scan(self, count, failAt=None):
+        for i in range(count):
+            if i == failAt:
+                self.up = False
+                raise Unavailable()
+            yield (self.name, i)
+
+    def openSession(self, username, password, database=b"defaultdb"):
+        self.session = True
+        return self.name
+
+    def keepAlive(self):
+        self.calls += 1
+
+    def closeSession(self):
+        self.session = False
+
+    def shutdown(self):
+        pass
+
+
+def makePool(size, **kwargs):
+    pool = ImmudbClientPool("localhost:1", size=size, **kwargs)
+    for i, member in enumerate(pool._members):
+        member.client = FakeClient(i)
+    return pool
+
+
+def test_round_robin():
+    pool = makePool(3)
+    assert pool.login("immudb", "immudb") == 0
+    assert [pool.get(b"key") for i in range(6)] == [0, 1, 2, 0, 1, 2]
+
+
+def test_least_in_flight():
+    pool = makePool(3, policy="least-in-flight")
+    pool.login("immudb", "immudb")
+    gate = threading.Event()
+    pool.members[0].gate = gate
+    pool.members[1].gate = gate
+    with ThreadPoolExecutor(2) as executor:
+        busy = [executor.submit(pool.get, b"key") for i in range(2)]
+        while pool.members[0].calls + pool.members[1].calls < 2:
+            pass
+        # two calls are in flight on members 0 and 1
+        assert pool.get(b"key") == 2
+        gate.set()
+        assert sorted(f.result() for f in busy) == [0, 1]
+
+
+def test_eviction():
+    pool = makePool(2)
+    pool.login("immudb", "immudb")
+    pool.members[1].up = False
+    results = []
+    for i in range(4):
+        try:
+            results.append(pool.get(b"key"))
+        except grpc.RpcError:
+            pass
+    assert results == [0, 0, 0]
+    assert pool.healthyMembers() == [pool.members[0]]
+    assert pool.checkHealth() == 1
+    pool.members[1].up = True
+    assert pool.checkHealth() == 2
+    assert sorted(pool.get(b"key") for i in range(2)) == [0, 1]
+
+    pool.members[0].up = False
+    assert pool.login("immudb", "immudb") == 1
+    assert pool.healthyMembers() == [pool.members[1]]
+    pool.shutdown()
+
+
+def test_generators_stay_in_flight():
+    pool = makePool(2, policy="least-in-flight")
+    pool.login("immudb", "immudb")
+    scan = pool.scan(3)
+    assert next(scan) == (0, 0)
+    assert [m.inFlight for m in pool._members] == [1, 0]
+    assert pool.get(b"key") == 1
+    assert list(scan) == [(0, 1), (0, 2)]
+    assert [m.inFlight for m in pool._members] == [0, 0]
+
+    # closed before the end
+    scan = pool.scan(3)
+    next(scan)
+    scan.close()
+    assert [m.inFlight for m in pool._members] == [0, 0]
+
+    # failures while iterating evict the member
+    scan = pool.scan(3, failAt=1)
+    next(scan)
+    with pytest.raises(grpc.RpcError):
+        next(scan)
+    assert [m.inFlight for m in pool._members] == [0, 0]
+    assert pool.healthyMembers() == [pool.members[1]]
+
+
+def test_session_on_one_member():
+    pool = makePool(3)
+    assert pool.openSession("immudb", "immudb") == 0
+    assert [getattr(c, "session", False) for c in pool.members] == [
+        True, False, False]
+    pool.keepAlive()
+    assert [c.calls for c in pool.members] == [1, 0, 0]
+    # calls go to the member holding the session
+    assert pool.get(b"key") == 0
+    pool.closeSession()
+    assert pool.members[0].session is False
+    assert pool.healthyMembers() == []
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        ImmudbClientPool("localhost:1", policy="random")
+
+
+def test_root_service_per_url():
+    pool = ImmudbClientPool(["localhost:1", "localhost:2"], size=4)
+    rs = [m.client._rs for m in pool._members]
+    assert rs[0] is rs[2] and rs[1] is rs[3]
+    assert rs[0] is not rs[1]
+    shared = ConcurrentRootService()
+    pool = ImmudbClientPool("localhost:1", size=2, rs=shared)
+    assert all(m.client._rs is shared for m in pool._members)
+    with pytest.raises(ValueError):
+        ImmudbClientPool(["localhost:1", "localhost:2"], rs=shared)
+
+
+def test_pool(argsToBuildClient):
+    url, login, password = argsToBuildClient
+    pool = ImmudbClientPool(url, size=3, healthCheckInterval=1)
+    try:
+        pool.login(login, password)
+    except grpc.RpcError:
+        pytest.skip("Cannot reach immudb server")
+    keys = [b"pool_key_%d" % i for i in range(12)]
+    with ThreadPoolExecutor(6) as executor:
+        list(executor.map(lambda key: pool.verifiedSet(key, key), keys))
+        results = list(executor.map(pool.verifiedGet, keys))
+    assert [r.value for r in results] == keys
+    assert pool.checkHealth() == 3
+    assert pool.currentState().txId >= max(r.id for r in results)
+    pool.logout()
+    pool.shutdown()
@@ -0,0 +1,106 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from immudb import ImmudbClient
+from immudb.grpc import schema_pb2
+from immudb.prepared import PreparedStatement
+import datetime
+import decimal
+from immudb.typeconv import py_to_sqlvalue, set_sqlvalue, sqlvalue_to_py
+
+
+class Recorder(object):
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return schema_pb2.SQLExecResult()
+
+
+def params(request):
+    return {p.name: sqlvalue_to_py(p.value) for p in request.params}
+
+
+def test_set_sqlvalue():
+    for value in [None, 1, True, "a", b"b", 1.5, decimal.Decimal("2.5"),
+                  datetime.datetime(2022, 5, 6, 1, 2, 3, 123456, tzinfo=datetime.timezone.utc)]:
+        sqlValue = schema_pb2.SQLValue()
+        set_sqlvalue(sqlValue, value)
+        assert sqlValue == py_to_sqlvalue(value)
+    sqlValue = schema_pb2.SQLValue()
+    set_sqlvalue(sqlValue, bytearray(b"c"))
+    assert sqlValue.bs == b"c"
+    with pytest.raises(TypeError):
+        set_sqlvalue(schema_pb2.SQLValue(), object())
+
+
+def test_prepare_params():
+    stmt = PreparedStatement(
+        "INSERT INTO t (id, name, note) VALUES (@id, @name, '@skipped''s'); ", None, None, b"defaultdb")
+    assert stmt.params == ["id", "name"]
+    assert stmt.sql.endswith("'@skipped''s')")
+
+
+def test_execute():
+    recorder = Recorder()
+    stmt = PreparedStatement(
+        "UPSERT INTO t (id, name) VALUES (@id, @name)", recorder, None, b"defaultdb")
+    stmt.execute({"id": 1, "name": "a"})
+    stmt.execute((2, None), noWait=True)
+    assert recorder.requests[0].sql == stmt.sql
+    assert params(recorder.requests[0]) == {"id": 1, "name": "a"}
+    assert params(recorder.requests[1]) == {"id": 2, "name": None}
+    assert recorder.requests[1].noWait
+    with pytest.raises(ValueError):
+        stmt.execute({"id": 1})
+    with pytest.raises(ValueError):
+        stmt.execute((1,))
+
+
+def test_executemany():
+    recorder = Recorder()
+    stmt = PreparedStatement(
+        "UPSERT INTO t (id, name) VALUES (@id, @name)", recorder, None, b"defaultdb", batchSize=2)
+    results = stmt.executemany([(i, str(i)) for i in range(5)])
+    assert len(results) == 3
+    assert [len(r.params) for r in recorder.requests] == [4, 4, 2]
+    first = recorder.requests[0]
+    assert first.sql == ("BEGIN TRANSACTION;\n"
+                         "UPSERT INTO t (id, name) VALUES (@p0_id, @p0_name);\n"
+                         "UPSERT INTO t (id, name) VALUES (@p1_id, @p1_name);\n"
+                         "COMMIT;")
+    assert params(first) == {"p0_id": 0, "p0_name": "0",
+                             "p1_id": 1, "p1_name": "1"}
+    assert params(recorder.requests[2]) == {"p0_id": 4, "p0_name": "4"}
+
+
+def test_executemany_in_transaction():
+    recorder = Recorder()
+    stmt = PreparedStatement("DELETE FROM t WHERE id = @id", recorder, None,
+                             b"defaultdb", inTransaction=True)
+    stmt.executemany([{"id": 1}, {"id": 2}])
+    assert recorder.requests[0].sql == ("DELETE FROM t WHERE id = @p0_id;\n"
+                                        "DELETE FROM t WHERE id = @p1_id")
+
+
+def test_prepared_statement(client: ImmudbClient):
+    client.sqlExec(
+        "CREATE TABLE IF NOT EXISTS prepared (id INTEGER, name VARCHAR, PRIMARY KEY id)")
+    upsert = client.prepare(
+        "UPSERT INTO prepared (id, name) VALUES (@id, @name)", batchSize=50)
+    upsert.executemany([(i, "name{}".format(i)) for i in range(120)])
+    select = client.prepare("SELECT id, name FROM prepared WHERE id = @id")
+    assert select.query({"id": 42}) == [(42, "name42")]
+    count = client.sqlQuery("SELECT COUNT(*) FROM prepared")
+    assert count[0][0] >= 120
@@ -0,0 +1,122 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from immudb import ImmudbClient
+from immudb.grpc import schema_pb2
+from immudb.handler import sqlquery
+
+
+def row(*values):
+    return schema_pb2.Row(values=[
+        schema_pb2.SQLValue(null=0) if v is None else schema_pb2.SQLValue(**{k: v}) for k, v in values])
+
+
+def column(name, sqlType):
+    return schema_pb2.Column(name="(defaultdb.t.{})".format(name), type=sqlType)
+
+
+class FakeSQLService(object):
+    def __init__(self, batches):
+        self.batches = batches
+
+    def SQLQuery(self, request):
+        return iter(self.batches)
+
+
+def fakeResult():
+    columns = [column("id", "INTEGER"), column("name", "VARCHAR"),
+               column("amount", "FLOAT"), column("ok", "BOOLEAN"),
+               column("ts", "TIMESTAMP"), column("data", "BLOB"),
+               column("extra", "ANY")]
+    return FakeSQLService([
+        schema_pb2.SQLQueryResult(columns=columns, rows=[
+            row(("n", 1), ("s", "a"), ("f", 1.5), ("b", True),
+                ("ts", 1000), ("bs", b"x"), (None, None)),
+            row(("n", 2), (None, None), ("f", 2.5), ("b", False),
+                (None, None), ("bs", b"y"), (None, None)),
+        ]),
+        schema_pb2.SQLQueryResult(columns=columns, rows=[
+            row(("n", 3), ("s", "c"), (None, None), ("b", True),
+                ("ts", 3000), (None, None), ("n", 7)),
+        ]),
+    ])
+
+
+def test_columnar_decode():
+    result = sqlquery.callColumnar(fakeResult(), None, "SELECT", {},
+                                   0, b"defaultdb")
+    assert len(result) == 3
+    assert result.columns == ["id", "name", "amount",
+                              "ok", "ts", "data", "extra"]
+    assert list(result.values("id")) == [1, 2, 3]
+    assert result.values("id").typecode == "q"
+    assert result.values("name") == ["a", "", "c"]
+    assert list(result.validity("name")) == [1, 0, 1]
+    assert list(result.values("amount")) == [1.5, 2.5, 0.0]
+    assert result.nullCount("amount") == 1
+    assert list(result.values("ok")) == [1, 0, 1]
+    assert list(result.values("ts")) == [1000, 0, 3000]
+    assert result.values("data") == [b"x", b"y", b""]
+    # untyped column takes the type of its first non null value
+    assert list(result.values("extra")) == [0, 0, 7]
+    assert list(result.validity("extra")) == [0, 0, 1]
+
+
+def test_columnar_empty():
+    service = FakeSQLService([schema_pb2.SQLQueryResult(
+        columns=[column("id", "INTEGER")])])
+    result = sqlquery.callColumnar(service, None, "SELECT", {},
+                                   0, b"defaultdb")
+    assert len(result) == 0
+    assert list(result.values("id")) == []
+
+
+def test_columnar_mixed_types():
+    service = FakeSQLService([schema_pb2.SQLQueryResult(
+        columns=[column("id", "INTEGER")], rows=[row(("s", "a"))])])
+    with pytest.raises(TypeError):
+        sqlquery.callColumnar(service, None, "SELECT", {}, 0, b"defaultdb")
+
+
+def test_columnar_numpy():
+    np = pytest.importorskip("numpy")
+    result = sqlquery.callColumnar(fakeResult(), None, "SELECT", {},
+                                   0, b"defaultdb")
+    arrays = result.toNumpy()
+    assert arrays["id"].dtype == np.int64
+    assert list(arrays["id"]) == [1, 2, 3]
+    assert arrays["ts"].dtype == np.dtype("datetime64[us]")
+    assert list(arrays["amount"].mask) == [False, False, True]
+
+
+def test_columnar_arrow():
+    pa = pytest.importorskip("pyarrow")
+    result = sqlquery.callColumnar(fakeResult(), None, "SELECT", {},
+                                   0, b"defaultdb")
+    table = result.toArrow()
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.column("name").to_pylist() == ["a", None, "c"]
+    assert table.column("ok").type == pa.bool_()
+    assert table.column("data").to_pylist() == [b"x", b"y", None]
+
+
+def test_sql_query_columnar(client: ImmudbClient):
+    client.sqlExec(
+        "CREATE TABLE IF NOT EXISTS columnar (id INTEGER, name VARCHAR, amount FLOAT, PRIMARY KEY id)")
+    client.sqlExec("UPSERT INTO columnar (id, name, amount) VALUES (1, 'a', 1.5), (2, NULL, 2.5)")
+    result = client.sqlQueryColumnar(
+        "SELECT id, name, amount FROM columnar ORDER BY id")
+    assert result.columns == ["id", "name", "amount"]
+    assert list(result.values("id")) == [1, 2]
+    assert list(result.validity("name")) == [1, 0]
+    assert list(result.values("amount")) == [1.5, 2.5]
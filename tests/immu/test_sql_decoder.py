@@ -0,0 +1,150 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+import threading
+
+import pytest
+from immudb import ImmudbClient, constants
+from immudb.grpc import schema_pb2
+from immudb.handler import sqlquery
+from immudb.typeconv import py_to_sqlvalue, sqlvalue_decoder, sqlvalue_to_py
+from tests.immu.test_sql_columnar import FakeSQLService, column, row
+
+
+def test_decoder_matches_sqlvalue_to_py():
+    values = [None, 1, True, False, "a", b"b", 1.5,
+              datetime(2022, 5, 6, 1, 2, 3, 123456, tzinfo=timezone.utc)]
+    for sqlType in ["INTEGER", "BOOLEAN", "VARCHAR", "BLOB", "FLOAT", "TIMESTAMP", "ANY"]:
+        decode = sqlvalue_decoder(sqlType)
+        for value in values:
+            sqlValue = py_to_sqlvalue(value)
+            assert decode(sqlValue) == sqlvalue_to_py(sqlValue)
+    with pytest.raises(TypeError):
+        sqlvalue_to_py(schema_pb2.SQLValue())
+
+
+def fakeQuery():
+    columns = [column("id", "INTEGER"), column("name", "VARCHAR"),
+               column("ts", "TIMESTAMP")]
+    return FakeSQLService([
+        schema_pb2.SQLQueryResult(columns=columns, rows=[
+            row(("n", 1), ("s", "a"), ("ts", 1000000)),
+            row(("n", 2), (None, None), (None, None)),
+        ]),
+        schema_pb2.SQLQueryResult(columns=columns, rows=[
+            row(("n", 3), ("s", "c"), ("ts", 0)),
+        ]),
+        schema_pb2.SQLQueryResult(columns=columns),
+    ])
+
+
+def test_row_iterator_tuples():
+    it = sqlquery.call(fakeQuery(), None, "SELECT", {},
+                       constants.COLUMN_NAME_MODE_NONE, b"defaultdb")
+    assert it.columns() == ["id", "name", "ts"]
+    assert list(it) == [
+        (1, "a", datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc)),
+        (2, None, None),
+        (3, "c", datetime(1970, 1, 1, tzinfo=timezone.utc)),
+    ]
+
+
+def test_row_iterator_dicts():
+    it = sqlquery.call(fakeQuery(), None, "SELECT", {},
+                       constants.COLUMN_NAME_MODE_TABLE, b"defaultdb")
+    rows = list(it)
+    assert rows[1] == {"t.id": 2, "t.name": None, "t.ts": None}
+    assert len(rows) == 3
+
+
+def test_row_decoder_shared():
+    res = fakeQuery().batches[0]
+    decoder = sqlquery.rowDecoder(
+        res, constants.COLUMN_NAME_MODE_FIELD, b"defaultdb")
+    assert decoder is sqlquery.rowDecoder(
+        res, constants.COLUMN_NAME_MODE_FIELD, b"defaultdb")
+    assert decoder is not sqlquery.rowDecoder(
+        res, constants.COLUMN_NAME_MODE_NONE, b"defaultdb")
+
+
+def test_row_decoder_without_columns():
+    res = schema_pb2.SQLQueryResult(rows=[row(("n", 1), ("s", "a"))])
+    decoder = sqlquery.rowDecoder(
+        res, constants.COLUMN_NAME_MODE_NONE, b"defaultdb")
+    assert decoder.decode(res.rows) == [(1, "a")]
+
+
+class FakeStream(object):
+    """Result stream blocking after the first batches until cancelled"""
+
+    def __init__(self, batches, block=False):
+        self.batches = batches
+        self.block = block
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        for batch in self.batches:
+            yield batch
+        if self.block:
+            self.cancelled.wait()
+            raise RuntimeError("cancelled")
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def test_prefetching_row_iterator():
+    stream = FakeStream(fakeQuery().batches)
+    it = sqlquery.PrefetchingRowIterator(
+        stream, constants.COLUMN_NAME_MODE_FIELD, b"defaultdb", 1)
+    assert it.columns() == ["id", "name", "ts"]
+    assert [row["id"] for row in it] == [1, 2, 3]
+    with pytest.raises(StopIteration):
+        next(it)
+
+
+def test_prefetching_row_iterator_close():
+    batches = [schema_pb2.SQLQueryResult(columns=[column("id", "INTEGER")],
+                                         rows=[row(("n", i))]) for i in range(10)]
+    stream = FakeStream(batches, block=True)
+    it = sqlquery.PrefetchingRowIterator(
+        stream, constants.COLUMN_NAME_MODE_NONE, b"defaultdb", 2)
+    assert next(it) == (0,)
+    it.close()
+    assert stream.cancelled.is_set()
+    assert not it._reader.is_alive()
+    with pytest.raises(sqlquery.ClosedIterator):
+        next(it)
+
+
+def test_prefetching_row_iterator_error():
+    stream = FakeStream(fakeQuery().batches[:1], block=True)
+    it = sqlquery.PrefetchingRowIterator(
+        stream, constants.COLUMN_NAME_MODE_NONE, b"defaultdb", 4)
+    assert next(it)[0] == 1
+    assert next(it)[0] == 2
+    stream.cancel()
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_sql_query_prefetch(client: ImmudbClient):
+    client.sqlExec(
+        "CREATE TABLE IF NOT EXISTS prefetch (id INTEGER, PRIMARY KEY id)")
+    client.sqlExec("UPSERT INTO prefetch (id) VALUES (1), (2), (3)")
+    rows = client.sqlQuery("SELECT id FROM prefetch ORDER BY id", prefetch=2)
+    assert rows == [(1,), (2,), (3,)]
+    it = client.sqlQuery("SELECT id FROM prefetch ORDER BY id",
+                         acceptStream=True, prefetch=2)
+    assert next(it) == (1,)
+    it.close()
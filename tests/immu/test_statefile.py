@@ -11,10 +11,13 @@
 # limitations under the License.
 
 import pytest
-from immudb.client import ImmudbClient, PersistentRootService
+from immudb.client import ImmudbClient, PersistentRootService, AppendOnlyRootService
+from immudb.rootService import State
+from immudb.grpc import schema_pb2
 from random import randint
 import grpc._channel
 import warnings
+import os
 
 
 def test_rs(rootfile):
@@ -86,3 +89,64 @@ def test_get_tx(client_rs):
         value = "test_value_{:04d}".format(randint(0, 10000)).encode('ascii')
         client_rs.verifiedSet(key, value)
     assert key0 in client_rs.verifiedTxById(id0)
+
+
+class FakeStateService(object):
+    def CurrentState(self, request):
+        return schema_pb2.ImmutableState(db="defaultdb", txId=1, txHash=b"1")
+
+
+def makeState(txId):
+    return State(db="defaultdb", txId=txId, txHash=b"h%d" % txId,
+                 publicKey=b"", signature=b"")
+
+
+def test_append_only_rs(rootfile):
+    os.unlink(rootfile)
+    rs = AppendOnlyRootService(rootfile, syncEvery=4, compactAfter=10)
+    rs.init("db1", FakeStateService())
+    assert rs.get().txId == 1
+    for i in range(2, 25):
+        rs.set(makeState(i))
+    rs.close()
+    # compacted twice, 4 records left
+    assert os.path.getsize(rootfile) < 5 * 64
+
+    other = AppendOnlyRootService(rootfile)
+    other.init("db1", FakeStateService())
+    assert other.get() == makeState(24)
+    other.init("db2", FakeStateService())
+    assert other.get().txId == 1
+    other.set(makeState(3))
+    other.close()
+
+    # a torn record is dropped and further appends stay readable
+    size = os.path.getsize(rootfile)
+    with open(rootfile, "ab") as f:
+        f.write(b"\x00\x00\x00\x40garbage")
+    rs.init("db2", FakeStateService())
+    assert rs.get() == makeState(3)
+    assert os.path.getsize(rootfile) == size
+    rs.set(makeState(5))
+    rs.close()
+    rs = AppendOnlyRootService(rootfile)
+    rs.init("db2", FakeStateService())
+    assert rs.get() == makeState(5)
+    rs.close()
+
+
+def test_append_only_rs_shared(rootfile):
+    rs1 = AppendOnlyRootService(rootfile, syncEvery=0, compactAfter=7)
+    rs2 = AppendOnlyRootService(rootfile, syncEvery=0, compactAfter=5)
+    rs1.init("db", FakeStateService())
+    rs2.init("db", FakeStateService())
+    for i in range(2, 40):
+        (rs1 if i % 2 else rs2).set(makeState(i))
+    # an older state written later does not win
+    rs1.set(makeState(30))
+    rs1.close()
+    rs2.close()
+    rs = AppendOnlyRootService(rootfile)
+    rs.init("db", FakeStateService())
+    assert rs.get().txId == 39
+    rs.close()
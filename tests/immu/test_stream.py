@@ -5,10 +5,13 @@ from grpc import RpcError
 from immudb import ImmudbClient, datatypes, datatypesv2
 import pytest
 from immudb.grpc.schema_pb2 import Chunk
-from immudb.streamsutils import KeyHeader, ValueChunkHeader
+from immudb.streamsutils import KeyHeader, ValueChunkHeader, ValueChunk, BufferedStreamReader, makeSetStream, mapFile
 import random
 import string
 import tempfile
+import shutil
+import os
+import io
 
 def test_stream_get_raw(client: ImmudbClient):
     key = ('a' * 512).encode('utf-8')
@@ -702,4 +705,130 @@ def test_stream_exec_all_zadd(client: ImmudbClient):
     assert len(k3) == 1
     assert k3[0].score == 3.0
     assert k3[0].value == val
-    assert k3[0].key == keyToSet
\ No newline at end of file
+    assert k3[0].key == keyToSet
+
+class FakeCall(object):
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+def fake_value_reader(value: bytes, chunkSize: int, trailing=()):
+    chunks = [value[i:i + chunkSize] for i in range(0, len(value), chunkSize)] or [b'']
+    left = len(value) - len(chunks[0])
+    header = ValueChunk(chunk=chunks[0], left=left)
+    rest = []
+    for chunk in chunks[1:]:
+        left -= len(chunk)
+        rest.append(ValueChunk(chunk=chunk, left=left))
+    generator = iter(rest + list(trailing))
+    return BufferedStreamReader(generator, header, FakeCall()), generator
+
+
+def test_buffered_reader_offline():
+    value = bytes(range(256)) * 1000
+    for chunkSize in (1, 7, 4096, len(value)):
+        for readSize in (1, 100, 4096, 10**9):
+            reader, _ = fake_value_reader(value, chunkSize)
+            parts = []
+            readed = reader.read(readSize)
+            while readed:
+                parts.append(readed)
+                readed = reader.read(readSize)
+            assert b''.join(parts) == value
+            assert reader.read() == b''
+
+    reader, _ = fake_value_reader(value, 4096)
+    buf = bytearray(5000)
+    assert reader.readinto(buf) == 5000
+    assert buf == value[:5000]
+    assert reader.readinto(memoryview(buf)[:10]) == 10
+    assert buf[:10] == value[5000:5010]
+    assert reader.read() == value[5010:]
+    assert reader.readinto(buf) == 0
+
+    # a whole chunk is returned without copying
+    reader, _ = fake_value_reader(value, 4096)
+    first = reader.read(4096)
+    assert first == value[:4096] and type(first) == bytes
+
+    reader, _ = fake_value_reader(b'', 10)
+    assert reader.read() == b''
+
+
+def test_buffered_reader_file_semantics():
+    value = b'0123456789' * 100000
+    # the reader stops at the end of its value on a shared chunk generator
+    trailing = ValueChunk(chunk=b'next value', left=0)
+    reader, generator = fake_value_reader(value, 65536, [trailing])
+    assert reader.readable() and not reader.seekable()
+    out = BytesIO()
+    shutil.copyfileobj(reader, out)
+    assert out.getvalue() == value
+    assert next(generator) == trailing
+
+    reader, _ = fake_value_reader(value, 65536)
+    with io.BufferedReader(reader) as buffered:
+        assert buffered.read(3) == b'012'
+        assert buffered.readline() == value[3:]
+    assert reader.closed
+    assert reader.stream.cancelled
+    with pytest.raises(ValueError):
+        reader.read()
+
+
+def test_set_stream_from_mapped_file(tmp_path):
+    value = bytes(range(256)) * 1000
+    path = tmp_path / "value"
+    path.write_bytes(value)
+    with open(path, "rb") as f, mapFile(f) as buffer:
+        chunks = list(makeSetStream(buffer, b'key', len(value), 4096))
+    assert chunks[0].content == KeyHeader(key=b'key', length=3).getInBytes()
+    assert chunks[1].content == ValueChunkHeader(
+        chunk=value[:4096], length=len(value)).getInBytes()
+    assert b''.join(c.content for c in chunks[2:]) == value[4096:]
+
+    # reads are views of the mapping, released by the next read or close
+    with open(path, "rb") as f, mapFile(f) as buffer:
+        first = buffer.read(10)
+        assert type(first) is memoryview and first == value[:10]
+        assert buffer.read(5) == value[10:15]
+        with pytest.raises(ValueError):
+            bytes(first)
+        last = buffer.read()
+        assert len(last) == len(value) - 15
+    with pytest.raises(ValueError):
+        bytes(last)
+
+    path.write_bytes(b'')
+    with open(path, "rb") as f, mapFile(f) as buffer:
+        chunks = list(makeSetStream(buffer, b'key', 0, 4096))
+    assert chunks[1].content == ValueChunkHeader(chunk=b'', length=0).getInBytes()
+    assert len(chunks) == 2
+
+
+def test_stream_file(client: ImmudbClient, tmp_path):
+    key = str(uuid.uuid4()).encode("utf-8")
+    value = os.urandom(3 * 1024 * 1024 + 17)
+    source = tmp_path / "source"
+    source.write_bytes(value)
+    resp = client.streamSetFromFile(key, str(source))
+    assert resp.id > 0
+
+    destination = tmp_path / "destination"
+    assert client.streamGetToFile(key, str(destination)) == key
+    assert destination.read_bytes() == value
+
+    resp = client.streamVerifiedSetFromFile(key, str(source), chunkSize=1000)
+    assert resp.verified
+    client.setReference(key, key + b'ref')
+    assert client.streamGetToFile(key + b'ref', str(destination)) == key
+    assert destination.read_bytes() == value
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b'')
+    client.streamSetFromFile(key, str(empty))
+    assert client.streamGetToFile(key, str(destination)) == key
+    assert destination.read_bytes() == b''
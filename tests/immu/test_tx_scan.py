@@ -35,4 +35,16 @@ def test_tx_scan(wrappedClient: ImmuTestClient):
     ))
     assert result.txs[0].kvEntries == None
     assert result.txs[0].zEntries == None
-    assert result.txs[0].entries == None
\ No newline at end of file
+    assert result.txs[0].entries == None
+
+def test_verified_tx_stream(wrappedClient: ImmuTestClient):
+    client = wrappedClient.client
+    if(not wrappedClient.serverHigherOrEqualsToVersion("1.2.0")):
+        pytest.skip("Immudb version too low")
+    first = client.set(b"stream1", b"y").id
+    client.set(b"stream2", b"y")
+    last = client.set(b"stream3", b"y").id
+    txs = list(client.verifiedTxStream(first, batchSize=2))
+    assert [tx.header.iD for tx in txs] == list(range(first, last + 1))
+    assert txs[-1].entries[0].key()[1:] == b"stream3"
+    assert client.currentState().txId >= last
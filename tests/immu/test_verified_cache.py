@@ -0,0 +1,124 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import os
+import pytest
+from immudb.exceptions import ErrCorruptedData
+from immudb.embedded import store
+from immudb.grpc import schema_pb2
+from immudb.handler import verifiedtxbyid
+from immudb.rootService import RootService
+from immudb.verifiedcache import TrustedTxIndex, VerifiedTxCache, verifyDualProof
+import immudb.schema as schema
+from tests.immu.test_offline import s2, v2
+
+
+def load():
+    state = schema_pb2.ImmutableState()
+    state.ParseFromString(base64.b64decode(s2))
+    vtx = schema_pb2.VerifiableTx()
+    vtx.ParseFromString(base64.b64decode(v2))
+    dualProof = schema.DualProofFromProto(vtx.dualProof)
+    return state, vtx, dualProof
+
+
+def test_lru():
+    cache = VerifiedTxCache(2)
+    cache.add("db", 1, b"a")
+    cache.add("db", 2, b"b")
+    assert cache.isVerified("db", 1, b"a")
+    cache.add("db", 3, b"c")
+    assert len(cache) == 2
+    assert not cache.isVerified("db", 2, b"b")
+    assert cache.isVerified("db", 1, b"a")
+    assert not cache.isVerified("db", 1, b"x")
+    assert not cache.isVerified("otherdb", 1, b"a")
+    cache.clear()
+    assert len(cache) == 0
+    disabled = VerifiedTxCache(0)
+    disabled.add("db", 1, b"a")
+    assert not disabled.isVerified("db", 1, b"a")
+
+
+def test_skip_verified_proof():
+    state, vtx, dualProof = load()
+    sourcealh = schema.DigestFromProto(state.txHash)
+    targetalh = dualProof.targetTxHeader.Alh()
+    cache = VerifiedTxCache()
+    assert verifyDualProof(cache, state, dualProof,
+                           state.txId, 4, sourcealh, targetalh)
+    assert cache.isVerified(state.db, 4, targetalh)
+
+    # both ends are trusted now: a broken proof is not even looked at
+    dualProof.linearProof.terms = []
+    assert verifyDualProof(cache, state, dualProof,
+                           state.txId, 4, sourcealh, targetalh)
+    assert not store.VerifyDualProof(
+        dualProof, state.txId, 4, sourcealh, targetalh)
+    assert not verifyDualProof(VerifiedTxCache(), state, dualProof,
+                               state.txId, 4, sourcealh, targetalh)
+    # a different Alh for a known transaction is not trusted
+    assert not verifyDualProof(cache, state, dualProof,
+                               state.txId, 4, sourcealh, b"\x00" * 32)
+
+
+def test_handler_uses_cache():
+    state, vtx, dualProof = load()
+    cache = VerifiedTxCache()
+    rs = RootService()
+    rs.set(state)
+    verifiedtxbyid.verify(vtx, state, None, rs, cache)
+    assert rs.get().txId == 4
+    assert len(cache) == 2
+
+    tampered = schema_pb2.VerifiableTx()
+    tampered.CopyFrom(vtx)
+    del tampered.dualProof.linearProof.terms[:]
+    verifiedtxbyid.verify(tampered, state, None, rs, cache)
+    cache.clear()
+    with pytest.raises(ErrCorruptedData):
+        verifiedtxbyid.verify(tampered, state, None, rs, cache)
+
+
+def test_trusted_index_survives_restart(tmp_path):
+    state, vtx, dualProof = load()
+    sourcealh = schema.DigestFromProto(state.txHash)
+    targetalh = dualProof.targetTxHeader.Alh()
+    filename = str(tmp_path / "trustedtxs")
+    index = TrustedTxIndex(filename)
+    assert verifyDualProof(index, state, dualProof,
+                           state.txId, 4, sourcealh, targetalh)
+    assert index.header(state.db, 4) == (
+        targetalh, dualProof.targetTxHeader.blTxID, dualProof.targetTxHeader.blRoot)
+    index.close()
+
+    # a torn record at the end of the file is dropped
+    with open(filename, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    index = TrustedTxIndex(filename)
+    assert len(index) == 2
+    assert index.isVerified(state.db, 4, targetalh)
+    assert not index.isVerified("otherdb", 4, targetalh)
+    dualProof.linearProof.terms = []
+    assert verifyDualProof(index, state, dualProof,
+                           state.txId, 4, sourcealh, targetalh)
+    index.add(state.db, 4, targetalh, dualProof.targetTxHeader.blTxID,
+              dualProof.targetTxHeader.blRoot)
+    index.close()
+    assert os.path.getsize(filename) % 96 == 0
+    assert os.path.getsize(filename) == 2 * 96
+    index = TrustedTxIndex(filename)
+    index.clear()
+    assert len(index) == 0
+    index.close()
+    assert len(TrustedTxIndex(filename)) == 0
@@ -73,3 +73,26 @@ class TestVerifiedGetSet:
             threading.Thread(target=setAfter, args=(wrappedClient.client, 1.5, key2, value2)).start()
             readback6 = wrappedClient.client.verifiedGetSince(key1.encode('utf8'), sinceTx = tx2id + 1)
             assert readback6.value.decode("utf-8") == value1
+
+    def test_verified_get_all(self, wrappedClient: ImmuTestClient):
+        client = wrappedClient.client
+        keys = [wrappedClient.generateKeyName().encode("utf-8")
+                for i in range(6)]
+        client.setAll({key: b"batch_" + key for key in keys[:3]})
+        for key in keys[3:]:
+            client.verifiedSet(key, b"single_" + key)
+        client.setReference(keys[0], b"ref_" + keys[0])
+        before = client.currentState().txId
+
+        resp = client.verifiedGetAll(keys + [b"ref_" + keys[0]])
+        assert len(resp) == 7
+        for key in keys[:3]:
+            assert resp[key].value == b"batch_" + key
+            assert resp[key].verified
+        for key in keys[3:]:
+            assert resp[key].value == b"single_" + key
+        assert resp[keys[0]].id == resp[keys[1]].id
+        assert resp[b"ref_" + keys[0]].refkey == b"ref_" + keys[0]
+        assert resp[b"ref_" + keys[0]].value == b"batch_" + keys[0]
+        assert client._rs.get().txId >= before
+        assert client.verifiedGetAll([]) == {}
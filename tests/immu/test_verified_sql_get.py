@@ -0,0 +1,170 @@
+# Copyright 2024 CodeNotary, Inc. All rights reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#       http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future
+
+import pytest
+from immudb import ImmudbClient, datatypesv2
+from immudb.embedded import store
+from immudb.embedded import hashing
+from immudb.exceptions import ErrCorruptedData, ErrInvalidValue, ErrMaxLengthExceeded
+from immudb.grpc import schema_pb2
+from immudb.handler import verifiedSQLGet
+from immudb.rootService import State
+
+
+class FakeRootService(object):
+    def __init__(self):
+        self.state = State(db=b"defaultdb", txId=0, txHash=b"",
+                           publicKey=b"", signature=b"")
+
+    def get(self):
+        return self.state
+
+    def set(self, state):
+        self.state = state
+
+
+class FakeVerifiableSQLGet(object):
+    """Every row stored alone in its own transaction, proven against an
+    empty state"""
+
+    def __init__(self, rows, tamper=None):
+        self.rows = rows
+        self.tamper = tamper
+        self.calls = 0
+        self.names = {1: "id", 2: "name"}
+
+    def _entry(self, request):
+        self.calls += 1
+        pk = request.sqlGetRequest.pkValues[0].n
+        tx, value = self.rows[pk]
+        if pk == self.tamper:
+            value = value + b"!"
+        pkKey = store.sqlMapKey(b'\x02', 'R.', [
+            store.encodeID(1), store.encodeID(2), store.encodeID(0),
+            store.encodeAsKey(pk, datatypesv2.PrimaryKeyIntValue(pk), 8)])
+        digest = store.EntrySpecDigest_v1(store.EntrySpec(
+            key=pkKey, value=self.rows[pk][1], md=None))
+        _, _, eh = hashing.getBackend().evalTreeInclusion([], 0, 0, digest)
+        ventry = schema_pb2.VerifiableSQLEntry(
+            sqlEntry=schema_pb2.SQLEntry(tx=tx, key=pkKey, value=value),
+            inclusionProof=schema_pb2.InclusionProof(leaf=0, width=1),
+            DatabaseId=1, TableId=2, PKIDs=[1],
+            ColNamesById=self.names,
+            ColIdsByName={name: id for id, name in self.names.items()},
+            ColTypesById={1: "INTEGER", 2: "VARCHAR"}, ColLenById={1: 8, 2: 10})
+        ventry.verifiableTx.tx.header.version = 1
+        ventry.verifiableTx.dualProof.targetTxHeader.id = tx
+        ventry.verifiableTx.dualProof.targetTxHeader.version = 1
+        ventry.verifiableTx.dualProof.targetTxHeader.eH = eh
+        return ventry
+
+    def __call__(self, request):
+        return self._entry(request)
+
+    def future(self, request):
+        f = Future()
+        f.set_result(self._entry(request))
+        return f
+
+
+class FakeService(object):
+    def __init__(self, rows, tamper=None):
+        self.VerifiableSQLGet = FakeVerifiableSQLGet(rows, tamper)
+
+
+ROWS = {i: (10 + i, "row{}".format(i).encode()) for i in range(20)}
+
+
+def test_verified_sql_get_many():
+    rs = FakeRootService()
+    tables = dict()
+    service = FakeService(ROWS)
+    keys = [[datatypesv2.PrimaryKeyIntValue(i)] for i in range(20)]
+    entries = verifiedSQLGet.callMany(
+        service, rs, "t", keys, None, None, tables=tables, maxInFlight=4)
+    assert [e.sqlEntry.value for e in entries] == [ROWS[i][1]
+                                                   for i in range(20)]
+    assert all(e.verified for e in entries)
+    assert entries[0].ColNamesById == {1: "id", 2: "name"}
+    assert rs.state.txId == 29
+    assert list(tables.keys()) == [(b"defaultdb", "t")]
+    single = verifiedSQLGet.call(FakeService(ROWS), FakeRootService(), "t",
+                                 keys[3], None, None)
+    assert single.sqlEntry == entries[3].sqlEntry
+
+
+def test_verified_sql_get_many_renamed_column():
+    tables = dict()
+    service = FakeService(ROWS)
+    keys = [[datatypesv2.PrimaryKeyIntValue(i)] for i in range(3)]
+    entries = verifiedSQLGet.callMany(
+        service, FakeRootService(), "t", keys, None, None, tables=tables)
+    assert entries[0].ColNamesById == {1: "id", 2: "name"}
+    # ALTER TABLE t RENAME COLUMN name TO title
+    service.VerifiableSQLGet.names = {1: "id", 2: "title"}
+    entries = verifiedSQLGet.callMany(
+        service, FakeRootService(), "t", keys, None, None, tables=tables)
+    assert entries[0].ColNamesById == {1: "id", 2: "title"}
+    assert entries[0].ColIdsByName == {"id": 1, "title": 2}
+    assert tables[(b"defaultdb", "t")].ColNamesById == {1: "id", 2: "title"}
+
+
+def test_verified_sql_get_many_tampered():
+    rs = FakeRootService()
+    keys = [[datatypesv2.PrimaryKeyIntValue(i)] for i in range(20)]
+    with pytest.raises(ErrCorruptedData):
+        verifiedSQLGet.callMany(FakeService(ROWS, tamper=7),
+                                rs, "t", keys, None, None)
+    assert rs.state.txId == 0
+
+
+def test_verifiable_sql_get_many(client: ImmudbClient):
+    client.sqlExec(
+        "CREATE TABLE IF NOT EXISTS vgetmany (id INTEGER, name VARCHAR, PRIMARY KEY id)")
+    client.sqlExec(
+        "UPSERT INTO vgetmany (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+    keys = [[datatypesv2.PrimaryKeyIntValue(i)] for i in [1, 2, 3]]
+    entries = client.verifiableSQLGetMany("vgetmany", keys)
+    assert len(entries) == 3
+    assert all(e.verified for e in entries)
+    assert entries[0].sqlEntry.tx == entries[2].sqlEntry.tx
+
+
+def test_key_encoder():
+    types = ["INTEGER", "VARCHAR", "BOOLEAN", "BLOB", "TIMESTAMP"]
+    lens = [8, 10, 1, 5, 8]
+    encoder = store.KeyEncoder(1, 2, types, lens)
+    rows = [(0, "", False, b"", 1_700_000_000_123_456),
+            (12345, "abc", True, b"\x00\xff", 1_600_000_000_000_001),
+            (2**62, "0123456789", True, b"12345", 0)]
+    for values, key in zip(rows, encoder.encodeMany(rows)):
+        pks = [datatypesv2.PrimaryKeyIntValue(values[0]),
+               datatypesv2.PrimaryKeyVarCharValue(values[1]),
+               datatypesv2.PrimaryKeyBoolValue(values[2]),
+               datatypesv2.PrimaryKeyBlobValue(values[3]),
+               datatypesv2.PrimaryKeyTsValue(values[4])]
+        expected = store.sqlMapKey(b'\x02', 'R.', [
+            store.encodeID(1), store.encodeID(2), store.encodeID(0)] +
+            [store.encodeAsKey(pk.value, pk, n) for pk, n in zip(pks, lens)])
+        assert key == expected
+        # prefix of the primary key
+        assert encoder.encode(values[:2]) == expected[:len(encoder.head) + 9 + 15]
+    # negative integers are ordered before positive ones
+    assert encoder.encode([-1] + list(rows[0][1:])) < encoder.encode(rows[0])
+    with pytest.raises(ErrMaxLengthExceeded):
+        encoder.encode([1, "01234567890", True, b"", 0])
+    with pytest.raises(ErrCorruptedData):
+        store.KeyEncoder(1, 2, ["INTEGER"], [4])
+    with pytest.raises(ErrInvalidValue):
+        store.KeyEncoder(1, 2, ["FLOAT"], [8])